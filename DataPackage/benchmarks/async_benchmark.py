@@ -0,0 +1,78 @@
+# Library import
+import asyncio
+import multiprocessing
+import resource
+import threading
+import time
+from datapackage import AsyncDatapackage
+
+# Functions definition
+def raise_file_limit(connections: int) -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, connections + 256)), hard))
+
+async def echo_handler(dp: AsyncDatapackage) -> None:
+    async for packet in dp:
+        await dp.send_datapackage(packet)
+
+# Clients (separate process: each process holds one end of every connection)
+async def clients_routine(port: int, connections: int, messages: int, framing: str) -> dict:
+    start = time.perf_counter()
+    clients = []
+    for offset in range(0, connections, 1000): # Batches bounded by the listen backlog
+        clients += await asyncio.gather(*(
+            AsyncDatapackage.open_connection("127.0.0.1", port, framing=framing) for _ in range(offset, min(offset + 1000, connections))
+        ))
+    connect_time = time.perf_counter() - start
+
+    async def exchange(dp: AsyncDatapackage, index: int) -> int:
+        received = 0
+        for seq in range(messages):
+            await dp.send_datapackage({"client": index, "seq": seq})
+            received += (await dp.receive_datapackage(timeout=60)) is not None
+        return received
+
+    start = time.perf_counter()
+    received = sum(await asyncio.gather(*(exchange(dp, index) for index, dp in enumerate(clients))))
+    exchange_time = time.perf_counter() - start
+    await asyncio.gather(*(dp.stop() for dp in clients))
+    return {"connect_s": connect_time, "received": received, "round_trips_per_s": received / exchange_time}
+
+def clients_process(port: int, connections: int, messages: int, framing: str, results: multiprocessing.Queue) -> None:
+    raise_file_limit(connections)
+    results.put(asyncio.run(clients_routine(port, connections, messages, framing)))
+
+# Benchmark execution
+async def scenario(connections: int, messages: int, framing: str) -> dict:
+    server = await AsyncDatapackage.start_server(echo_handler, "127.0.0.1", 0, framing=framing, backlog=4096)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(target=clients_process, args=(port, connections, messages, framing, results))
+        process.start()
+
+        # The server keeps every connection in a single thread
+        maximum_connections = 0
+        while process.is_alive() and results.empty():
+            maximum_connections = max(maximum_connections, len(asyncio.all_tasks()) - 1)
+            await asyncio.sleep(0.05)
+        result = await asyncio.to_thread(results.get)
+        await asyncio.to_thread(process.join)
+
+    assert result["received"] == connections * messages
+    result.update({
+        "connections": connections,
+        "server_tasks": maximum_connections,
+        "server_threads": threading.active_count(),
+        "server_peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    })
+    return result
+
+def run(connections: int = 10000, messages: int = 5, framing: str = "length_prefix") -> dict:
+    raise_file_limit(connections)
+    return asyncio.run(scenario(connections, messages, framing))
+
+if __name__ == "__main__":
+    result = run()
+    print(f"[*] {result['connections']} concurrent connections | connect {result['connect_s']:.2f} s | {result['round_trips_per_s']:.0f} round trips/s")
+    print(f"[*] Server: {result['server_tasks']} connection tasks | {result['server_threads']} thread(s) | peak RSS {result['server_peak_rss_mb']:.0f} MB")
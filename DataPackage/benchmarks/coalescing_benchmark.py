@@ -0,0 +1,63 @@
+# Library import
+import socket
+import threading
+import time
+from datapackage import Datapackage
+
+# Transport definition
+def drain_routine(sock: socket.socket, expected: int, done: threading.Event) -> None:
+    # Counts the received delimiters (without decoding)
+    received, tail = 0, b""
+    while received < expected:
+        data = sock.recv(1 << 20)
+        if not data:
+            break
+        data = tail + data
+        received += data.count(Datapackage.PACKAGE_DELIMITER)
+        tail = data[-(len(Datapackage.PACKAGE_DELIMITER) - 1):]
+    done.set()
+
+# Benchmark execution
+def measure(mode: str, producers: int, messages: int) -> dict:
+    left, right = socket.socketpair()
+    done = threading.Event()
+    threading.Thread(target=drain_routine, args=(right, producers * messages, done), daemon=True).start()
+
+    coalesce_delay = 0.0002 if mode == "coalescing" else None # 200 microseconds
+    writes = [0]
+    def write(data: bytes) -> bool:
+        writes[0] += 1
+        left.sendall(data)
+        return True
+    dp = Datapackage(write_function=write, read_function=lambda: b"", reader_thread=False, coalesce_delay=coalesce_delay)
+
+    def producer(thread_id: int) -> None:
+        packages = [{"origin": thread_id, "seq": seq, "data": "A" * 20} for seq in range(messages)]
+        if mode == "send_many":
+            for offset in range(0, messages, 100):
+                dp.send_many(packages[offset:offset + 100])
+        else:
+            for package in packages:
+                dp.send_datapackage(package)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=producer, args=(thread_id,)) for thread_id in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    dp.flush()
+    assert done.wait(30)
+    elapsed = time.perf_counter() - start
+
+    dp.stop()
+    left.close()
+    right.close()
+    return {"packages_per_s": producers * messages / elapsed, "write_calls": writes[0]}
+
+def run(producers: int = 5, messages: int = 20000) -> dict:
+    return {mode: measure(mode, producers, messages) for mode in ("direct", "coalescing", "send_many")}
+
+if __name__ == "__main__":
+    for mode, result in run().items():
+        print(f"[*] {mode:<10} | 5 producers, 100000 small packages: {result['packages_per_s']:8.0f} packages/s | {result['write_calls']:6} write calls")
@@ -0,0 +1,35 @@
+# Library import
+import base64
+import timeit
+from datapackage import BinaryCodec, JsonCodec, MarshalCodec
+
+# Packages definition
+def build_packages() -> dict:
+    telemetry = {"id": 1024, "timestamp": 1718000000.125, "sensors": [22.5, 23.1, 21.8] * 10, "active": True, "status": "OK"}
+    nested = {"config": {"mode": "verbose", "retries": 5, "targets": [{"host": f"node-{index}", "port": 8000 + index} for index in range(20)]}}
+    raw = bytes(range(256)) * 64
+    return {
+        "telemetry": (telemetry, telemetry),
+        "nested": (nested, nested),
+        # JSON cannot carry bytes: base64 text as the equivalent package
+        "binary_16kb": ({"id": 1, "data": base64.b64encode(raw).decode("ascii")}, {"id": 1, "data": raw}),
+    }
+
+# Benchmark execution
+def run(number: int = 2000) -> list:
+    results = []
+    for name, (json_package, binary_package) in build_packages().items():
+        for codec, package in ((JsonCodec(), json_package), (BinaryCodec(), binary_package), (MarshalCodec(), binary_package)):
+            encoded = codec.encode(package)
+            results.append({
+                "package": name,
+                "codec": codec.name,
+                "size": len(encoded),
+                "encode_us": min(timeit.repeat(lambda: codec.encode(package), repeat=3, number=number)) / number * 1e6,
+                "decode_us": min(timeit.repeat(lambda: codec.decode(encoded), repeat=3, number=number)) / number * 1e6,
+            })
+    return results
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['package']:<12} {result['codec']:<8} | {result['size']:6} bytes | encode {result['encode_us']:8.2f} us | decode {result['decode_us']:8.2f} us")
@@ -0,0 +1,48 @@
+# Library import
+import timeit
+from datapackage import Compressor, JsonCodec, dictionary_from_samples
+from datapackage.classes.framing import FRAME_HEADER
+
+# Packages definition
+def telemetry(seq: int) -> dict:
+    return {"device": f"sensor-node-{seq % 40}", "type": "TELEMETRY", "seq": seq, "temperature": 21.5 + seq % 7, "humidity": 40 + seq % 11, "status": "OK"}
+
+def build_traffic() -> dict:
+    return {
+        "small (telemetry)": [telemetry(seq) for seq in range(1000)],
+        "large (200-reading batches)": [{"batch": [telemetry(seq + offset) for seq in range(200)]} for offset in range(0, 10000, 200)],
+    }
+
+# Benchmark execution
+def run() -> list:
+    codec = JsonCodec()
+    dictionary = dictionary_from_samples([codec.encode(telemetry(seq)) for seq in range(100000, 100200)])
+    compressors = {
+        "none": None,
+        "zlib": Compressor("zlib", threshold=1024),
+        "zlib+dictionary": Compressor("zlib", threshold=64, dictionary=dictionary),
+        "lzma": Compressor("lzma", threshold=1024),
+    }
+
+    results = []
+    for traffic, packages in build_traffic().items():
+        payloads = [codec.encode(package) for package in packages]
+        for name, compressor in compressors.items():
+            def send():
+                return [compressor.compress(payload) if compressor else (payload, 0) for payload in payloads]
+
+            frames = send()
+            wire_bytes = sum(FRAME_HEADER.size + len(payload) for payload, flags in frames)
+            elapsed = min(timeit.repeat(send, repeat=3, number=1))
+            results.append({
+                "traffic": traffic,
+                "compression": name,
+                "wire_bytes": wire_bytes,
+                "ratio": wire_bytes / sum(FRAME_HEADER.size + len(payload) for payload in payloads),
+                "compress_us": elapsed / len(payloads) * 1e6,
+            })
+    return results
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['traffic']:<28} {result['compression']:<16} | {result['wire_bytes']:8} bytes ({result['ratio']:6.1%}) | {result['compress_us']:8.2f} us/package")
@@ -0,0 +1,48 @@
+# Library import
+import socket
+import threading
+import time
+from datapackage import Datapackage
+
+# Benchmark execution
+def measure(mode: str, messages: int = 10000, window: int = 64) -> dict:
+    # Fast producer, slow consumer (1 ms pause every 10 packages) over a socket pair
+    left, right = socket.socketpair()
+    options = {"framing": "length_prefix"}
+    if mode == "queue_size":
+        options["queue_size"] = window
+    elif mode == "flow_control":
+        options["flow_control_window"] = window
+
+    sender = Datapackage(write_function=left.sendall, read_function=left.recv, read_arguments=(1 << 16,), **options)
+    receiver = Datapackage(write_function=right.sendall, read_function=right.recv, read_arguments=(1 << 16,), **options)
+
+    def producer() -> None:
+        for seq in range(messages):
+            sender.send_datapackage({"seq": seq, "data": "A" * 512})
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+
+    maximum_queued = 0
+    for seq in range(messages):
+        maximum_queued = max(maximum_queued, receiver._package_queue.qsize())
+        assert receiver.receive_datapackage(timeout=10)["seq"] == seq
+        if seq % 10 == 0:
+            time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    thread.join()
+    sender.stop()
+    receiver.stop()
+    left.close()
+    right.close()
+    return {"mode": mode, "maximum_queued": maximum_queued, "packages_per_second": messages / elapsed}
+
+def run() -> list:
+    return [measure(mode) for mode in ("unbounded", "queue_size", "flow_control")]
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['mode']:<13} | maximum queued packages: {result['maximum_queued']:6} | {result['packages_per_second']:8.0f} packages/s")
@@ -0,0 +1,46 @@
+# Library import
+import time
+from datapackage import Datapackage, DelimiterFramer, LengthPrefixFramer
+
+# Previous reader (immutable buffer, search and split on every chunk)
+def legacy_feed(buffer: bytes, chunk: bytes) -> tuple:
+    buffer += chunk
+    frames = []
+    while Datapackage.PACKAGE_DELIMITER in buffer:
+        frame, buffer = buffer.split(Datapackage.PACKAGE_DELIMITER, 1)
+        frames.append(frame)
+    return buffer, frames
+
+# Benchmark execution
+def measure(feed, stream: bytes, chunk_size: int) -> float:
+    start = time.perf_counter()
+    frames = 0
+    for position in range(0, len(stream), chunk_size):
+        frames += len(feed(stream[position:position + chunk_size]))
+    assert frames == 1
+    return (time.perf_counter() - start) * 1000
+
+def run(sizes: tuple = (1, 4, 16), chunk_size: int = 4096, legacy_limit: int = 4) -> list:
+    results = []
+    for size in sizes:
+        payload = b"A" * (size * 1024 * 1024)
+        state = {"buffer": b""}
+
+        def legacy(chunk: bytes) -> list:
+            state["buffer"], frames = legacy_feed(state["buffer"], chunk)
+            return frames
+
+        delimiter, length_prefix = DelimiterFramer(), LengthPrefixFramer()
+        results.append({
+            "size_mb": size,
+            # Quadratic: only measured up to legacy_limit MB
+            "legacy_ms": measure(legacy, payload + Datapackage.PACKAGE_DELIMITER, chunk_size) if size <= legacy_limit else None,
+            "delimiter_ms": measure(delimiter.feed, delimiter.encode(payload), chunk_size),
+            "length_prefix_ms": measure(length_prefix.feed, length_prefix.encode(payload), chunk_size),
+        })
+    return results
+
+if __name__ == "__main__":
+    for result in run():
+        legacy = "-" if result["legacy_ms"] is None else f"{result['legacy_ms']:.1f}"
+        print(f"[*] {result['size_mb']:>3} MB frame, 4 KB chunks | legacy {legacy:>9} ms | delimiter {result['delimiter_ms']:7.1f} ms | length prefix {result['length_prefix_ms']:7.1f} ms")
@@ -0,0 +1,75 @@
+# Library import
+import socket
+import random
+import statistics
+import threading
+import time
+from datapackage import Datapackage
+
+# Previous behavior: fixed 10 ms wait after every empty read
+class FixedSleepDatapackage(Datapackage):
+    def _idle_delay(self, empty_reads: int) -> float:
+        return 0.01
+
+# Transport definition
+def echo_routine(sock: socket.socket) -> None:
+    while True:
+        try:
+            data = sock.recv(65536)
+        except OSError:
+            return
+        if not data:
+            return
+        sock.sendall(data)
+
+def non_blocking_transport(sock: socket.socket) -> tuple:
+    sock.setblocking(False)
+    def read() -> bytes:
+        try:
+            return sock.recv(65536)
+        except BlockingIOError:
+            return b""
+    def write(data: bytes) -> bool:
+        sock.sendall(data) # Small packages: never exceed the socket buffer
+        return True
+    return write, read
+
+# Benchmark execution
+def measure(mode: str, count: int, idle: tuple) -> float:
+    left, right = socket.socketpair()
+    threading.Thread(target=echo_routine, args=(right,), daemon=True).start()
+    write, read = non_blocking_transport(left)
+    if mode == "fixed_sleep":
+        dp = FixedSleepDatapackage(write_function=write, read_function=read)
+    elif mode == "backoff":
+        dp = Datapackage(write_function=write, read_function=read)
+    else:
+        dp = Datapackage(write_function=write, read_function=read, readiness=left)
+
+    times = []
+    try:
+        for seq in range(count):
+            time.sleep(random.uniform(*idle)) # Idle link, then a request
+            start = time.perf_counter()
+            dp.send_datapackage({"seq": seq})
+            assert dp.receive_datapackage(timeout=2) == {"seq": seq}
+            times.append(time.perf_counter() - start)
+    finally:
+        left.shutdown(socket.SHUT_RDWR)
+        dp.stop()
+        left.close()
+        right.close()
+    return statistics.median(times) * 1000
+
+def run(count: int = 100) -> dict:
+    results = {}
+    for mode in ("fixed_sleep", "backoff", "readiness"):
+        results[mode] = {
+            "burst_ms": measure(mode, count, (0.0, 0.0)), # Back-to-back requests
+            "idle_ms": measure(mode, count, (0.005, 0.03)), # Idle-then-burst
+        }
+    return results
+
+if __name__ == "__main__":
+    for mode, result in run().items():
+        print(f"[*] {mode:<12} | median round trip: back-to-back {result['burst_ms']:7.3f} ms | after 5-30 ms idle {result['idle_ms']:7.3f} ms")
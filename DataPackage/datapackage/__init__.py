@@ -1,2 +1,7 @@
 # Library import
-from .classes.datapackage import Datapackage
\ No newline at end of file
+from .classes.datapackage import Datapackage
+from .classes.async_datapackage import AsyncDatapackage
+from .classes.hub import DatapackageHub
+from .classes.framing import DelimiterFramer, LengthPrefixFramer
+from .classes.codec import JsonCodec, BinaryCodec, MarshalCodec, register_codec
+from .classes.compression import Compressor, dictionary_from_samples
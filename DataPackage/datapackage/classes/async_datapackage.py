@@ -0,0 +1,138 @@
+# Library import
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+from .framing import PACKAGE_DELIMITER, FRAMING_MODES, CONTROL_FLAG, PackageSerializer
+from .compression import Compressor
+
+# Constants definition
+END_OF_STREAM: Any = object() # Distinct from a received None (JSON null) package
+
+# Classes definition
+class AsyncDatapackage:
+    # Class properties definition
+    PACKAGE_DELIMITER: bytes = PACKAGE_DELIMITER
+    FRAMING_MODES: tuple = FRAMING_MODES
+    READ_SIZE: int = 64 * 1024
+
+    def __init__(self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+
+        framing: str = "delimiter",
+        codec: Union[str, Any] = "json",
+        compression: Union[None, str, Compressor] = None,
+        accepted_codecs: Optional[Iterable[Union[str, Any]]] = None
+    ) -> None:
+        # Verify the framing mode, codec and compression (same wire format as Datapackage)
+        self._serializer = PackageSerializer(framing, codec, compression, self.PACKAGE_DELIMITER, accepted_codecs)
+
+        # Instance properties assignment
+        self._reader = reader
+        self._writer = writer
+
+        # Framing
+        self.framing: str = framing
+        self._framer = self._serializer.framer
+
+        # Packages decoded from the last read, pending to be returned
+        self._pending_packages: deque = deque()
+        self._end_of_stream: bool = False
+
+    # Constructors
+    @classmethod
+    async def open_connection(cls, host: str, port: int, framing: str = "delimiter", codec: Union[str, Any] = "json", compression: Union[None, str, Compressor] = None, accepted_codecs: Optional[Iterable[Union[str, Any]]] = None, **kwargs) -> 'AsyncDatapackage':
+        reader, writer = await asyncio.open_connection(host, port, **kwargs)
+        return cls(reader, writer, framing=framing, codec=codec, compression=compression, accepted_codecs=accepted_codecs)
+
+    @classmethod
+    async def start_server(cls,
+        handler: Callable[['AsyncDatapackage'], Awaitable[None]],
+        host: Optional[str] = None, port: Optional[int] = None,
+        framing: str = "delimiter", codec: Union[str, Any] = "json", compression: Union[None, str, Compressor] = None, accepted_codecs: Optional[Iterable[Union[str, Any]]] = None, **kwargs
+    ) -> asyncio.AbstractServer:
+        # Each connection is handled by a task (no threads)
+        async def connection_routine(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            datapackage = cls(reader, writer, framing=framing, codec=codec, compression=compression, accepted_codecs=accepted_codecs)
+            try:
+                await handler(datapackage)
+            finally:
+                await datapackage.stop()
+
+        return await asyncio.start_server(connection_routine, host, port, **kwargs)
+
+    # Private methods
+    def _process_packet(self, data_package: bytes, flags: int = 0) -> None:
+        try:
+            self._pending_packages.append(self._serializer.decode(data_package, flags))
+        except (ValueError, TypeError, RecursionError):
+            pass
+
+    async def _next_datapackage(self) -> Any:
+        # END_OF_STREAM once the stream is closed
+        while not self._pending_packages:
+            if self._end_of_stream:
+                return END_OF_STREAM
+
+            # Read a load of bytes (cancelling the read keeps the data in the stream)
+            try:
+                chunk = await self._reader.read(self.READ_SIZE)
+            except ConnectionError:
+                chunk = b""
+            if not chunk:
+                self._end_of_stream = True
+                continue
+
+            # Control frames (credit grants) are skipped: no flow control, the peer must not use flow_control_window
+            for flags, data_package in self._framer.feed(chunk):
+                if flags & CONTROL_FLAG:
+                    continue
+                if data_package:
+                    self._process_packet(data_package, flags)
+
+        return self._pending_packages.popleft()
+
+    # Public methods
+    async def send_datapackage(self, data_package: dict) -> bool:
+        try:
+            self._writer.write(self._serializer.encode(data_package))
+
+            # Wait while the transport buffer is over its high-water mark
+            await self._writer.drain()
+            return True
+        except (TypeError, ValueError, ConnectionError):
+            return False
+
+    async def receive_datapackage(self, timeout: Optional[float] = None) -> Optional[dict]:
+        # None on timeout or at the end of the stream
+        try:
+            data_package = await asyncio.wait_for(self._next_datapackage(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return None if data_package is END_OF_STREAM else data_package
+
+    async def stop(self) -> bool:
+        if not self._writer.is_closing():
+            self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+        return True
+
+    # Iteration and context management
+    def __aiter__(self) -> 'AsyncDatapackage':
+        return self
+
+    async def __anext__(self) -> dict:
+        data_package = await self._next_datapackage()
+        if data_package is END_OF_STREAM:
+            raise StopAsyncIteration
+        return data_package
+
+    async def __aenter__(self) -> 'AsyncDatapackage':
+        return self
+
+    async def __aexit__(self, *exception_information) -> None:
+        await self.stop()
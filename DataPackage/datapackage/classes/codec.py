@@ -0,0 +1,227 @@
+# Library import
+import json
+import marshal
+import struct
+from typing import Any, Dict, Union
+
+# Constants definition
+FLOAT_FORMAT: struct.Struct = struct.Struct(">d")
+MAXIMUM_DEPTH: int = 256
+
+# Value tags (binary codec)
+TAG_NONE = 0x00
+TAG_FALSE = 0x01
+TAG_TRUE = 0x02
+TAG_INT = 0x03
+TAG_FLOAT = 0x04
+TAG_STR = 0x05
+TAG_BYTES = 0x06
+TAG_LIST = 0x07
+TAG_DICT = 0x08
+
+# Classes definition
+class JsonCodec:
+    # JSON (UTF-8): compatible format, never contains the package delimiter
+    identifier: int = 0
+    name: str = "json"
+
+    def encode(self, data_package: Any) -> bytes:
+        return json.dumps(data_package).encode("UTF-8")
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload.decode("UTF-8"))
+
+class BinaryCodec:
+    # Compact tagged binary format: None, bool, int, float, str, bytes, list (and tuple) and dict
+    identifier: int = 1
+    name: str = "binary"
+
+    # Private methods
+    def _encode(self, buffer: bytearray, element: Any, depth: int) -> None:
+        element_type = type(element)
+
+        if element_type is str:
+            data = element.encode("UTF-8")
+            buffer.append(TAG_STR)
+            self._varint(buffer, len(data))
+            buffer += data
+        elif element_type is int:
+            buffer.append(TAG_INT)
+            self._varint(buffer, element << 1 if element >= 0 else ((-element) << 1) - 1) # Zigzag
+        elif element_type is dict:
+            if depth >= MAXIMUM_DEPTH:
+                raise ValueError("Maximum nesting depth exceeded")
+            buffer.append(TAG_DICT)
+            self._varint(buffer, len(element))
+            for key, value in element.items():
+                self._encode(buffer, key, depth + 1)
+                self._encode(buffer, value, depth + 1)
+        elif element_type is list or element_type is tuple:
+            if depth >= MAXIMUM_DEPTH:
+                raise ValueError("Maximum nesting depth exceeded")
+            buffer.append(TAG_LIST)
+            self._varint(buffer, len(element))
+            for item in element:
+                self._encode(buffer, item, depth + 1)
+        elif element_type is float:
+            buffer.append(TAG_FLOAT)
+            buffer += FLOAT_FORMAT.pack(element)
+        elif element is None:
+            buffer.append(TAG_NONE)
+        elif element_type is bool:
+            buffer.append(TAG_TRUE if element else TAG_FALSE)
+        elif element_type is bytes or element_type is bytearray or element_type is memoryview:
+            buffer.append(TAG_BYTES)
+            self._varint(buffer, len(element))
+            buffer += element
+        else:
+            raise TypeError(f"Object of type {element_type.__name__} is not binary serializable")
+
+    @staticmethod
+    def _varint(buffer: bytearray, number: int) -> None:
+        if number < 0x80:
+            buffer.append(number) # Single byte (most lengths and small numbers)
+            return None
+        while number > 0x7F:
+            buffer.append((number & 0x7F) | 0x80)
+            number >>= 7
+        buffer.append(number)
+
+    def _decode(self, data: bytes, position: int, depth: int) -> tuple:
+        tag = data[position]
+        position += 1
+
+        if tag == TAG_STR or tag == TAG_BYTES or tag == TAG_INT or tag == TAG_LIST or tag == TAG_DICT:
+            # Varint (length, count or zigzag number)
+            number = data[position]
+            position += 1
+            if number & 0x80:
+                number &= 0x7F
+                shift = 7
+                while True:
+                    byte = data[position]
+                    position += 1
+                    number |= (byte & 0x7F) << shift
+                    if not byte & 0x80:
+                        break
+                    shift += 7
+
+            if tag == TAG_STR or tag == TAG_BYTES:
+                end = position + number
+                if end > len(data):
+                    raise ValueError("Invalid binary payload: unexpected end of data")
+                chunk = data[position:end]
+                return (str(chunk, "UTF-8") if tag == TAG_STR else bytes(chunk)), end
+            if tag == TAG_INT:
+                return (number >> 1) if not number & 1 else -((number + 1) >> 1), position
+
+            if depth >= MAXIMUM_DEPTH:
+                raise ValueError("Invalid binary payload: maximum nesting depth exceeded")
+            if number > len(data) - position:
+                raise ValueError("Invalid binary payload: element count exceeds the payload") # Each element takes a byte
+            if tag == TAG_LIST:
+                items = []
+                for _ in range(number):
+                    item, position = self._decode(data, position, depth + 1)
+                    items.append(item)
+                return items, position
+            dictionary = {}
+            for _ in range(number):
+                key, position = self._decode(data, position, depth + 1)
+                value, position = self._decode(data, position, depth + 1)
+                try:
+                    dictionary[key] = value
+                except TypeError:
+                    raise ValueError("Invalid binary payload: unhashable dictionary key") from None
+            return dictionary, position
+
+        if tag == TAG_FLOAT:
+            if position + 8 > len(data):
+                raise ValueError("Invalid binary payload: unexpected end of data")
+            return FLOAT_FORMAT.unpack_from(data, position)[0], position + 8
+        if tag == TAG_NONE:
+            return None, position
+        if tag == TAG_TRUE or tag == TAG_FALSE:
+            return tag == TAG_TRUE, position
+        raise ValueError(f"Invalid binary payload: unknown tag {tag}")
+
+    # Public methods
+    def encode(self, data_package: Any) -> bytes:
+        buffer = bytearray()
+        self._encode(buffer, data_package, 0)
+        return bytes(buffer)
+
+    def decode(self, payload: bytes) -> Any:
+        try:
+            data_package, position = self._decode(payload, 0, 0)
+        except IndexError:
+            raise ValueError("Invalid binary payload: unexpected end of data") from None
+        if position != len(payload):
+            raise ValueError("Invalid binary payload: trailing data")
+        return data_package
+
+class MarshalCodec:
+    # marshal (C implementation) restricted to the binary codec types: only for trusted peers
+    identifier: int = 2
+    name: str = "marshal"
+    SAFE_TYPES: tuple = (type(None), bool, int, float, str, bytes, list, tuple, dict)
+
+    # Private methods
+    def _verify(self, element: Any, depth: int = 0) -> None:
+        element_type = type(element)
+        if element_type not in self.SAFE_TYPES:
+            raise TypeError(f"Object of type {element_type.__name__} is not marshal-safe")
+        if element_type is dict:
+            if depth >= MAXIMUM_DEPTH:
+                raise ValueError("Maximum nesting depth exceeded")
+            for key, value in element.items():
+                self._verify(key, depth + 1)
+                self._verify(value, depth + 1)
+        elif element_type is list or element_type is tuple:
+            if depth >= MAXIMUM_DEPTH:
+                raise ValueError("Maximum nesting depth exceeded")
+            for item in element:
+                self._verify(item, depth + 1)
+
+    # Public methods
+    def encode(self, data_package: Any) -> bytes:
+        self._verify(data_package)
+        return marshal.dumps(data_package, 4)
+
+    def decode(self, payload: bytes) -> Any:
+        try:
+            data_package = marshal.loads(payload)
+        except (EOFError, TypeError) as Error:
+            raise ValueError(f"Invalid marshal payload: {Error}") from None
+        self._verify(data_package) # Code objects and other types are rejected
+        return data_package
+
+# Registry definition
+CODECS: Dict[int, Any] = {}
+CODEC_NAMES: Dict[str, Any] = {}
+CODEC_MASK: int = 0x0F # Frame header flags bits holding the codec identifier
+
+# Functions definition
+def register_codec(codec: Any) -> Any:
+    if not 0 <= codec.identifier <= CODEC_MASK:
+        raise ValueError(f"Codec identifier must be between 0 and {CODEC_MASK}")
+    registered = CODECS.get(codec.identifier)
+    if registered is not None and registered.name != codec.name:
+        raise ValueError(f"Codec identifier {codec.identifier} already registered ({registered.name})")
+
+    CODECS[codec.identifier] = codec
+    CODEC_NAMES[codec.name] = codec
+    return codec
+
+def resolve_codec(codec: Union[str, Any]) -> Any:
+    # Codec by name, or a codec instance (registered if needed: received frames are decoded by identifier)
+    if isinstance(codec, str):
+        if codec not in CODEC_NAMES:
+            raise ValueError(f"Unknown codec: {codec!r} (expected one of {tuple(CODEC_NAMES)})")
+        return CODEC_NAMES[codec]
+    if CODECS.get(codec.identifier) is not codec:
+        register_codec(codec)
+    return codec
+
+for default_codec in (JsonCodec(), BinaryCodec(), MarshalCodec()):
+    register_codec(default_codec)
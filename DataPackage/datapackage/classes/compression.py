@@ -0,0 +1,105 @@
+# Library import
+import lzma
+import zlib
+from typing import Optional, Tuple
+
+# Constants definition
+COMPRESSION_SHIFT: int = 4
+COMPRESSION_MASK: int = 0x30 # Frame header flags bits holding the compression method
+COMPRESSION_NONE: int = 0
+COMPRESSION_ZLIB: int = 1
+COMPRESSION_ZLIB_DICTIONARY: int = 2 # zlib with the shared preset dictionary
+COMPRESSION_LZMA: int = 3
+MAXIMUM_DICTIONARY_SIZE: int = 32 * 1024 # zlib window
+DICTIONARY_MEMORY_LEVEL: int = 6 # Smaller deflate state: copied per frame (allocation cost dominates at level 8)
+
+# Functions definition
+def decompress(payload: bytes, flags: int, dictionary: Optional[bytes], maximum_length: int) -> bytes:
+    # Payload of a received frame (ValueError if corrupt, larger than maximum_length, or without its dictionary)
+    method = (flags & COMPRESSION_MASK) >> COMPRESSION_SHIFT
+    try:
+        if method == COMPRESSION_NONE:
+            return payload
+        if method == COMPRESSION_ZLIB or method == COMPRESSION_ZLIB_DICTIONARY:
+            if method == COMPRESSION_ZLIB_DICTIONARY and dictionary is None:
+                raise ValueError("Frame compressed with a preset dictionary, but none is configured")
+            decompressor = zlib.decompressobj(zdict=dictionary) if method == COMPRESSION_ZLIB_DICTIONARY else zlib.decompressobj()
+            data = decompressor.decompress(payload, maximum_length + 1)
+            complete = decompressor.eof
+        else:
+            decompressor = lzma.LZMADecompressor()
+            data = decompressor.decompress(payload, maximum_length + 1)
+            complete = decompressor.eof
+    except (zlib.error, lzma.LZMAError) as Error:
+        raise ValueError(f"Invalid compressed payload: {Error}") from None
+
+    # Bounded output: compressed bombs are rejected before being expanded
+    if len(data) > maximum_length:
+        raise ValueError(f"Decompressed payload exceeds the maximum frame length ({maximum_length})")
+    if not complete:
+        raise ValueError("Invalid compressed payload: truncated stream")
+    return data
+
+def resolve_compressor(compression: Optional[object]) -> Optional['Compressor']:
+    # Compressor by method name, or a Compressor instance (None: frames are sent uncompressed)
+    if compression is None or isinstance(compression, Compressor):
+        return compression
+    return Compressor(compression)
+
+def dictionary_from_samples(samples: list, size: int = MAXIMUM_DICTIONARY_SIZE) -> bytes:
+    # Preset dictionary from typical payloads (the most frequent content should be last: closest matches)
+    return b"".join(samples)[-size:]
+
+# Classes definition
+class Compressor:
+    # Per-frame compression: payloads from threshold bytes, only sent compressed when smaller
+    METHODS: tuple = ("zlib", "lzma")
+
+    def __init__(self,
+        method: str = "zlib",
+        threshold: int = 1024,
+        dictionary: Optional[bytes] = None,
+        level: Optional[int] = None
+    ) -> None:
+        # Verify the method
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown compression method: {method!r} (expected one of {self.METHODS})")
+        if dictionary is not None and method != "zlib":
+            raise ValueError("Preset dictionaries are only supported by zlib")
+
+        # Instance properties assignment
+        self.method: str = method
+        self.threshold: int = threshold
+        self.dictionary: Optional[bytes] = bytes(dictionary[-MAXIMUM_DICTIONARY_SIZE:]) if dictionary else None
+        self.level: int = level if level is not None else (6 if method == "zlib" else lzma.PRESET_DEFAULT)
+
+        if method == "lzma":
+            self._method_identifier = COMPRESSION_LZMA
+        else:
+            self._method_identifier = COMPRESSION_ZLIB_DICTIONARY if self.dictionary else COMPRESSION_ZLIB
+
+        # Compressor primed with the dictionary once (copied per frame: loading the dictionary is the main cost)
+        self._primed_compressor = None
+        if self.dictionary:
+            self._primed_compressor = zlib.compressobj(self.level, zlib.DEFLATED, zlib.MAX_WBITS, DICTIONARY_MEMORY_LEVEL, zdict=self.dictionary)
+
+    # Public methods
+    def compress(self, payload: bytes) -> Tuple[bytes, int]:
+        # Payload to send and its compression flags
+        if len(payload) < self.threshold:
+            return payload, 0
+
+        if self.method == "lzma":
+            compressed = lzma.compress(payload, preset=self.level)
+        elif self._primed_compressor is not None:
+            compressor = self._primed_compressor.copy()
+            compressed = compressor.compress(payload) + compressor.flush()
+        else:
+            compressed = zlib.compress(payload, self.level)
+
+        if len(compressed) >= len(payload):
+            return payload, 0 # Incompressible content
+        return compressed, self._method_identifier << COMPRESSION_SHIFT
+
+    def decompress(self, payload: bytes, flags: int, maximum_length: int) -> bytes:
+        return decompress(payload, flags, self.dictionary, maximum_length)
@@ -1,94 +1,327 @@
 # Library import
-import json
 import time
 import threading
 import queue
-from typing import Optional, Any
+import selectors
+import socket
+from typing import Optional, Any, Iterable, Union
 import traceback
+from .framing import PACKAGE_DELIMITER, FRAMING_MODES, CONTROL_FLAG, CREDIT_FORMAT, PackageSerializer
+from .compression import Compressor
 
 # Classes definition
 class Datapackage:
     # Class properties definition
-    PACKAGE_DELIMITER: bytes = b"\01\02\03\01\01\01"
+    PACKAGE_DELIMITER: bytes = PACKAGE_DELIMITER
+    FRAMING_MODES: tuple = FRAMING_MODES
+    IDLE_BACKOFF_INITIAL: float = 0.00005 # First wait after consecutive empty reads (doubled up to the maximum)
+    IDLE_BACKOFF_MAXIMUM: float = 0.01
+    READINESS_TIMEOUT: float = 0.1 # Longest readiness wait (the stop request is checked in between)
+    COALESCE_SIZE: int = 64 * 1024 # Pending bytes that trigger an immediate coalesced write
 
     def __init__(self,
         write_function: callable,
         read_function: callable,
 
         read_arguments: Optional[tuple] = None,
-        read_keyword_arguments: Optional[dict] = None
+        read_keyword_arguments: Optional[dict] = None,
+
+        framing: str = "delimiter",
+
+        reader_thread: bool = True,
+        package_callback: Optional[callable] = None,
+        readiness: Optional[Any] = None,
+
+        coalesce_delay: Optional[float] = None,
+        coalesce_size: Optional[int] = None,
+
+        codec: Union[str, Any] = "json",
+        compression: Union[None, str, Compressor] = None,
+        accepted_codecs: Optional[Iterable[Union[str, Any]]] = None,
+
+        queue_size: int = 0,
+        flow_control_window: Optional[int] = None,
+        credit_timeout: Optional[float] = None
     ) -> None:
+        # Verify the framing mode, codec and compression (both ends must use the same framing mode)
+        self._serializer = PackageSerializer(framing, codec, compression, self.PACKAGE_DELIMITER, accepted_codecs)
+        if flow_control_window is not None:
+            if framing == "delimiter":
+                raise ValueError("Flow control requires the length_prefix framing (control frames flagged in the frame header)")
+            if flow_control_window < 1:
+                raise ValueError("The flow control window must be at least 1 frame")
+
         # Instance properties assignment
         self._write_function = write_function
         self._read_function = read_function
 
-        # Package list
-        self._package_queue: queue.Queue = queue.Queue()
+        # Package list (or callback for each received package), bounded by queue_size (by default, the flow control window)
+        self._package_queue: queue.Queue = queue.Queue(maxsize=queue_size if queue_size else (flow_control_window or 0))
+        self._package_callback = package_callback
+        self.dropped: int = 0 # Packages discarded with a full queue (without reader thread)
 
         # Data reception
         self._read_arguments: tuple = read_arguments if read_arguments else ()
         self._read_keyword_arguments: dict = read_keyword_arguments if read_keyword_arguments else {}
-        self._reception_buffer: bytes = bytes()
+
+        # Framing
+        self.framing: str = framing
+        self._framer = self._serializer.framer
 
         # Control
         self._running = True
 
-        # Routines
+        # Readiness source: object with fileno() (by default, the plain socket of a bound read function: sock.recv)
+        # Transports that buffer data in user space (ssl.SSLSocket, BufferedReader) are not detected: select() does not see that data
+        self._readiness_selector: Optional[selectors.BaseSelector] = None
+        if reader_thread:
+            if readiness is None:
+                owner = getattr(read_function, "__self__", None)
+                readiness = owner if type(owner) is socket.socket else None
+            if readiness is not None:
+                try:
+                    self._readiness_selector = selectors.DefaultSelector()
+                    self._readiness_selector.register(readiness, selectors.EVENT_READ)
+                except (ValueError, OSError):
+                    self._readiness_selector = None # Without descriptor: read with backoff
+
+        # Coalesced sending: frames gathered for up to coalesce_delay seconds or coalesce_size bytes
+        self._coalesce_delay: Optional[float] = coalesce_delay
+        self._coalesce_size: int = coalesce_size if coalesce_size else self.COALESCE_SIZE
+        self._write_lock: threading.Lock = threading.Lock() # Order of the write calls
+        self._pending_condition: threading.Condition = threading.Condition()
+        self._pending_frames: list = []
+        self._pending_size: int = 0
+        self._pending_since: float = 0.0
+
+        # Credit-based flow control (both ends with the same window): frames the peer can still receive, and consumed frames not granted yet
+        self._flow_control_window: Optional[int] = flow_control_window
+        self._credit_timeout: Optional[float] = credit_timeout
+        self._credit_condition: threading.Condition = threading.Condition()
+        self._credits: int = flow_control_window or 0
+        self._released_credits: int = 0
+        self._grant_threshold: int = max(1, (flow_control_window or 0) // 2)
+        self._grant_arguments: tuple = ((), {}) # Write arguments of the last send, reused by the credit grants
+
+        # Routines (without reader thread, the received data is fed externally: DatapackageHub)
         self._parameters_lock: threading.Lock = threading.Lock()
-        self._reader_thread: threading.Thread = threading.Thread(
-            target=self._reader_thread_routine,
-            daemon=True
-        )
-        self._reader_thread.start()
+        self._reader_thread: Optional[threading.Thread] = None
+        if reader_thread:
+            self._reader_thread = threading.Thread(
+                target=self._reader_thread_routine,
+                daemon=True
+            )
+            self._reader_thread.start()
+
+        self._writer_thread: Optional[threading.Thread] = None
+        if coalesce_delay is not None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_thread_routine,
+                daemon=True
+            )
+            self._writer_thread.start()
+
+    # Properties
+    @property
+    def _reception_buffer(self) -> bytes:
+        # Read-only view of the received data pending to complete a frame (kept for existing callers)
+        return self._framer.pending()
 
     # Private methods
+    def _idle_delay(self, empty_reads: int) -> float:
+        # Adaptive backoff: the first empty read retries at once
+        if empty_reads <= 1:
+            return 0.0
+        return min(self.IDLE_BACKOFF_MAXIMUM, self.IDLE_BACKOFF_INITIAL * (1 << min(empty_reads - 2, 16)))
+
     def _reader_thread_routine(self) -> None:
+        empty_reads = 0
         while self._running:
             try:
-                # Read a load of bytes
+                # Wait until the transport is readable (if it exposes a descriptor)
+                if self._readiness_selector is not None and not self._readiness_selector.select(self.READINESS_TIMEOUT):
+                    continue
+
+                # Read parameters (the read itself runs outside the lock)
                 with self._parameters_lock:
-                    # Verify the current status
-                    if not self._running:
-                        break # Stop the reader
+                    read_arguments, read_keyword_arguments = self._read_arguments, self._read_keyword_arguments
+
+                # Read a load of bytes
+                chunk = self._read_function(*read_arguments, **read_keyword_arguments)
+
+                # Verify the current status
+                if not self._running:
+                    break # Stop the reader
 
-                    chunk = self._read_function(*self._read_arguments, **self._read_keyword_arguments)
                 # Verify read result
                 if not chunk:
-                    # Wait execution temporizer
-                    time.sleep(0.01)
+                    empty_reads += 1
+                    time.sleep(self._idle_delay(empty_reads))
                     continue
+                empty_reads = 0
 
-                # Save the received data
-                self._reception_buffer += chunk
+                # Process the received data
+                if not self._feed(chunk):
+                    return None # Stop the reader
 
-                # Process the buffer to identify package delimiters
-                while self.PACKAGE_DELIMITER in self._reception_buffer:
-                    # Extract the first datapackage from the buffer
-                    data_package, self._reception_buffer = self._reception_buffer.split(self.PACKAGE_DELIMITER, 1)
-
-                    # Verify the result
-                    if data_package:
-                        self._process_packet(data_package)
+            except Exception as Error:
+                # Failing transport: retried with the same backoff
+                empty_reads += 1
+                time.sleep(self._idle_delay(empty_reads))
+                #traceback.print_exc()
+    
+    def _writer_thread_routine(self) -> None:
+        while True:
+            with self._pending_condition:
+                # Wait for the first pending frame
+                while not self._pending_frames and self._running:
+                    self._pending_condition.wait()
+                if not self._pending_frames:
+                    break # Stopped and flushed
 
-                    # Verify the current status
-                    if not self._running:
-                        return None # Stop the reader
+                # Gather frames until the delay expires or the size is reached
+                deadline = self._pending_since + self._coalesce_delay
+                while self._pending_size < self._coalesce_size and self._running:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_condition.wait(remaining)
 
+            try:
+                self.flush()
             except Exception as Error:
                 pass
                 #traceback.print_exc()
-    
-    def _process_packet(self, data_package: bytes) -> bool:
+
+    def _flush_pending(self) -> bool:
+        # Requires the write lock
+        with self._pending_condition:
+            frames, self._pending_frames, self._pending_size = self._pending_frames, [], 0
+        if not frames:
+            return True
+
+        # Frames not written: their credits are returned (errors propagate)
+        try:
+            result = self._write_function(b"".join(frames))
+        except BaseException:
+            self._return_credits(len(frames))
+            raise
+        if result is False:
+            self._return_credits(len(frames))
+        return result
+
+    def _acquire_credits(self, count: int) -> int:
+        # Frames that can be sent now, up to count (0: timeout or stopped)
+        if self._flow_control_window is None:
+            return count
+
+        deadline = None if self._credit_timeout is None else time.monotonic() + self._credit_timeout
+        with self._credit_condition:
+            while self._credits <= 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self._running or (remaining is not None and remaining <= 0):
+                    return 0
+                self._credit_condition.wait(remaining)
+
+            count = min(count, self._credits)
+            self._credits -= count
+            return count
+
+    def _return_credits(self, count: int) -> None:
+        # Credits of frames that were not sent
+        if self._flow_control_window is None:
+            return None
+        with self._credit_condition:
+            self._credits += count
+            self._credit_condition.notify_all()
+
+    def _receive_credits(self, payload: bytes) -> None:
+        try:
+            count, = CREDIT_FORMAT.unpack(payload)
+        except Exception as Error:
+            return None # Malformed control frame
+        self._return_credits(count)
+
+    def _release_credits(self, count: int = 1) -> None:
+        # Consumed (or discarded) frames: granted back to the peer in batches of half a window
+        if self._flow_control_window is None:
+            return None
+        with self._credit_condition:
+            self._released_credits += count
+            if self._released_credits < self._grant_threshold:
+                return None
+            count, self._released_credits = self._released_credits, 0
+
+        # Same write arguments as the last send (e.g. the destination of sendto)
+        args, kwargs = self._grant_arguments
+        try:
+            with self._write_lock:
+                granted = self._write_function(self._framer.encode(CREDIT_FORMAT.pack(count), CONTROL_FLAG), *args, **kwargs) is not False
+        except Exception as Error:
+            granted = False
+            #traceback.print_exc()
+
+        # Not granted: retried with the next consumed frame
+        if not granted:
+            with self._credit_condition:
+                self._released_credits += count
+
+    def _enqueue(self, datapackage: Any) -> bool:
+        # Bounded queue: the reader thread waits for room (the transport is not read meanwhile); fed externally (DatapackageHub), the package is dropped
+        if self._reader_thread is None:
+            try:
+                self._package_queue.put_nowait(datapackage)
+                return True
+            except queue.Full:
+                self.dropped += 1
+                self._release_credits()
+                return False
+
+        while self._running:
+            try:
+                self._package_queue.put(datapackage, timeout=self.READINESS_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _serialize(self, data_package: dict) -> bytes:
+        return self._serializer.encode(data_package)
+
+    def _feed(self, chunk: bytes) -> bool:
+        # Complete frames of the received data (partial frames stay in the framer)
+        for flags, data_package in self._framer.feed(chunk):
+            # Verify the result
+            if flags & CONTROL_FLAG:
+                self._receive_credits(data_package)
+            elif data_package:
+                self._process_packet(data_package, flags)
+
+            # Verify the current status
+            if not self._running:
+                return False
+        return True
+
+    def _process_packet(self, data_package: bytes, flags: int = 0) -> bool:
         try:
-            decoded_data = data_package.decode("UTF-8")
-            datapackage = json.loads(decoded_data)
+            datapackage = self._serializer.decode(data_package, flags)
 
-            # Save the processed package
-            self._package_queue.put(datapackage)
-        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Save (the credit is granted back once received) or dispatch the processed package
+            if self._package_callback is None:
+                return self._enqueue(datapackage)
+            try:
+                self._package_callback(self, datapackage)
+            except Exception as Error:
+                pass # Callback errors never stop the following frames of the chunk
+                #traceback.print_exc()
+        except (ValueError, TypeError, RecursionError):
             #traceback.print_exc()
             pass
 
+        # Dispatched or discarded package
+        self._release_credits()
+        return True
+
     # Public methods
     def update_reception_parameters(self, *args, **kwargs) -> bool:
         with self._parameters_lock:
@@ -99,24 +332,122 @@ class Datapackage:
     
     def send_datapackage(self, data_package: dict, *args, **kwargs) -> bool:
         try:
-            datapackage_serialized = json.dumps(data_package).encode("UTF-8")
-            full_dataframe = datapackage_serialized + self.PACKAGE_DELIMITER
+            full_dataframe = self._serialize(data_package)
+        except (TypeError, ValueError):
+            #traceback.print_exc()
+            return False
+
+        # Flow control: waits for a credit (up to credit_timeout)
+        if not self._acquire_credits(1):
+            return False
+        if self._flow_control_window is not None:
+            self._grant_arguments = (args, kwargs)
+
+        # Coalesced sending (write arguments are only applied to direct writes)
+        if self._writer_thread is not None and not args and not kwargs:
+            with self._pending_condition:
+                if not self._pending_frames:
+                    self._pending_since = time.monotonic()
+                    self._pending_condition.notify()
+                self._pending_frames.append(full_dataframe)
+                self._pending_size += len(full_dataframe)
+                if self._pending_size >= self._coalesce_size:
+                    self._pending_condition.notify()
+            return True
 
-            return self._write_function(full_dataframe, *args, **kwargs)
+        try:
+            with self._write_lock:
+                # Pending coalesced frames are written first (order)
+                if self._pending_frames:
+                    self._flush_pending()
+                result = self._write_function(full_dataframe, *args, **kwargs)
+        except (TypeError, ValueError):
+            #traceback.print_exc()
+            self._return_credits(1)
+            return False
+        except BaseException:
+            # Transport errors (OSError) propagate, without losing the credit
+            self._return_credits(1)
+            raise
+
+        # Frame not written: its credit is returned
+        if result is False:
+            self._return_credits(1)
+        return result
+
+    def send_many(self, data_packages: list, *args, **kwargs) -> bool:
+        # Every package in a single write call (nothing is sent if any package is not serializable)
+        try:
+            frames = [self._serialize(data_package) for data_package in data_packages]
         except (TypeError, ValueError):
             #traceback.print_exc()
             return False
+
+        # Flow control: one write call for each group of available credits
+        result, position = True, 0
+        while position < len(frames):
+            count = self._acquire_credits(len(frames) - position)
+            if not count:
+                return False
+            if self._flow_control_window is not None:
+                self._grant_arguments = (args, kwargs)
+
+            try:
+                with self._write_lock:
+                    if self._pending_frames:
+                        self._flush_pending()
+                    result = self._write_function(b"".join(frames[position:position + count]), *args, **kwargs)
+            except (TypeError, ValueError):
+                #traceback.print_exc()
+                self._return_credits(count)
+                return False
+            except BaseException:
+                # Transport errors (OSError) propagate, without losing the credits
+                self._return_credits(count)
+                raise
+            if result is False:
+                self._return_credits(count)
+                return False
+            position += count
+        return result
+
+    def flush(self) -> bool:
+        # Write the pending coalesced frames now
+        with self._write_lock:
+            return self._flush_pending()
     
     def receive_datapackage(self, timeout: Optional[int] = None) -> Optional[dict]:
         try:
-            return self._package_queue.get(block=True, timeout=timeout)
+            datapackage = self._package_queue.get(block=True, timeout=timeout)
         except queue.Empty:
             #traceback.print_exc()
             return None
+
+        self._release_credits()
+        return datapackage
     
     def stop(self) -> bool:
         self._running = False
-        if self._reader_thread.is_alive():
+
+        # Senders waiting for credits return
+        with self._credit_condition:
+            self._credit_condition.notify_all()
+
+        # Pending coalesced frames are written before stopping
+        if self._writer_thread is not None:
+            with self._pending_condition:
+                self._pending_condition.notify()
+            self._writer_thread.join(timeout=1.0)
+            try:
+                self.flush()
+            except Exception as Error:
+                pass
+                #traceback.print_exc()
+
+        if self._reader_thread is not None and self._reader_thread.is_alive():
             self._reader_thread.join(timeout=1.0)
+        if self._readiness_selector is not None and not (self._reader_thread and self._reader_thread.is_alive()):
+            self._readiness_selector.close()
+            self._readiness_selector = None
         
         return True
\ No newline at end of file
@@ -0,0 +1,170 @@
+# Library import
+import struct
+from typing import Any, Iterable, List, Optional, Tuple, Union
+from .codec import CODEC_MASK, JsonCodec, resolve_codec
+from .compression import COMPRESSION_MASK, Compressor, decompress, resolve_compressor
+
+# Constants definition
+PACKAGE_DELIMITER: bytes = b"\01\02\03\01\01\01"
+FRAME_MAGIC: bytes = b"DP"
+FRAME_VERSION: int = 1
+FRAME_HEADER: struct.Struct = struct.Struct(">2sBBI") # Magic, version, flags, payload length
+MAXIMUM_PAYLOAD_LENGTH: int = 64 * 1024 * 1024 # Larger declared lengths are treated as corrupt headers
+CONTROL_FLAG: int = 0x80 # Frame header flags bit of flow-control frames (never delivered as packages)
+CREDIT_FORMAT: struct.Struct = struct.Struct(">I") # Control frame payload: frames granted to the sender
+FRAMING_MODES: tuple = ("delimiter", "length_prefix")
+
+# Classes definition
+class DelimiterFramer:
+    # Compatible framing: payload followed by the package delimiter
+    def __init__(self, delimiter: bytes = PACKAGE_DELIMITER) -> None:
+        self.delimiter: bytes = delimiter
+        self._buffer: bytearray = bytearray()
+        self._scanned: int = 0 # Buffer prefix already searched for the delimiter
+
+    # Public methods
+    def pending(self) -> bytes:
+        # Received data of the incomplete frame
+        return bytes(self._buffer)
+
+    def encode(self, payload: bytes, flags: int = 0) -> bytes:
+        return payload + self.delimiter
+
+    def feed(self, chunk: bytes) -> List[Tuple[int, bytearray]]:
+        buffer = self._buffer
+        buffer += chunk
+
+        # Only the new data is searched (plus a possibly split delimiter)
+        frames = []
+        position = max(0, self._scanned - len(self.delimiter) + 1)
+        start = 0
+        while True:
+            index = buffer.find(self.delimiter, position)
+            if index < 0:
+                break
+            frames.append((0, buffer[start:index]))
+            start = position = index + len(self.delimiter)
+
+        # Consumed frames are removed from the front (no copy of the pending data)
+        if start:
+            del buffer[:start]
+        self._scanned = len(buffer)
+        return frames
+
+class LengthPrefixFramer:
+    # Binary framing: fixed header (magic, version, flags, payload length) and payload
+    def __init__(self, maximum_length: int = MAXIMUM_PAYLOAD_LENGTH) -> None:
+        self.maximum_length: int = maximum_length
+        self.discarded: int = 0 # Bytes skipped to resynchronize after corrupt headers
+
+        # Reassembly state
+        self._header: bytearray = bytearray()
+        self._flags: int = 0
+        self._payload: Optional[bytearray] = None
+        self._view: Optional[memoryview] = None
+        self._filled: int = 0
+
+    # Private methods
+    def _start_frame(self) -> bool:
+        magic, version, flags, length = FRAME_HEADER.unpack(self._header)
+        if magic != FRAME_MAGIC or version != FRAME_VERSION or length > self.maximum_length:
+            # Corrupt header: skip to the next possible magic
+            index = self._header.find(FRAME_MAGIC[:1], 1)
+            index = len(self._header) if index < 0 else index
+            del self._header[:index]
+            self.discarded += index
+            return False
+
+        # Payload preallocated once per frame
+        self._header.clear()
+        self._flags = flags
+        self._payload = bytearray(length)
+        self._view = memoryview(self._payload)
+        self._filled = 0
+        return True
+
+    def _finish_frame(self) -> Tuple[int, bytearray]:
+        frame = (self._flags, self._payload)
+        self._view.release()
+        self._payload = self._view = None
+        return frame
+
+    # Public methods
+    def pending(self) -> bytes:
+        # Received data of the incomplete frame (header included)
+        if self._payload is None:
+            return bytes(self._header)
+        return FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, self._flags, len(self._payload)) + bytes(self._view[:self._filled])
+
+    def encode(self, payload: bytes, flags: int = 0) -> bytes:
+        if len(payload) > self.maximum_length:
+            raise ValueError(f"Payload of {len(payload)} bytes exceeds the maximum frame length ({self.maximum_length})")
+        return FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, flags, len(payload)) + payload
+
+    def feed(self, chunk: bytes) -> List[Tuple[int, bytearray]]:
+        frames = []
+        with memoryview(chunk) as view:
+            position, size = 0, len(view)
+            while position < size:
+                if self._payload is None:
+                    # Header (may arrive split across chunks)
+                    count = min(FRAME_HEADER.size - len(self._header), size - position)
+                    self._header += view[position:position + count]
+                    position += count
+                    if len(self._header) < FRAME_HEADER.size or not self._start_frame():
+                        continue
+
+                # Payload copied into its preallocated buffer
+                count = min(len(self._payload) - self._filled, size - position)
+                self._view[self._filled:self._filled + count] = view[position:position + count]
+                self._filled += count
+                position += count
+                if self._filled == len(self._payload):
+                    frames.append(self._finish_frame())
+        return frames
+
+class PackageSerializer:
+    # Packages to frames and back: codec, compression and framing (shared by Datapackage and AsyncDatapackage)
+    def __init__(self,
+        framing: str = "delimiter",
+        codec: Union[str, Any] = "json",
+        compression: Union[None, str, Compressor] = None,
+        delimiter: bytes = PACKAGE_DELIMITER,
+        accepted_codecs: Optional[Iterable[Union[str, Any]]] = None
+    ) -> None:
+        # Verify the framing mode and codec
+        if framing not in FRAMING_MODES:
+            raise ValueError(f"Unknown framing mode: {framing!r} (expected one of {FRAMING_MODES})")
+        self.codec = resolve_codec(codec)
+        if framing == "delimiter" and self.codec.identifier != JsonCodec.identifier:
+            raise ValueError(f"The {self.codec.name!r} codec requires the length_prefix framing (binary payloads may contain the delimiter)")
+        self.compressor: Optional[Compressor] = resolve_compressor(compression)
+        if framing == "delimiter" and self.compressor is not None:
+            raise ValueError("Compression requires the length_prefix framing (flags in the frame header)")
+
+        # Codecs decoded on reception (by default, only the own codec): frames of other codecs are dropped
+        accepted = [self.codec] if accepted_codecs is None else [resolve_codec(accepted_codec) for accepted_codec in accepted_codecs]
+        self.accepted_codecs: dict = {accepted_codec.identifier: accepted_codec for accepted_codec in accepted}
+
+        # Framer (both ends must use the same mode)
+        self.framing: str = framing
+        self.framer = DelimiterFramer(delimiter) if framing == "delimiter" else LengthPrefixFramer()
+
+    def encode(self, data_package: Any) -> bytes:
+        # The codec and compression are recorded in the frame header flags (length_prefix framing)
+        datapackage_serialized, flags = self.codec.encode(data_package), self.codec.identifier
+        if self.compressor is not None:
+            datapackage_serialized, compression_flags = self.compressor.compress(datapackage_serialized)
+            flags |= compression_flags
+        return self.framer.encode(datapackage_serialized, flags)
+
+    def decode(self, data_package: bytes, flags: int = 0) -> Any:
+        # Codec of the sender (delimiter framing: JSON), if accepted; ValueError, TypeError or RecursionError for invalid packages
+        codec = self.accepted_codecs.get(flags & CODEC_MASK)
+        if codec is None:
+            raise ValueError(f"Codec identifier not accepted: {flags & CODEC_MASK}")
+
+        if flags & COMPRESSION_MASK:
+            dictionary = self.compressor.dictionary if self.compressor is not None else None
+            data_package = decompress(data_package, flags, dictionary, self.framer.maximum_length)
+        return codec.decode(data_package)
@@ -0,0 +1,244 @@
+# Library import
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+from .datapackage import Datapackage
+
+# Classes definition
+class DatapackageHub:
+    # Class properties definition
+    READ_SIZE: int = 64 * 1024
+    ACCEPT_PAUSE: float = 0.1 # Listener pause after a descriptor limit error (EMFILE): the listener stays readable
+
+    def __init__(self,
+        framing: str = "delimiter",
+        write_timeout: Optional[float] = 5.0,
+        codec: Union[str, Any] = "json",
+        compression: Optional[Any] = None,
+        accepted_codecs: Optional[Iterable[Union[str, Any]]] = None,
+        queue_size: int = 0,
+        flow_control_window: Optional[int] = None,
+        credit_timeout: Optional[float] = None
+    ) -> None:
+        # Instance properties assignment
+        self.framing: str = framing
+        self.codec: Union[str, Any] = codec
+        self.compression: Optional[Any] = compression
+        self.accepted_codecs: Optional[Iterable[Union[str, Any]]] = accepted_codecs
+        self.write_timeout: Optional[float] = write_timeout
+
+        # Reception queues and flow control of every endpoint (full queues drop packages: the loop never waits)
+        self.queue_size: int = queue_size
+        self.flow_control_window: Optional[int] = flow_control_window
+        self.credit_timeout: Optional[float] = credit_timeout
+
+        # Registered sockets (one selector for every connection)
+        self._selector: selectors.BaseSelector = selectors.DefaultSelector()
+        self._connections: Dict[Datapackage, socket.socket] = {}
+
+        # Registrations from other threads, applied by the loop
+        self._pending_operations: deque = deque()
+        self._wakeup_receiver, self._wakeup_sender = socket.socketpair()
+        self._wakeup_receiver.setblocking(False)
+        self._wakeup_sender.setblocking(False)
+        self._selector.register(self._wakeup_receiver, selectors.EVENT_READ, ("wakeup",))
+
+        # Listeners paused until a time (monotonic) after a failed accept
+        self._paused_listeners: list = []
+
+        # Control
+        self._running: bool = False
+        self._closed: bool = False
+        self._loop_thread: Optional[threading.Thread] = None
+
+    # Private methods
+    def _submit(self, operation: Callable, *arguments) -> None:
+        self._pending_operations.append((operation, arguments))
+        try:
+            self._wakeup_sender.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass # Wakeup already pending
+
+    def _apply_pending_operations(self) -> None:
+        while self._pending_operations:
+            operation, arguments = self._pending_operations.popleft()
+            operation(*arguments)
+
+    @staticmethod
+    def _write_function(sock: socket.socket) -> Callable:
+        def write(data: bytes, *args, **kwargs) -> None:
+            try:
+                sock.sendall(data, *args, **kwargs)
+            except OSError:
+                # A timed out write may have sent part of a frame: the stream is unusable, the loop removes the connection
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                raise
+        return write
+
+    def _create_endpoint(self, sock: socket.socket, package_callback: Optional[callable]) -> Datapackage:
+        # Timeout mode: non-blocking descriptor, reads never wait once the socket is readable
+        sock.settimeout(self.write_timeout)
+        return Datapackage(
+            write_function=self._write_function(sock),
+            read_function=sock.recv,
+            framing=self.framing,
+            codec=self.codec,
+            compression=self.compression,
+            accepted_codecs=self.accepted_codecs,
+            queue_size=self.queue_size,
+            flow_control_window=self.flow_control_window,
+            credit_timeout=self.credit_timeout,
+            reader_thread=False,
+            package_callback=package_callback
+        )
+
+    def _add_connection(self, sock: socket.socket, endpoint: Datapackage, close_callback: Optional[callable]) -> None:
+        self._connections[endpoint] = sock
+        self._selector.register(sock, selectors.EVENT_READ, ("connection", endpoint, close_callback))
+
+    def _add_listener(self, sock: socket.socket, accept_callback: Optional[callable], package_callback: Optional[callable], close_callback: Optional[callable]) -> None:
+        sock.setblocking(False)
+        self._selector.register(sock, selectors.EVENT_READ, ("listener", accept_callback, package_callback, close_callback))
+
+    def _remove_connection(self, endpoint: Datapackage, close_callback: Optional[callable] = None, close: bool = True) -> None:
+        sock = self._connections.pop(endpoint, None)
+        if sock is None:
+            return None # Already removed
+
+        self._selector.unregister(sock)
+        endpoint.stop()
+        if close:
+            sock.close()
+        if close_callback is not None:
+            close_callback(endpoint)
+
+    def _pause_listener(self, listener: socket.socket) -> None:
+        key = self._selector.unregister(listener)
+        self._paused_listeners.append((time.monotonic() + self.ACCEPT_PAUSE, listener, key.data))
+
+    def _resume_listeners(self) -> Optional[float]:
+        # Listeners whose pause expired are registered again; seconds until the next one (None without paused listeners)
+        now, paused = time.monotonic(), []
+        for resume_at, listener, data in self._paused_listeners:
+            if resume_at <= now:
+                self._selector.register(listener, selectors.EVENT_READ, data)
+            else:
+                paused.append((resume_at, listener, data))
+        self._paused_listeners = paused
+        return min(resume_at for resume_at, listener, data in paused) - now if paused else None
+
+    def _accept_connections(self, listener: socket.socket, accept_callback: Optional[callable], package_callback: Optional[callable], close_callback: Optional[callable]) -> None:
+        while True:
+            try:
+                sock, address = listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return None
+            except OSError:
+                self._pause_listener(listener) # Descriptor limit reached: retried after a pause
+                return None
+
+            endpoint = self._create_endpoint(sock, package_callback)
+            self._add_connection(sock, endpoint, close_callback)
+            if accept_callback is not None:
+                accept_callback(endpoint, address)
+
+    def _read_connection(self, sock: socket.socket, endpoint: Datapackage, close_callback: Optional[callable]) -> None:
+        try:
+            chunk = sock.recv(self.READ_SIZE)
+        except (BlockingIOError, InterruptedError, socket.timeout):
+            return None # Spurious readiness
+        except OSError:
+            chunk = b""
+
+        # Closed by the peer, or stopped endpoint
+        if not chunk or not endpoint._feed(chunk):
+            self._remove_connection(endpoint, close_callback)
+
+    def _loop_routine(self) -> None:
+        while self._running:
+            self.poll()
+
+    # Public methods
+    def register(self, sock: socket.socket, package_callback: Optional[callable] = None, close_callback: Optional[callable] = None) -> Datapackage:
+        # Without package_callback, the packages are queued (receive_datapackage)
+        endpoint = self._create_endpoint(sock, package_callback)
+        self._submit(self._add_connection, sock, endpoint, close_callback)
+        return endpoint
+
+    def unregister(self, endpoint: Datapackage, close: bool = True) -> bool:
+        # With close=False, the socket is kept open for the caller
+        self._submit(self._remove_connection, endpoint, None, close)
+        return True
+
+    def listen(self,
+        sock: socket.socket,
+        accept_callback: Optional[callable] = None,
+        package_callback: Optional[callable] = None,
+        close_callback: Optional[callable] = None
+    ) -> bool:
+        # Accepted connections are registered by the loop: accept_callback(endpoint, address)
+        self._submit(self._add_listener, sock, accept_callback, package_callback, close_callback)
+        return True
+
+    def poll(self, timeout: Optional[float] = None) -> int:
+        # One iteration: registrations, then every ready socket
+        self._apply_pending_operations()
+        resume_delay = self._resume_listeners()
+        if resume_delay is not None:
+            timeout = resume_delay if timeout is None else min(timeout, resume_delay)
+        events = self._selector.select(timeout)
+        for key, mask in events:
+            kind = key.data[0]
+            try:
+                if kind == "connection":
+                    self._read_connection(key.fileobj, *key.data[1:])
+                elif kind == "listener":
+                    self._accept_connections(key.fileobj, *key.data[1:])
+                else:
+                    while self._wakeup_receiver.recv(4096):
+                        pass
+            except BlockingIOError:
+                pass
+            except Exception as Error:
+                pass
+                #traceback.print_exc()
+
+        self._apply_pending_operations()
+        return len(events)
+
+    def connections(self) -> list:
+        return list(self._connections)
+
+    def start(self) -> bool:
+        # Single loop thread for every connection (a stopped hub is not restarted)
+        if self._closed or (self._loop_thread is not None and self._loop_thread.is_alive()):
+            return False
+
+        self._running = True
+        self._loop_thread = threading.Thread(target=self._loop_routine, daemon=True)
+        self._loop_thread.start()
+        return True
+
+    def stop(self, close_connections: bool = True) -> bool:
+        # Final: the selector and the wakeup sockets are closed (with close_connections=False, the sockets stay open)
+        if self._closed:
+            return False
+        self._running = False
+        self._submit(lambda: None) # Wake up the loop
+        if self._loop_thread is not None and self._loop_thread.is_alive():
+            self._loop_thread.join(timeout=1.0)
+
+        for endpoint in list(self._connections):
+            self._remove_connection(endpoint, close=close_connections)
+        if self._loop_thread is None or not self._loop_thread.is_alive():
+            self._closed = True
+            self._selector.close()
+            self._wakeup_receiver.close()
+            self._wakeup_sender.close()
+        return True
@@ -0,0 +1,82 @@
+import asyncio
+import socket
+from datapackage import AsyncDatapackage, Datapackage, LengthPrefixFramer
+from datapackage.classes.framing import CONTROL_FLAG, CREDIT_FORMAT
+
+# --- Servidor de eco asíncrono ---
+async def echo_handler(dp: AsyncDatapackage) -> None:
+    async for packet in dp:
+        await dp.send_datapackage({"echo": packet})
+
+# --- Lógica del Test ---
+async def concurrent_clients(framing: str, clients: int) -> None:
+    server = await AsyncDatapackage.start_server(echo_handler, "127.0.0.1", 0, framing=framing)
+    port = server.sockets[0].getsockname()[1]
+
+    async def client(index: int) -> None:
+        async with await AsyncDatapackage.open_connection("127.0.0.1", port, framing=framing) as dp:
+            for seq in range(3):
+                assert await dp.send_datapackage({"client": index, "seq": seq, "data": "\x01\x02\x03\x01\x01\x01" if framing == "length_prefix" else "A"})
+                response = await dp.receive_datapackage(timeout=5)
+                assert response["echo"]["client"] == index and response["echo"]["seq"] == seq
+            assert not await dp.send_datapackage({"invalid": object()})
+
+    async with server:
+        await asyncio.gather(*(client(index) for index in range(clients)))
+
+def test_async_clients():
+    print("[*] Validando clientes asíncronos concurrentes...")
+    for framing in Datapackage.FRAMING_MODES:
+        asyncio.run(concurrent_clients(framing, 200))
+    print("[OK] Clientes asíncronos validados.")
+
+def test_threaded_interoperability():
+    print("[*] Validando la interoperabilidad con Datapackage (hilos)...")
+    async def scenario(framing: str) -> None:
+        server = await AsyncDatapackage.start_server(echo_handler, "127.0.0.1", 0, framing=framing)
+        port = server.sockets[0].getsockname()[1]
+        sock = socket.create_connection(("127.0.0.1", port))
+        sock.settimeout(0.1)
+        dp = Datapackage(write_function=sock.sendall, read_function=lambda: sock.recv(4096), framing=framing)
+        try:
+            async with server:
+                dp.send_datapackage({"id": 1, "msg": "Hola mundo"}) # sendall retorna None
+                response = await asyncio.to_thread(dp.receive_datapackage, 5)
+                assert response == {"echo": {"id": 1, "msg": "Hola mundo"}}
+        finally:
+            dp.stop()
+            sock.close()
+
+    for framing in Datapackage.FRAMING_MODES:
+        asyncio.run(scenario(framing))
+    print("[OK] Interoperabilidad validada.")
+
+def test_timeout_and_end_of_stream():
+    print("[*] Validando el tiempo limite y el fin del flujo...")
+    async def scenario() -> None:
+        reader = asyncio.StreamReader()
+        dp = AsyncDatapackage(reader, writer=None)
+        assert await dp.receive_datapackage(timeout=0.05) is None
+        reader.feed_data(b'{"id": 1}' + Datapackage.PACKAGE_DELIMITER + b'null' + Datapackage.PACKAGE_DELIMITER + b'{"id"')
+        reader.feed_eof()
+        assert [packet async for packet in dp] == [{"id": 1}, None] # null no termina la iteración
+        assert await dp.receive_datapackage() is None
+    asyncio.run(scenario())
+    print("[OK] Tiempo limite y fin del flujo validados.")
+
+def test_control_frames_skipped():
+    print("[*] Validando que las tramas de control se ignoran...")
+    async def scenario() -> None:
+        reader, framer = asyncio.StreamReader(), LengthPrefixFramer()
+        dp = AsyncDatapackage(reader, writer=None, framing="length_prefix")
+        reader.feed_data(framer.encode(CREDIT_FORMAT.pack(0x20202031), CONTROL_FLAG) + framer.encode(b'{"id": 1}')) # Credito: b"   1" (JSON valido)
+        reader.feed_eof()
+        assert [packet async for packet in dp] == [{"id": 1}]
+    asyncio.run(scenario())
+    print("[OK] Tramas de control ignoradas.")
+
+if __name__ == "__main__":
+    test_async_clients()
+    test_threaded_interoperability()
+    test_timeout_and_end_of_stream()
+    test_control_frames_skipped()
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+from datapackage import Datapackage, DelimiterFramer
+
+# --- Transporte simulado que cuenta las escrituras ---
+class CountingTransport:
+    def __init__(self):
+        self.writes = []
+        self.lock = threading.Lock()
+
+    def write(self, data: bytes, resource_id: int = None) -> bool:
+        with self.lock:
+            self.writes.append(data)
+        return True
+
+    def read(self) -> bytes:
+        return b""
+
+    def packets(self) -> list:
+        framer = DelimiterFramer()
+        return [json.loads(payload) for chunk in self.writes for flags, payload in framer.feed(chunk)]
+
+# --- Lógica del Test ---
+def test_send_many():
+    print("[*] Validando send_many...")
+    transport = CountingTransport()
+    dp = Datapackage(write_function=transport.write, read_function=transport.read, reader_thread=False)
+    assert dp.send_many([{"seq": seq} for seq in range(100)])
+    assert len(transport.writes) == 1 and transport.packets() == [{"seq": seq} for seq in range(100)]
+    assert not dp.send_many([{"seq": 1}, {"invalid": object()}]) and len(transport.writes) == 1
+    print("[OK] send_many validado.")
+
+def test_coalescing_writer():
+    print("[*] Validando el escritor con agrupación...")
+    transport = CountingTransport()
+    dp = Datapackage(write_function=transport.write, read_function=transport.read, reader_thread=False, coalesce_delay=0.005)
+
+    def producer(thread_id: int) -> None:
+        for seq in range(200):
+            assert dp.send_datapackage({"origin": thread_id, "seq": seq})
+
+    threads = [threading.Thread(target=producer, args=(thread_id,)) for thread_id in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert dp.flush()
+
+    packets = transport.packets()
+    assert len(packets) == 1000 and len(transport.writes) < 100
+    for thread_id in range(5): # Orden por productor
+        assert [packet["seq"] for packet in packets if packet["origin"] == thread_id] == list(range(200))
+
+    # Escritura directa con argumentos: las tramas pendientes se escriben antes
+    writes = len(transport.writes)
+    dp.send_datapackage({"seq": "pending"})
+    dp.send_datapackage({"seq": "with_arguments"}, resource_id=101)
+    assert [packet["seq"] for packet in transport.packets()[-2:]] == ["pending", "with_arguments"]
+    assert len(transport.writes) == writes + 2
+
+    # El tiempo de agrupación se respeta sin flush explícito, y stop escribe lo pendiente
+    dp.send_datapackage({"seq": "timed"})
+    time.sleep(0.05)
+    assert transport.packets()[-1] == {"seq": "timed"}
+    dp.send_datapackage({"seq": "last"})
+    dp.stop()
+    assert transport.packets()[-1] == {"seq": "last"}
+    print("[OK] Escritor con agrupación validado.")
+
+def test_coalesce_size():
+    print("[*] Validando la escritura por tamaño acumulado...")
+    transport = CountingTransport()
+    dp = Datapackage(write_function=transport.write, read_function=transport.read, reader_thread=False, coalesce_delay=10.0, coalesce_size=1024)
+    try:
+        for seq in range(100):
+            dp.send_datapackage({"seq": seq, "data": "A" * 50})
+        time.sleep(0.05)
+        assert len(transport.writes) >= 1 # Sin esperar los 10 segundos
+    finally:
+        dp.stop()
+    assert len(transport.packets()) == 100
+    print("[OK] Escritura por tamaño validada.")
+
+if __name__ == "__main__":
+    test_send_many()
+    test_coalescing_writer()
+    test_coalesce_size()
@@ -0,0 +1,114 @@
+import math
+import threading
+from datapackage import BinaryCodec, Datapackage, JsonCodec, MarshalCodec, register_codec
+from datapackage.classes.codec import CODEC_MASK
+
+# --- Transporte simulado (loopback) ---
+class LoopbackTransport:
+    def __init__(self):
+        self.wire_buffer = bytearray()
+        self.lock = threading.Lock()
+
+    def write(self, data: bytes) -> bool:
+        with self.lock:
+            self.wire_buffer += data
+        return True
+
+    def read(self) -> bytes:
+        with self.lock:
+            chunk = bytes(self.wire_buffer[:7]) # Lecturas fragmentadas
+            del self.wire_buffer[:7]
+            return chunk
+
+# --- Lógica del Test ---
+PAYLOAD = {
+    "id": 1024, "negative": -(2 ** 70), "ratio": 0.1, "infinite": math.inf, "active": True, "none": None,
+    "raw": bytes(range(256)), "text": "¡Hola, mundo!\x01\x02\x03\x01\x01\x01", "items": [1, [2.5, "tres"], {"nested": False}],
+}
+
+def test_binary_codecs():
+    print("[*] Validando los codecs binarios...")
+    for codec in (BinaryCodec(), MarshalCodec()):
+        assert codec.decode(codec.encode(PAYLOAD)) == PAYLOAD
+        assert codec.decode(codec.encode((1, 2))) in ([1, 2], (1, 2))
+        for invalid in ({"set": {1}}, object()):
+            try:
+                codec.encode(invalid)
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("Unsupported type encoded.")
+
+    # Datos corruptos o maliciosos: ValueError (nunca otras excepciones ni reservas enormes)
+    codec = BinaryCodec()
+    encoded = codec.encode(PAYLOAD)
+    for corrupt in (encoded[:-1], encoded + b"\x00", b"\x07\xff\xff\xff\xff\x0f", b"\x63", b"\x08\x01\x07\x00\x00", b"\x07" * 10000):
+        try:
+            codec.decode(corrupt)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Corrupt payload decoded: {corrupt[:10]!r}")
+    try:
+        MarshalCodec().decode(__import__("marshal").dumps(compile("1", "<test>", "eval")))
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Code object decoded.")
+    textual = {key: value for key, value in PAYLOAD.items() if key != "raw"}
+    assert len(codec.encode(textual)) < len(JsonCodec().encode(textual))
+    print("[OK] Codecs binarios validados.")
+
+def test_datapackage_codecs():
+    print("[*] Validando Datapackage con codecs por instancia...")
+    transport = LoopbackTransport()
+    sender = Datapackage(write_function=transport.write, read_function=lambda: b"", reader_thread=False, framing="length_prefix", codec="binary")
+    receiver = Datapackage(write_function=lambda data: True, read_function=transport.read, framing="length_prefix", accepted_codecs=("json", "binary"))
+    try:
+        # El receptor decodifica con el codec de la cabecera de cada trama, si lo acepta
+        assert sender.send_datapackage(PAYLOAD)
+        assert receiver.send_datapackage({"json": True})
+        assert receiver.receive_datapackage(timeout=2) == PAYLOAD
+        assert not sender.send_datapackage({"invalid": {1, 2}})
+    finally:
+        receiver.stop()
+
+    # Por defecto solo se acepta el codec propio: las tramas marshal se descartan en un receptor JSON
+    transport = LoopbackTransport()
+    marshal_sender = Datapackage(write_function=transport.write, read_function=lambda: b"", reader_thread=False, framing="length_prefix", codec="marshal")
+    receiver = Datapackage(write_function=lambda data: True, read_function=lambda: b"", reader_thread=False, framing="length_prefix")
+    binary_sender = Datapackage(write_function=transport.write, read_function=lambda: b"", reader_thread=False, framing="length_prefix", codec="binary")
+    assert marshal_sender.send_datapackage({"x": (1, 2)}) and binary_sender.send_datapackage({"binary": True})
+    receiver._feed(bytes(transport.wire_buffer))
+    receiver._feed(receiver._serializer.encode({"json": True}))
+    assert receiver.receive_datapackage(timeout=0.1) == {"json": True} and receiver._package_queue.empty()
+
+    # Los codecs binarios requieren el framing de longitud prefijada
+    for codec in ("binary", "marshal"):
+        try:
+            Datapackage(write_function=transport.write, read_function=transport.read, reader_thread=False, codec=codec)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Binary codec accepted with delimiter framing.")
+
+    # Codecs propios: registrados por identificador
+    class UpperJsonCodec(JsonCodec):
+        identifier = CODEC_MASK
+        name = "upper_json"
+        def encode(self, data_package):
+            return super().encode(data_package).upper()
+
+    register_codec(UpperJsonCodec())
+    transport = LoopbackTransport()
+    receiver = Datapackage(write_function=transport.write, read_function=transport.read, framing="length_prefix", codec="upper_json")
+    try:
+        assert receiver.send_datapackage({"text": "hola"})
+        assert receiver.receive_datapackage(timeout=2) == {"TEXT": "HOLA"}
+    finally:
+        receiver.stop()
+    print("[OK] Codecs por instancia validados.")
+
+if __name__ == "__main__":
+    test_binary_codecs()
+    test_datapackage_codecs()
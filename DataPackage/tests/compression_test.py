@@ -0,0 +1,107 @@
+import json
+import threading
+import zlib
+from datapackage import Compressor, Datapackage, dictionary_from_samples
+from datapackage.classes.compression import COMPRESSION_MASK, decompress
+
+# --- Transporte simulado (loopback) ---
+class LoopbackTransport:
+    def __init__(self):
+        self.wire_buffer = bytearray()
+        self.sent = 0
+        self.lock = threading.Lock()
+
+    def write(self, data: bytes) -> bool:
+        with self.lock:
+            self.wire_buffer += data
+            self.sent += len(data)
+        return True
+
+    def read(self) -> bytes:
+        with self.lock:
+            chunk = bytes(self.wire_buffer[:4096])
+            del self.wire_buffer[:4096]
+            return chunk
+
+def telemetry(seq: int) -> dict:
+    return {"device": "sensor-node-17", "type": "TELEMETRY", "seq": seq, "temperature": 21.5 + seq % 7, "humidity": 40 + seq % 11, "status": "OK"}
+
+# --- Lógica del Test ---
+def test_compressor():
+    print("[*] Validando la compresión por trama...")
+    large = json.dumps([telemetry(seq) for seq in range(200)]).encode("UTF-8")
+    for method in Compressor.METHODS:
+        compressor = Compressor(method, threshold=1024)
+        compressed, flags = compressor.compress(large)
+        assert flags & COMPRESSION_MASK and len(compressed) < len(large) // 5
+        assert compressor.decompress(compressed, flags, len(large)) == large
+
+    # Por debajo del umbral, o sin ganancia: sin comprimir
+    compressor = Compressor(threshold=1024)
+    assert compressor.compress(b'{"seq": 1}') == (b'{"seq": 1}', 0)
+    incompressible = bytes(range(256)) * 8
+    assert compressor.compress(zlib.compress(incompressible))[1] == 0
+
+    # Bombas de compresión y datos corruptos: ValueError
+    compressed, flags = compressor.compress(large)
+    for payload, maximum_length in ((compressed, len(large) - 1), (compressed[:-5], len(large)), (b"garbage", len(large))):
+        try:
+            decompress(payload, flags, None, maximum_length)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid compressed payload accepted.")
+    print("[OK] Compresión por trama validada.")
+
+def test_preset_dictionary():
+    print("[*] Validando el diccionario compartido...")
+    dictionary = dictionary_from_samples([json.dumps(telemetry(seq)).encode("UTF-8") for seq in range(50)])
+    small = json.dumps(telemetry(1000)).encode("UTF-8")
+    plain, _ = Compressor(threshold=0).compress(small)
+    shared = Compressor(threshold=0, dictionary=dictionary)
+    compressed, flags = shared.compress(small)
+    assert len(compressed) < len(plain) and len(compressed) < len(small) // 2
+    assert shared.decompress(compressed, flags, 1024) == small
+
+    # Sin el diccionario, el receptor descarta la trama
+    for dictionary_candidate in (None, b"other dictionary"):
+        try:
+            decompress(compressed, flags, dictionary_candidate, 1024)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Frame decompressed without its dictionary.")
+    try:
+        Compressor("lzma", dictionary=dictionary)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("lzma accepted a preset dictionary.")
+    print("[OK] Diccionario compartido validado.")
+
+def test_datapackage_compression():
+    print("[*] Validando Datapackage con compresión...")
+    dictionary = dictionary_from_samples([json.dumps(telemetry(seq)).encode("UTF-8") for seq in range(50)])
+    for compression in ("zlib", "lzma", Compressor(threshold=64, dictionary=dictionary)):
+        transport = LoopbackTransport()
+        dp = Datapackage(write_function=transport.write, read_function=transport.read, framing="length_prefix", compression=compression)
+        try:
+            packets = [telemetry(seq) for seq in range(20)] + [{"batch": [telemetry(seq) for seq in range(200)]}]
+            for packet in packets:
+                assert dp.send_datapackage(packet)
+            assert [dp.receive_datapackage(timeout=2) for _ in packets] == packets
+        finally:
+            dp.stop()
+
+    try:
+        Datapackage(write_function=transport.write, read_function=transport.read, reader_thread=False, compression="zlib")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Compression accepted with delimiter framing.")
+    print("[OK] Datapackage con compresión validado.")
+
+if __name__ == "__main__":
+    test_compressor()
+    test_preset_dictionary()
+    test_datapackage_compression()
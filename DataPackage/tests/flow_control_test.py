@@ -0,0 +1,162 @@
+import threading
+import time
+from datapackage import Datapackage
+from datapackage.classes.framing import CONTROL_FLAG
+
+# --- Transporte simulado (par de extremos conectados) ---
+class Wire:
+    def __init__(self):
+        self.buffer = bytearray()
+        self.lock = threading.Lock()
+
+    def write(self, data: bytes) -> bool:
+        with self.lock:
+            self.buffer += data
+        return True
+
+    def read(self) -> bytes:
+        with self.lock:
+            chunk = bytes(self.buffer[:4096])
+            del self.buffer[:4096]
+            return chunk
+
+    def pending(self) -> int:
+        with self.lock:
+            return len(self.buffer)
+
+def connected_pair(**kwargs) -> tuple:
+    forward, backward = Wire(), Wire()
+    sender = Datapackage(write_function=forward.write, read_function=backward.read, framing="length_prefix", **kwargs)
+    receiver = Datapackage(write_function=backward.write, read_function=forward.read, framing="length_prefix", **kwargs)
+    return sender, receiver, forward
+
+# --- Lógica del Test ---
+def test_bounded_queue():
+    print("[*] Validando la cola de recepción acotada...")
+    sender, receiver, forward = connected_pair(queue_size=4)
+    try:
+        # El hilo lector deja de leer con la cola llena: el resto queda en el transporte
+        packets = [{"seq": seq, "data": "x" * 1024} for seq in range(50)]
+        for packet in packets:
+            assert sender.send_datapackage(packet)
+        time.sleep(0.2)
+        assert receiver._package_queue.qsize() == 4 and forward.pending() > 40 * 1024
+
+        assert [receiver.receive_datapackage(timeout=2) for _ in packets] == packets
+    finally:
+        sender.stop()
+        receiver.stop()
+    print("[OK] Cola de recepción acotada validada.")
+
+def test_credits_fail_fast():
+    print("[*] Validando los créditos (sin espera)...")
+    sender, receiver, forward = connected_pair(flow_control_window=4, credit_timeout=0)
+    try:
+        assert all(sender.send_datapackage({"seq": seq}) for seq in range(4))
+        assert not sender.send_datapackage({"seq": 4}) # Sin créditos
+        assert not sender.send_many([{"seq": 4}])
+
+        # Consumir media ventana devuelve los créditos al emisor
+        assert [receiver.receive_datapackage(timeout=2) for _ in range(2)] == [{"seq": 0}, {"seq": 1}]
+        deadline = time.monotonic() + 2
+        while not sender.send_datapackage({"seq": 4}):
+            assert time.monotonic() < deadline, "Credits not granted."
+            time.sleep(0.01)
+        assert [receiver.receive_datapackage(timeout=2) for _ in range(3)] == [{"seq": 2}, {"seq": 3}, {"seq": 4}]
+    finally:
+        sender.stop()
+        receiver.stop()
+    print("[OK] Créditos (sin espera) validados.")
+
+def test_credits_blocking():
+    print("[*] Validando los créditos con productor rápido y consumidor lento...")
+    window = 8
+    sender, receiver, forward = connected_pair(flow_control_window=window)
+    received, maximum_backlog = [], 0
+    try:
+        producer = threading.Thread(target=lambda: sender.send_many([{"seq": seq} for seq in range(100)] + [{"seq": 100}]))
+        producer.start()
+        for _ in range(101):
+            maximum_backlog = max(maximum_backlog, receiver._package_queue.qsize())
+            received.append(receiver.receive_datapackage(timeout=2))
+            time.sleep(0.001)
+        producer.join(timeout=2)
+
+        # Memoria acotada: nunca hay más paquetes en vuelo que la ventana
+        assert received == [{"seq": seq} for seq in range(101)]
+        assert maximum_backlog <= window and receiver.dropped == 0
+
+        # Detener el extremo libera a los emisores en espera
+        blocked = threading.Thread(target=lambda: [sender.send_datapackage({"seq": seq}) for seq in range(window + 1)])
+        blocked.start()
+        time.sleep(0.1)
+        sender.stop()
+        blocked.join(timeout=2)
+        assert not blocked.is_alive()
+    finally:
+        sender.stop()
+        receiver.stop()
+
+    try:
+        Datapackage(write_function=forward.write, read_function=forward.read, reader_thread=False, flow_control_window=4)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Flow control accepted with delimiter framing.")
+    print("[OK] Créditos con productor rápido y consumidor lento validados.")
+
+def test_credits_on_write_errors():
+    print("[*] Validando los créditos ante errores de escritura...")
+    writes, failures = [], [OSError("Connection reset"), False]
+    def write(data: bytes, *args, **kwargs):
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        writes.append((data, args, kwargs))
+        return True
+
+    forward = Wire()
+    dp = Datapackage(write_function=write, read_function=forward.read, framing="length_prefix", flow_control_window=2, credit_timeout=0)
+    try:
+        # Los créditos de las tramas no escritas (excepción o False) se devuelven
+        try:
+            dp.send_datapackage({"seq": 0}, "destination")
+        except OSError:
+            pass
+        else:
+            raise AssertionError("Transport error not propagated.")
+        assert dp._credits == 2 and dp.send_many([{"seq": 0}]) is False and dp._credits == 2
+
+        # La concesión de créditos usa los argumentos de escritura del último envío
+        assert dp.send_many([{"seq": 0}, {"seq": 1}], "destination", flags=1) and dp._credits == 0
+        forward.write(b"".join(dp._serialize({"seq": seq}) for seq in range(2)))
+        assert [dp.receive_datapackage(timeout=2) for _ in range(2)] == [{"seq": 0}, {"seq": 1}]
+        data, args, kwargs = writes[-1]
+        assert dp._framer.feed(data)[0][0] & CONTROL_FLAG and args == ("destination",) and kwargs == {"flags": 1}
+    finally:
+        dp.stop()
+
+    # Envío agrupado (coalesce_delay): los créditos de las tramas no escritas por el hilo escritor también se devuelven
+    for failure in (OSError("Connection reset"), False):
+        def failing_write(data: bytes, failure=failure):
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        dp = Datapackage(write_function=failing_write, read_function=forward.read, framing="length_prefix", flow_control_window=2, credit_timeout=0, coalesce_delay=0.005)
+        try:
+            assert dp.send_datapackage({"seq": 0}) and dp.send_datapackage({"seq": 1})
+            deadline = time.monotonic() + 2
+            while dp._credits != 2:
+                assert time.monotonic() < deadline, "Credits of unwritten coalesced frames lost."
+                time.sleep(0.01)
+        finally:
+            dp.stop()
+    print("[OK] Créditos ante errores de escritura validados.")
+
+if __name__ == "__main__":
+    test_bounded_queue()
+    test_credits_fail_fast()
+    test_credits_blocking()
+    test_credits_on_write_errors()
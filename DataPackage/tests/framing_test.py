@@ -0,0 +1,115 @@
+import json
+import random
+import threading
+from datapackage import Datapackage, DelimiterFramer, LengthPrefixFramer
+from datapackage.classes.framing import FRAME_HEADER, PackageSerializer
+
+# --- Transporte simulado con fragmentación ---
+class FragmentedTransport:
+    def __init__(self, maximum_chunk: int = 10):
+        self.wire_buffer = bytearray()
+        self.maximum_chunk = maximum_chunk
+        self.lock = threading.Lock()
+
+    def write(self, data: bytes) -> bool:
+        with self.lock:
+            self.wire_buffer += data
+        return True
+
+    def read(self) -> bytes:
+        with self.lock:
+            size = random.randint(1, self.maximum_chunk)
+            chunk = bytes(self.wire_buffer[:size])
+            del self.wire_buffer[:size]
+            return chunk
+
+# --- Lógica del Test ---
+def split(data: bytes, maximum_chunk: int) -> list:
+    chunks, position = [], 0
+    while position < len(data):
+        size = random.randint(1, maximum_chunk)
+        chunks.append(data[position:position + size])
+        position += size
+    return chunks
+
+def test_framers():
+    print("[*] Validando los framers con fragmentación...")
+    payloads = [b'{"id": 1}', Datapackage.PACKAGE_DELIMITER * 3, bytes(range(256)) * 40, b""]
+    for framer in (DelimiterFramer(), LengthPrefixFramer()):
+        stream = b"".join(framer.encode(payload) for payload in payloads if payload)
+        frames = [payload for chunk in split(stream, 7) for flags, payload in framer.feed(chunk)]
+        if isinstance(framer, LengthPrefixFramer):
+            assert frames == [payload for payload in payloads if payload]
+        else:
+            assert frames[0] == payloads[0] # El delimitador en el contenido corrompe el modo compatible
+    print("[OK] Framers validados.")
+
+def test_length_prefix_resynchronization():
+    print("[*] Validando la resincronización tras cabeceras corruptas...")
+    framer = LengthPrefixFramer(maximum_length=1024)
+    stream = b"\xffDXgarbage" + framer.encode(b'{"id": 2}', flags=3) + FRAME_HEADER.pack(b"DP", 1, 0, 4096) + framer.encode(b'{"id": 3}')
+    frames = framer.feed(stream)
+    assert frames == [(3, bytearray(b'{"id": 2}')), (0, bytearray(b'{"id": 3}'))]
+    assert framer.discarded == 10 + FRAME_HEADER.size
+    try:
+        framer.encode(bytes(2048))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Payload larger than the maximum frame length encoded.")
+    print("[OK] Resincronización validada.")
+
+def test_datapackage_length_prefix():
+    print("[*] Validando Datapackage con framing de longitud prefijada...")
+    transport = FragmentedTransport()
+    dp = Datapackage(write_function=transport.write, read_function=transport.read, framing="length_prefix")
+    try:
+        payloads = [{"seq": index, "data": Datapackage.PACKAGE_DELIMITER.decode("latin-1") * index} for index in range(20)]
+        for payload in payloads:
+            assert dp.send_datapackage(payload)
+        received = [dp.receive_datapackage(timeout=5) for _ in payloads]
+        assert received == json.loads(json.dumps(payloads))
+    finally:
+        dp.stop()
+
+    try:
+        Datapackage(write_function=transport.write, read_function=transport.read, framing="unknown")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unknown framing mode accepted.")
+    print("[OK] Datapackage con framing de longitud prefijada validado.")
+
+def test_package_serializer():
+    print("[*] Validando el serializador compartido (codec, compresión y framing)...")
+    package = {"seq": 1, "data": "A" * 4096}
+    for options in ({}, {"framing": "length_prefix", "codec": "binary", "compression": "zlib"}):
+        serializer = PackageSerializer(**options)
+        frames = serializer.framer.feed(serializer.encode(package))
+        assert [serializer.decode(payload, flags) for flags, payload in frames] == [package]
+    try:
+        PackageSerializer(codec="binary")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Binary codec accepted with delimiter framing.")
+    print("[OK] Serializador compartido validado.")
+
+def test_reception_buffer():
+    print("[*] Validando los datos remanentes (_reception_buffer)...")
+    for framing in Datapackage.FRAMING_MODES:
+        dp = Datapackage(write_function=lambda data: True, read_function=lambda: b"", framing=framing, reader_thread=False)
+        frame = dp._framer.encode(b'{"seq": 1}')
+        for split in (0, 3, len(frame) - 2):
+            assert dp._feed(frame + frame[:split]) and dp._reception_buffer == frame[:split]
+            dp._feed(frame[split:])
+        assert dp._reception_buffer == b"" and dp.receive_datapackage(timeout=1) == {"seq": 1}
+        dp.stop()
+    print("[OK] Datos remanentes validados.")
+
+if __name__ == "__main__":
+    test_framers()
+    test_length_prefix_resynchronization()
+    test_datapackage_length_prefix()
+    test_package_serializer()
+    test_reception_buffer()
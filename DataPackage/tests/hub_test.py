@@ -0,0 +1,171 @@
+import errno
+import json
+import os
+import socket
+import threading
+import time
+from datapackage import Datapackage, DatapackageHub, DelimiterFramer
+
+# --- Lógica del Test ---
+def test_hub_server():
+    print("[*] Validando DatapackageHub con cientos de clientes...")
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(512)
+    port = listener.getsockname()[1]
+
+    # Respuesta desde el hilo del hub (callback por paquete)
+    closed = []
+    hub = DatapackageHub()
+    hub.listen(
+        listener,
+        package_callback=lambda endpoint, packet: endpoint.send_datapackage({"status": "ACK", "received_at": packet.get("id")}),
+        close_callback=closed.append
+    )
+    threads_before = threading.active_count()
+    hub.start()
+
+    clients = [socket.create_connection(("127.0.0.1", port)) for _ in range(300)]
+    framer = DelimiterFramer()
+    try:
+        assert threading.active_count() == threads_before + 1 # Solo el hilo del hub
+        for index, client in enumerate(clients):
+            client.sendall(framer.encode(json.dumps({"id": index}).encode("UTF-8")))
+
+        for index, client in enumerate(clients):
+            frames = []
+            while not frames:
+                frames = framer.feed(client.recv(4096))
+            assert json.loads(frames[0][1]) == {"status": "ACK", "received_at": index}
+
+        # Cierre por parte del cliente
+        clients[0].close()
+        deadline = time.time() + 5
+        while not closed and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(closed) == 1 and len(hub.connections()) == 299
+    finally:
+        hub.stop()
+        for client in clients:
+            client.close()
+        listener.close()
+    assert not hub.connections()
+    print("[OK] DatapackageHub validado.")
+
+def test_hub_queue_endpoint():
+    print("[*] Validando endpoints registrados con cola de paquetes...")
+    left, right = socket.socketpair()
+    hub = DatapackageHub(framing="length_prefix")
+    endpoint = hub.register(left)
+    peer = Datapackage(write_function=right.sendall, read_function=lambda: right.recv(4096), framing="length_prefix", reader_thread=False)
+    try:
+        peer.send_datapackage({"id": 1, "data": "\x01\x02\x03\x01\x01\x01"})
+        deadline = time.time() + 5
+        while endpoint._package_queue.empty() and time.time() < deadline:
+            hub.poll(timeout=0.1)
+        assert endpoint.receive_datapackage(timeout=1) == {"id": 1, "data": "\x01\x02\x03\x01\x01\x01"}
+        hub.unregister(endpoint)
+        hub.poll(timeout=0)
+        assert not hub.connections()
+    finally:
+        hub.stop()
+        left.close()
+        right.close()
+    print("[OK] Endpoints con cola validados.")
+
+def test_hub_resources():
+    print("[*] Validando la liberación de sockets y descriptores del hub...")
+    def open_descriptors() -> int:
+        return len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else 0
+
+    descriptors = open_descriptors()
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(64)
+    closed, received = [], []
+    def callback(endpoint, packet):
+        received.append(packet)
+        packet.get("id") # AttributeError con paquetes que no son diccionarios
+    hub = DatapackageHub()
+    hub.listen(listener, package_callback=callback, close_callback=closed.append)
+    hub.start()
+    try:
+        # Los errores del callback no descartan las demás tramas del bloque
+        framer = DelimiterFramer()
+        for _ in range(20):
+            client = socket.create_connection(listener.getsockname())
+            client.sendall(b"".join(framer.encode(json.dumps(packet).encode("UTF-8")) for packet in ([1], {"id": 2}, None)))
+            client.close()
+        deadline = time.time() + 5
+        while len(closed) < 20 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(closed) == 20 and received == [[1], {"id": 2}, None] * 20
+    finally:
+        hub.stop()
+        listener.close()
+    assert open_descriptors() == descriptors # Sockets cerrados al desconectarse, selector y socketpair al detener
+    print("[OK] Sockets y descriptores liberados.")
+
+def test_hub_write_timeout():
+    print("[*] Validando el cierre tras una escritura con tiempo límite agotado...")
+    left, right = socket.socketpair()
+    hub = DatapackageHub(framing="length_prefix", write_timeout=0.05)
+    endpoint = hub.register(left)
+    try:
+        hub.poll(timeout=0)
+        try:
+            endpoint.send_datapackage({"data": "A" * (16 * 1024 * 1024)}) # El extremo remoto no lee
+        except OSError:
+            pass
+        else:
+            raise AssertionError("Timed out write not reported.")
+
+        # Trama posiblemente incompleta: la conexión se cierra
+        deadline = time.time() + 5
+        while hub.connections() and time.time() < deadline:
+            hub.poll(timeout=0.1)
+        assert not hub.connections() and left.fileno() == -1
+    finally:
+        hub.stop()
+        right.close()
+    print("[OK] Conexión cerrada tras la escritura incompleta.")
+
+def test_hub_descriptor_limit():
+    print("[*] Validando la pausa del listener sin descriptores disponibles (EMFILE)...")
+    attempts = []
+    class ExhaustedListener(socket.socket):
+        def accept(self):
+            attempts.append(time.monotonic())
+            raise OSError(errno.EMFILE, "Too many open files")
+
+    listener = ExhaustedListener(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    client = socket.create_connection(listener.getsockname())
+    hub = DatapackageHub()
+    hub.listen(listener)
+    try:
+        # El listener sigue listo: se pausa en lugar de consumir la CPU
+        start = time.monotonic()
+        polls = 0
+        while time.monotonic() - start < hub.ACCEPT_PAUSE / 2:
+            hub.poll(timeout=1)
+            polls += 1
+        assert polls < 10 and len(attempts) == 1 and len(hub._paused_listeners) == 1
+
+        # Reintentado tras la pausa
+        time.sleep(hub.ACCEPT_PAUSE)
+        hub.poll(timeout=0)
+        assert len(attempts) == 2 and len(hub._paused_listeners) == 1
+    finally:
+        hub.stop()
+        client.close()
+        listener.close()
+    print("[OK] Listener pausado sin descriptores disponibles.")
+
+if __name__ == "__main__":
+    test_hub_server()
+    test_hub_queue_endpoint()
+    test_hub_resources()
+    test_hub_write_timeout()
+    test_hub_descriptor_limit()
@@ -0,0 +1,111 @@
+import socket
+import statistics
+import threading
+import time
+from datapackage import Datapackage
+
+# --- Lógica del Test ---
+def echo_routine(sock: socket.socket) -> None:
+    # Eco de bytes crudos: los paquetes regresan sin cambios
+    while True:
+        try:
+            data = sock.recv(65536)
+        except OSError:
+            return
+        if not data:
+            return
+        sock.sendall(data)
+
+def round_trips(dp: Datapackage, count: int, idle: float) -> list:
+    times = []
+    for seq in range(count):
+        time.sleep(idle) # Inactividad seguida de una ráfaga
+        start = time.perf_counter()
+        dp.send_datapackage({"seq": seq})
+        assert dp.receive_datapackage(timeout=2) == {"seq": seq}
+        times.append(time.perf_counter() - start)
+    return times
+
+def test_parameters_not_blocked_by_read():
+    print("[*] Validando la actualización de parámetros durante una lectura bloqueante...")
+    release = threading.Event()
+    def blocking_read(*args, **kwargs) -> bytes:
+        release.wait(2)
+        return b""
+
+    dp = Datapackage(write_function=lambda data: True, read_function=blocking_read)
+    try:
+        time.sleep(0.05) # El lector queda bloqueado en la lectura
+        start = time.perf_counter()
+        dp.update_reception_parameters(102, buffer_limit=4096)
+        assert time.perf_counter() - start < 0.1
+    finally:
+        release.set()
+        dp.stop()
+    print("[OK] Parámetros actualizados sin esperar la lectura.")
+
+def test_readiness_detection():
+    print("[*] Validando la detección del descriptor de disponibilidad...")
+    class BufferedSocket(socket.socket):
+        pass # Como ssl.SSLSocket: datos en memoria que select() no detecta
+
+    left, right = socket.socketpair()
+    right.close() # Lecturas sin bloqueo (fin de flujo)
+    buffered = BufferedSocket(fileno=socket.dup(left.fileno()))
+    reader = left.makefile("rb")
+    try:
+        for read_function, detected in ((left.recv, True), (buffered.recv, False), (reader.read1, False)):
+            dp = Datapackage(write_function=lambda data: True, read_function=read_function, read_arguments=(4096,))
+            assert (dp._readiness_selector is not None) == detected
+            dp.stop()
+    finally:
+        for resource in (reader, buffered, left):
+            resource.close()
+    print("[OK] Descriptor detectado solo en sockets planos.")
+
+def test_round_trip_latency():
+    print("[*] Validando la latencia de ida y vuelta tras inactividad...")
+    limits = {"readiness": 0.005, "non_blocking": 0.005, "backoff": Datapackage.IDLE_BACKOFF_MAXIMUM + 0.005, "blocking": 0.005}
+    for mode, limit in limits.items():
+        left, right = socket.socketpair()
+        threading.Thread(target=echo_routine, args=(right,), daemon=True).start()
+        if mode == "readiness":
+            dp = Datapackage(write_function=left.sendall, read_function=left.recv, read_arguments=(65536,))
+        elif mode in ("non_blocking", "backoff"):
+            left.setblocking(False)
+            def read() -> bytes:
+                try:
+                    return left.recv(65536)
+                except BlockingIOError:
+                    return b""
+            def write(data: bytes) -> bool:
+                left.sendall(data) # Paquetes pequeños: no superan el buffer del socket
+                return True
+            # Sin descriptor de disponibilidad: espera adaptativa entre lecturas vacías
+            dp = Datapackage(write_function=write, read_function=read, readiness=left if mode == "non_blocking" else None)
+        else:
+            dp = Datapackage(write_function=left.sendall, read_function=lambda: left.recv(65536))
+
+        try:
+            median = statistics.median(round_trips(dp, 20, idle=0.02))
+            print(f"    [{mode}] mediana: {median * 1000:.3f} ms")
+            assert median < limit # Antes: ~10 ms por la espera fija
+        finally:
+            left.shutdown(socket.SHUT_RDWR)
+            dp.stop()
+            left.close()
+            right.close()
+    print("[OK] Latencia validada.")
+
+def test_idle_backoff():
+    print("[*] Validando la espera adaptativa...")
+    dp = Datapackage(write_function=lambda data: True, read_function=lambda: b"", reader_thread=False)
+    delays = [dp._idle_delay(empty_reads) for empty_reads in range(1, 20)]
+    assert delays[0] == 0.0 and delays == sorted(delays) and delays[-1] == Datapackage.IDLE_BACKOFF_MAXIMUM
+    print("[OK] Espera adaptativa validada.")
+
+if __name__ == "__main__":
+    test_parameters_not_blocked_by_read()
+    test_readiness_detection()
+    test_round_trip_latency()
+    test_idle_backoff()
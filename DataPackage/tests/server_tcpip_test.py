@@ -1,39 +1,41 @@
 import socket
-from datapackage import Datapackage
+import time
+from datapackage import DatapackageHub
 
 def receptor_generico():
     # Configuración de Socket estándar
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     sock.bind(('127.0.0.1', 9999))
-    sock.listen(1)
+    sock.listen(512)
     
     print("[*] Receptor listo. Esperando flujo de bytes en el puerto 9999...")
-    conn, addr = sock.accept()
-    
-    # Inyectamos el socket en nuestra librería
-    dp = Datapackage(
-        write_function=conn.sendall, 
-        read_function=lambda: conn.recv(4096)
-    )
+
+    # Un único hilo (el del hub) atiende a todos los emisores
+    hub = DatapackageHub()
+    last_activity = [time.time()]
+
+    def on_connect(dp, addr):
+        print(f"[RECEPTOR] Conexión aceptada de {addr}")
+
+    def on_packet(dp, paquete):
+        last_activity[0] = time.time()
+        print(f"[RECEPTOR] Objeto recibido: {paquete}")
+
+        # Confirmación genérica
+        dp.send_datapackage({"status": "ACK", "received_at": paquete.get("id")})
+
+    hub.listen(sock, accept_callback=on_connect, package_callback=on_packet)
 
     try:
-        while True:
-            # Recibimos el paquete (bloqueante hasta que llegue uno)
-            paquete = dp.receive_datapackage(timeout=20)
-            if not paquete: break
-            
-            print(f"[RECEPTOR] Objeto recibido de {addr}: {paquete}")
-            
-            # Confirmación genérica
-            dp.send_datapackage({"status": "ACK", "received_at": paquete.get("id")})
-            
+        # Finaliza tras 20 segundos sin paquetes
+        while time.time() - last_activity[0] < 20:
+            hub.poll(timeout=1)
     except KeyboardInterrupt:
         pass
     finally:
-        dp.stop()
-        conn.close()
+        hub.stop()
         sock.close()
 
 if __name__ == "__main__":
-    receptor_generico()
\ No newline at end of file
+    receptor_generico()
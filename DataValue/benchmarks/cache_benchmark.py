@@ -0,0 +1,31 @@
+# Library import
+import timeit
+from datavalue import ComplexData, PrimitiveData, SchemaCache
+
+# Documents definition
+def build_schema(fields: int) -> ComplexData:
+    Phone = PrimitiveData(data_type=str, value=None, name="Phone", minimum_length=7, maximum_length=16, regular_expression=r"^\+[1-9]\d{6,14}$", data_class=True)
+    return ComplexData(data_type=dict, value=None, name="Settings", possible_values={
+        f"FIELD_{number}": [Phone, PrimitiveData(data_type=int, value=None, minimum_size=0, maximum_size=number, data_class=True)]
+        for number in range(fields)
+    }, data_class=True)
+
+# Benchmark execution
+def run(fields: int = 50, number: int = 200) -> dict:
+    text = build_schema(fields).to_json()
+    data = build_schema(fields).to_dict()
+    cache = SchemaCache()
+    results = {
+        "from_json_ms": min(timeit.repeat(lambda: ComplexData.from_json(text), repeat=3, number=number)) / number * 1000,
+        "from_json_cached_ms": min(timeit.repeat(lambda: ComplexData.from_json(text, cache=cache), repeat=3, number=number)) / number * 1000,
+        "from_dict_ms": min(timeit.repeat(lambda: ComplexData.from_dict(data), repeat=3, number=number)) / number * 1000,
+        "from_dict_cached_ms": min(timeit.repeat(lambda: ComplexData.from_dict(data, cache=cache), repeat=3, number=number)) / number * 1000,
+    }
+    results["stats"] = cache.stats()
+    return results
+
+if __name__ == "__main__":
+    results = run()
+    print(f"[*] from_json: {results['from_json_ms']:8.3f} ms | cached {results['from_json_cached_ms']:8.4f} ms")
+    print(f"[*] from_dict: {results['from_dict_ms']:8.3f} ms | cached {results['from_dict_cached_ms']:8.4f} ms")
+    print(f"[*] Cache: {results['stats']}")
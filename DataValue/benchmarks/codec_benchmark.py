@@ -0,0 +1,42 @@
+# Library import
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Documents definition
+def build_schema(fields: int) -> ComplexData:
+    Phone = PrimitiveData(data_type=str, value=None, name="Phone", minimum_length=7, maximum_length=15, regular_expression=r"^\+[1-9]\d{6,14}$", data_class=True)
+    return ComplexData(data_type=dict, value=None, name="Directory", possible_values={
+        f"FIELD_{number}": [Phone, PrimitiveData(data_type=int, value=None, minimum_size=0, maximum_size=number, data_class=True)]
+        for number in range(fields)
+    }, data_class=True)
+
+def build_value(size: int) -> PrimitiveData:
+    return PrimitiveData(data_type=bytes, value=bytes(range(256)) * (size // 256), name="Blob")
+
+# Benchmark execution
+def measure(instance, number: int = 20) -> dict:
+    schema_class = type(instance)
+    text = instance.to_json()
+    data = instance.to_bytes()
+    return {
+        "json_bytes": len(text.encode("UTF-8")),
+        "binary_bytes": len(data),
+        "json_encode_ms": min(timeit.repeat(instance.to_json, repeat=3, number=number)) / number * 1000,
+        "binary_encode_ms": min(timeit.repeat(instance.to_bytes, repeat=3, number=number)) / number * 1000,
+        "json_decode_ms": min(timeit.repeat(lambda: schema_class.from_json(text), repeat=3, number=number)) / number * 1000,
+        "binary_decode_ms": min(timeit.repeat(lambda: schema_class.from_bytes(data), repeat=3, number=number)) / number * 1000,
+    }
+
+def run() -> dict:
+    return {
+        "schema_10_fields": measure(build_schema(10)),
+        "schema_200_fields": measure(build_schema(200)),
+        "bytes_value_64KiB": measure(build_value(65536)),
+    }
+
+if __name__ == "__main__":
+    for label, result in run().items():
+        print(f"[*] {label}")
+        print(f"    - Size:   JSON {result['json_bytes']:>8} B | binary {result['binary_bytes']:>8} B")
+        print(f"    - Encode: JSON {result['json_encode_ms']:8.3f} ms | binary {result['binary_encode_ms']:8.3f} ms")
+        print(f"    - Decode: JSON {result['json_decode_ms']:8.3f} ms | binary {result['binary_decode_ms']:8.3f} ms")
@@ -0,0 +1,50 @@
+# Library import
+import tempfile
+import timeit
+from datavalue import ComplexData, PrimitiveData
+from datavalue.classes import codegen
+
+# Schemas definition
+def build_schema(fields: int) -> ComplexData:
+    Host = PrimitiveData(data_type=str, value=None, name="Host", maximum_length=64, regular_expression=r"^[a-z0-9.-]+$", data_class=True)
+    Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+    Service = ComplexData(data_type=dict, value=None, name="Service", possible_values={
+        "HOST": [Host], "PORT": [Port], "PROTOCOL": ["TCP", "UDP"], str: [int, float, None]
+    }, data_class=True)
+    return ComplexData(data_type=dict, value=None, name="Services", possible_values={
+        f"SERVICE_{number}": ComplexData(data_type=list, value=None, possible_values=[Service], maximum_length=8, data_class=True)
+        for number in range(fields)
+    }, data_class=True)
+
+# Benchmark execution
+def run(fields: int = 50, number: int = 20) -> dict:
+    schema = build_schema(fields)
+    payload = {f"SERVICE_{number}": [{"HOST": "api.local", "PORT": 443, "PROTOCOL": "TCP", "WEIGHT": 0.5}] * 4 for number in range(fields)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        def cold_start():
+            codegen.LOADED.clear()
+            return schema.compile_source(cache_directory=directory, cache=False)
+
+        def warm_start():
+            codegen.LOADED.clear() # New worker process: only the file is available
+            return schema.compile_source(cache_directory=directory)
+
+        warm_start()
+        generated = schema.compile_source(cache_directory=directory)
+        compiled = schema.compile()
+        assert generated.is_valid(payload) and compiled.is_valid(payload)
+
+        return {
+            "compile_ms": min(timeit.repeat(schema.compile, repeat=3, number=number)) / number * 1000,
+            "generate_ms": min(timeit.repeat(cold_start, repeat=3, number=number)) / number * 1000,
+            "disk_load_ms": min(timeit.repeat(warm_start, repeat=3, number=number)) / number * 1000,
+            "is_valid_ms": min(timeit.repeat(lambda: schema.is_valid(payload), repeat=3, number=number)) / number * 1000,
+            "compiled_ms": min(timeit.repeat(lambda: compiled.is_valid(payload), repeat=3, number=number)) / number * 1000,
+            "generated_ms": min(timeit.repeat(lambda: generated.is_valid(payload), repeat=3, number=number)) / number * 1000,
+        }
+
+if __name__ == "__main__":
+    result = run()
+    print(f"[*] Startup:    compile() {result['compile_ms']:7.3f} ms | generate {result['generate_ms']:7.3f} ms | disk cache {result['disk_load_ms']:7.3f} ms")
+    print(f"[*] Validation: is_valid  {result['is_valid_ms']:7.3f} ms | compiled {result['compiled_ms']:7.3f} ms | generated  {result['generated_ms']:7.3f} ms")
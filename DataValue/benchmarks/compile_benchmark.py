@@ -0,0 +1,45 @@
+# Library import
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+IPv4 = PrimitiveData(data_type=str, value=None, name="IPv4", minimum_length=7, maximum_length=15, regular_expression=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$", data_class=True)
+Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_length=1, maximum_length=5, minimum_size=1, maximum_size=65535, data_class=True)
+MAC = PrimitiveData(data_type=str, value=None, name="MAC", regular_expression=r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$", data_class=True)
+
+InternetAddr = ComplexData(data_type=dict, value=None, name="IP_Endpoint", possible_values={"ADDRESS": [IPv4], "PORT": [Port]}, data_class=True)
+BluetoothAddr = ComplexData(data_type=dict, value=None, name="BT_Endpoint", possible_values={"ADDRESS": [MAC], "PORT": [Port]}, data_class=True)
+
+ProfileSchema = ComplexData(data_type=dict, value=None, name="Profile", possible_values={
+    "TRANSPORT": ["INTERNET", "BLUETOOTH", "SERIAL"],
+    "ADDRESSES": ComplexData(data_type=list, value=None, possible_values=[InternetAddr, BluetoothAddr], data_class=True)
+}, data_class=True)
+
+# Payload definition
+PAYLOAD = {
+    "TRANSPORT": "INTERNET",
+    "ADDRESSES": [
+        {"ADDRESS": f"10.0.{index % 256}.{index % 200}", "PORT": 1024 + index} if index % 2 else
+        {"ADDRESS": "00:11:22:33:44:55", "PORT": 1 + index % 30}
+        for index in range(200)
+    ]
+}
+
+# Benchmark execution
+def run(repeat: int = 5, number: int = 20) -> dict:
+    compiled = ProfileSchema.compile()
+    interpreted_time = min(timeit.repeat(lambda: ProfileSchema.validate(PAYLOAD), repeat=repeat, number=number)) / number
+    compiled_time = min(timeit.repeat(lambda: compiled(PAYLOAD), repeat=repeat, number=number)) / number
+
+    return {
+        "interpreted_seconds": interpreted_time,
+        "compiled_seconds": compiled_time,
+        "speedup": interpreted_time / compiled_time
+    }
+
+if __name__ == "__main__":
+    results = run()
+    print(f"[*] Nested ComplexData payload: {len(PAYLOAD['ADDRESSES'])} addresses")
+    print(f"    - Interpreted: {results['interpreted_seconds'] * 1000:.3f} ms")
+    print(f"    - Compiled:    {results['compiled_seconds'] * 1000:.3f} ms")
+    print(f"    - Speedup:     {results['speedup']:.1f}x")
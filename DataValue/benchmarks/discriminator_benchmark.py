@@ -0,0 +1,36 @@
+# Library import
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_schema(variants: int, discriminator=None) -> ComplexData:
+    schemas = []
+    for number in range(variants):
+        schemas.append(ComplexData(data_type=dict, value=None, name=f"VARIANT_{number}", possible_values={
+            "TYPE": [f"VARIANT_{number}"],
+            "ID": [PrimitiveData(data_type=int, value=None, minimum_size=0, data_class=True)],
+            "LABEL": [str]
+        }, data_class=True))
+    return ComplexData(data_type=list, value=None, possible_values=schemas, data_class=True, discriminator=discriminator)
+
+# Benchmark execution
+def run(variants: int = 12, elements: int = 20000, repeat: int = 3) -> dict:
+    homogeneous = [{"TYPE": "VARIANT_0", "ID": number, "LABEL": "record"} for number in range(elements)]
+    heterogeneous = [{"TYPE": f"VARIANT_{number % variants}", "ID": number, "LABEL": "record"} for number in range(elements)]
+
+    results = {}
+    for label, discriminator in (("sequential", None), ("discriminated", "TYPE")):
+        schema = build_schema(variants, discriminator)
+        results[label] = {
+            "homogeneous_seconds": min(timeit.repeat(lambda: schema.validate(homogeneous), repeat=repeat, number=1)),
+            "heterogeneous_seconds": min(timeit.repeat(lambda: schema.validate(heterogeneous), repeat=repeat, number=1))
+        }
+    return results
+
+if __name__ == "__main__":
+    print("[*] Union of 12 dict variants, 20000 records")
+    for label, result in run().items():
+        print(
+            f"    - {label:<13}: homogeneous {result['homogeneous_seconds'] * 1000:.1f} ms, "
+            f"heterogeneous {result['heterogeneous_seconds'] * 1000:.1f} ms"
+        )
@@ -0,0 +1,35 @@
+# Library import
+import timeit
+from datavalue import ComplexData
+
+# Benchmark execution
+def run(sizes: tuple = (10, 100, 1000, 10000), elements: int = 10000, repeat: int = 3) -> list:
+    results = []
+    for size in sizes:
+        # Wide enumeration: list elements checked against `size` literals
+        codes = [f"CODE_{number}" for number in range(size)]
+        enumeration = ComplexData(data_type=list, value=None, possible_values=codes, data_class=True)
+        enumeration_payload = [codes[number % size] for number in range(elements)]
+
+        # Wide configuration: dict keys dispatched against `size` schema keys
+        configuration = ComplexData(data_type=dict, value=None, possible_values={code: [str, int] for code in codes}, data_class=True)
+        configuration_payload = {code: "value" for code in codes}
+
+        enumeration_time = min(timeit.repeat(lambda: enumeration.validate(enumeration_payload), repeat=repeat, number=1))
+        configuration_time = min(timeit.repeat(lambda: configuration.validate(configuration_payload), repeat=repeat, number=1))
+
+        results.append({
+            "validators": size,
+            "enumeration_us_per_element": enumeration_time / elements * 1e6,
+            "configuration_us_per_key": configuration_time / size * 1e6
+        })
+    return results
+
+if __name__ == "__main__":
+    print("[*] Indexed possible_values: cost per element should stay flat")
+    for result in run():
+        print(
+            f"    - {result['validators']:>6} validators: "
+            f"enumeration {result['enumeration_us_per_element']:.3f} us/element, "
+            f"configuration {result['configuration_us_per_key']:.3f} us/key"
+        )
@@ -0,0 +1,44 @@
+# Library import
+import json
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Documents definition
+def build_document(size: int) -> str:
+    Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+    Host = PrimitiveData(data_type=str, value=None, name="Host", maximum_length=64, regular_expression=r"^[a-z0-9.-]+$", data_class=True)
+    Service = ComplexData(data_type=dict, value=None, name="Service", possible_values={
+        "HOST": [Host], "PORT": [Port], "TAGS": ComplexData(data_type=list, value=None, possible_values=[str], data_class=True)
+    }, data_class=True)
+    Catalog = ComplexData(data_type=dict, value={
+        f"SERVICE_{number}": {"HOST": f"host-{number}.local", "PORT": 1 + number % 65535, "TAGS": ["a", "b", "c"]}
+        for number in range(size)
+    }, possible_values={str: [Service]})
+    return Catalog.to_json()
+
+# Benchmark execution
+def run(sizes: tuple = (1000, 10000, 50000), fields: int = 3, number: int = 5) -> list:
+    results = []
+    for size in sizes:
+        data = json.loads(build_document(size))
+        keys = [f"SERVICE_{number * size // fields}" for number in range(fields)]
+
+        def eager_read():
+            value = ComplexData.from_dict(data).value
+            return [value[key] for key in keys]
+
+        def lazy_read():
+            value = ComplexData.from_dict(data, lazy=True).value
+            return [value[key] for key in keys]
+
+        assert eager_read() == lazy_read()
+        results.append({
+            "size": size,
+            "eager_ms": min(timeit.repeat(eager_read, repeat=3, number=number)) / number * 1000,
+            "lazy_ms": min(timeit.repeat(lazy_read, repeat=3, number=number)) / number * 1000,
+        })
+    return results
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['size']:>6} entries, 3 fields read | eager {result['eager_ms']:9.3f} ms | lazy {result['lazy_ms']:7.3f} ms")
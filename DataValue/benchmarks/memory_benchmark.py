@@ -0,0 +1,43 @@
+# Library import
+import gc
+import timeit
+import tracemalloc
+from datavalue import ComplexData, PrimitiveData
+
+# Constants definition
+TARGET_BYTES: dict = {"PrimitiveData": 120, "ComplexData": 160} # Per instance, excluding value/name objects
+
+# Schemas definition
+def build_primitive(number: int) -> PrimitiveData:
+    # Typical message field: a name and one or two constraints, repeated across fields
+    return PrimitiveData(data_type=int, value=number, name="FIELD", minimum_size=0, maximum_size=65535)
+
+def build_complex(number: int) -> ComplexData:
+    return ComplexData(data_type=list, value=None, name="FIELDS", possible_values=None, maximum_length=16, data_class=True)
+
+# Benchmark execution
+def bytes_per_instance(builder, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [builder(number % 256) for number in range(count)] # Small ints are cached: values are not counted
+    used = tracemalloc.get_traced_memory()[0] - before - (count * 8 + 56) # Without the list itself
+    tracemalloc.stop()
+    del instances
+    return used / count
+
+def run(count: int = 100000, number: int = 200000) -> dict:
+    Port = build_primitive(80)
+    results = {
+        "PrimitiveData": bytes_per_instance(build_primitive, count),
+        "ComplexData": bytes_per_instance(build_complex, count),
+        "is_valid_us": min(timeit.repeat(lambda: Port.is_valid(443), repeat=3, number=number)) / number * 1e6,
+    }
+    results["target_met"] = all(results[name] <= target for name, target in TARGET_BYTES.items())
+    return results
+
+if __name__ == "__main__":
+    result = run()
+    for name, target in TARGET_BYTES.items():
+        print(f"[*] {name:<13} {result[name]:7.1f} bytes/instance (target: {target})")
+    print(f"[*] is_valid      {result['is_valid_us']:7.3f} us")
@@ -0,0 +1,33 @@
+# Library import
+import os
+import time
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+IPv4 = PrimitiveData(data_type=str, value=None, minimum_length=7, maximum_length=15, regular_expression=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$", data_class=True)
+Endpoint = ComplexData(data_type=dict, value=None, possible_values={"ADDRESS": [IPv4], "PORT": [PrimitiveData(data_type=int, value=None, minimum_size=1, maximum_size=65535, data_class=True)]}, data_class=True)
+Endpoints = ComplexData(data_type=list, value=None, possible_values=[Endpoint], data_class=True)
+
+# Benchmark execution
+def run(elements: int = 1_000_000, chunk_size: int = 50_000, executor: str = "process") -> list:
+    payload = [{"ADDRESS": f"10.{index % 250}.{index % 200}.{index % 100}", "PORT": 1 + index % 65535} for index in range(elements)]
+
+    start = time.perf_counter()
+    Endpoints.validate(payload)
+    sequential = time.perf_counter() - start
+
+    results = [{"workers": 0, "seconds": sequential, "speedup": 1.0}]
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        Endpoints.validate_parallel(payload, workers=workers, chunk_size=chunk_size, executor=executor)
+        seconds = time.perf_counter() - start
+        results.append({"workers": workers, "seconds": seconds, "speedup": sequential / seconds})
+        workers *= 2
+    return results
+
+if __name__ == "__main__":
+    print(f"[*] Parallel validation scaling ({os.cpu_count()} cores available)")
+    for result in run():
+        label = "sequential" if result["workers"] == 0 else f"{result['workers']} workers"
+        print(f"    - {label:<12}: {result['seconds']:.2f} s ({result['speedup']:.2f}x)")
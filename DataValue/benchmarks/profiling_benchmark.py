@@ -0,0 +1,27 @@
+# Library import
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_schema() -> ComplexData:
+    Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+    Host = PrimitiveData(data_type=str, value=None, name="Host", maximum_length=64, regular_expression=r"^[a-z0-9.-]+$", data_class=True)
+    Service = ComplexData(data_type=dict, value=None, name="Service", possible_values={"HOST": [Host], "PORT": [Port]}, data_class=True)
+    return ComplexData(data_type=list, value=None, name="Services", possible_values=[Service, Port, "NONE"], data_class=True)
+
+# Benchmark execution
+def run(size: int = 1000, number: int = 20) -> dict:
+    schema = build_schema()
+    data = [{"HOST": f"host-{index}.local", "PORT": 1 + index} if index % 3 else "NONE" for index in range(size)]
+    validate = lambda: schema.is_valid(data)
+
+    never = min(timeit.repeat(validate, repeat=5, number=number)) / number * 1000
+    schema.enable_profiling()
+    enabled = min(timeit.repeat(validate, repeat=5, number=number)) / number * 1000
+    schema.disable_profiling()
+    disabled = min(timeit.repeat(validate, repeat=5, number=number)) / number * 1000
+    return {"size": size, "never_ms": never, "enabled_ms": enabled, "disabled_ms": disabled}
+
+if __name__ == "__main__":
+    result = run()
+    print(f"[*] {result['size']} elements | never enabled {result['never_ms']:.3f} ms | enabled {result['enabled_ms']:.3f} ms | disabled {result['disabled_ms']:.3f} ms")
@@ -0,0 +1,45 @@
+# Library import
+import gc
+import timeit
+import tracemalloc
+from datavalue import ComplexData, PrimitiveData, SchemaRegistry
+
+# Documents definition
+def build_schema(fields: int) -> ComplexData:
+    Phone = PrimitiveData(data_type=str, value=None, name="Phone", description="International phone number", minimum_length=7, maximum_length=16, regular_expression=r"^\+[1-9]\d{6,14}$", data_class=True)
+    Contact = ComplexData(data_type=dict, value=None, name="Contact", possible_values={
+        "NAME": [PrimitiveData(data_type=str, value=None, maximum_length=64, data_class=True)],
+        "PHONES": ComplexData(data_type=list, value=None, maximum_length=4, possible_values=[Phone], data_class=True),
+    }, data_class=True)
+    return ComplexData(data_type=dict, value=None, name="Config", possible_values={
+        f"FIELD_{number}": [Phone, Contact] for number in range(fields)
+    }, data_class=True)
+
+# Benchmark execution
+def measure(label: str, load, number: int = 10) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    schema = load()
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del schema
+    return {
+        "label": label,
+        "load_ms": min(timeit.repeat(load, repeat=3, number=number)) / number * 1000,
+        "memory_kib": memory / 1024,
+    }
+
+def run(fields: int = 200) -> list:
+    schema = build_schema(fields)
+    inline = schema.to_json()
+    referenced = schema.to_json(references=True)
+    return [
+        {**measure("inline", lambda: ComplexData.from_json(inline)), "document_bytes": len(inline)},
+        {**measure("$ref", lambda: ComplexData.from_json(referenced)), "document_bytes": len(referenced)},
+        {**measure("inline + registry", lambda: ComplexData.from_json(inline, registry=SchemaRegistry())), "document_bytes": len(inline)},
+    ]
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['label']:<18} document {result['document_bytes']:>8} B | load {result['load_ms']:8.3f} ms | memory {result['memory_kib']:9.1f} KiB")
@@ -0,0 +1,37 @@
+# Library import
+import random
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_schemas() -> tuple:
+    Country = PrimitiveData(data_type=str, value=None, name="Country", regular_expression=r"^[A-Z]{2}$", possible_values=["MX", "US", "ES", "AR", "CO", "CL", "PE"], data_class=True)
+    Status = PrimitiveData(data_type=str, value=None, name="Status", minimum_length=2, maximum_length=16, regular_expression=r"^[A-Z_]+$", data_class=True)
+    Coordinate = PrimitiveData(data_type=int, value=None, minimum_size=0, maximum_size=4096, data_class=True)
+    Point = ComplexData(data_type=tuple, value=None, name="Point", minimum_length=2, maximum_length=2, possible_values=[Coordinate], data_class=True)
+    return Country, Status, Point
+
+def build_stream(size: int) -> dict:
+    randomizer = random.Random(7)
+    return {
+        "Country": [randomizer.choice(["MX", "US", "ES", "AR", "CO", "CL", "PE", "FR"]) for _ in range(size)],
+        "Status": [randomizer.choice(["ACTIVE", "PENDING", "DELETED", "on_hold"]) for _ in range(size)],
+        "Point": [(randomizer.randint(0, 3), randomizer.randint(0, 3)) for _ in range(size)],
+    }
+
+# Benchmark execution
+def run(size: int = 100000) -> list:
+    results = []
+    stream = build_stream(size)
+    for schema in build_schemas():
+        values = stream[schema.name]
+        uncached = min(timeit.repeat(lambda: [schema.is_valid(value) for value in values], repeat=3, number=1))
+        cache = schema.enable_result_cache()
+        cached = min(timeit.repeat(lambda: [schema.is_valid(value) for value in values], repeat=3, number=1))
+        schema.disable_result_cache()
+        results.append({"schema": schema.name, "uncached_s": uncached, "cached_s": cached, "stats": cache.stats()})
+    return results
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['schema']:<8} uncached {result['uncached_s']:.3f} s | cached {result['cached_s']:.3f} s | {result['stats']['hits']} hits, {result['stats']['misses']} misses")
@@ -0,0 +1,35 @@
+# Library import
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_settings(size: int) -> ComplexData:
+    Value = PrimitiveData(data_type=str, value=None, maximum_length=64, regular_expression=r"^[a-z0-9_]+$", data_class=True)
+    return ComplexData(data_type=dict, value={f"KEY_{number}": f"value_{number}" for number in range(size)}, possible_values=([str], [Value]))
+
+# Benchmark execution
+def run(sizes: tuple = (1000, 10000, 100000), number: int = 20) -> list:
+    results = []
+    for size in sizes:
+        settings = build_settings(size)
+        value = settings.track()
+        settings.revalidate()
+
+        def edit_and_validate():
+            value["KEY_1"] = "edited"
+            settings.validate()
+
+        def edit_and_revalidate():
+            value["KEY_1"] = "edited"
+            settings.revalidate()
+
+        results.append({
+            "size": size,
+            "validate_ms": min(timeit.repeat(edit_and_validate, repeat=3, number=number)) / number * 1000,
+            "revalidate_ms": min(timeit.repeat(edit_and_revalidate, repeat=3, number=number)) / number * 1000,
+        })
+    return results
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['size']:>7} entries | validate {result['validate_ms']:9.3f} ms | revalidate {result['revalidate_ms']:7.4f} ms")
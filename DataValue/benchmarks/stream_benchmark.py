@@ -0,0 +1,59 @@
+# Library import
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_schema() -> ComplexData:
+    Reading = ComplexData(data_type=dict, value=None, name="Reading", possible_values={
+        "SENSOR": [PrimitiveData(data_type=str, value=None, regular_expression=r"^S[0-9]+$", data_class=True)],
+        "VALUE": [int, float],
+        "TAGS": ComplexData(data_type=list, value=None, maximum_length=4, possible_values=[str], data_class=True)
+    }, data_class=True)
+    return ComplexData(data_type=list, value=None, name="Readings", possible_values=[Reading], data_class=True)
+
+def write_document(path: str, size: int, lines: bool) -> None:
+    with open(path, "w", encoding="UTF-8") as file:
+        file.write("" if lines else "[")
+        for number in range(size):
+            reading = json.dumps({"SENSOR": f"S{number}", "VALUE": number * 0.5, "TAGS": ["A", "B"]})
+            file.write(reading + "\n" if lines else ("," if number else "") + reading)
+        file.write("" if lines else "]")
+
+# Benchmark execution
+def measure(label: str, function) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"label": label, "seconds": elapsed, "peak_mib": peak / 1048576}
+
+def run(sizes: tuple = (50000, 200000)) -> list:
+    schema = build_schema()
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"readings_{size}.json")
+            write_document(path, size, lines=False)
+            megabytes = os.path.getsize(path) / 1048576
+
+            def load_and_validate():
+                with open(path, "rb") as file:
+                    schema.validate(json.load(file))
+
+            def stream():
+                with open(path, "rb") as file:
+                    schema.validate_stream(file)
+
+            for label, function in (("json.load + validate", load_and_validate), ("validate_stream", stream)):
+                results.append({**measure(label, function), "elements": size, "file_mib": megabytes})
+    return results
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"[*] {result['label']:<22} {result['elements']:>7} elements ({result['file_mib']:6.1f} MiB) | {result['seconds']:6.2f} s | peak {result['peak_mib']:8.2f} MiB")
@@ -0,0 +1,168 @@
+# Library import
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+from datavalue import ComplexData, PrimitiveData
+
+# Constants definition
+SUITE_VERSION: int = 1
+SIZES: tuple = (10, 100, 1000)
+QUICK_SIZES: tuple = (10, 100)
+THRESHOLD: float = 0.10 # Relative slowdown reported as a regression
+
+# Schemas definition
+def port_schema() -> PrimitiveData:
+    return PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+
+def address_schema() -> PrimitiveData:
+    return PrimitiveData(data_type=str, value=None, name="IPv4", maximum_length=15, regular_expression=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$", data_class=True)
+
+def service_schema() -> ComplexData:
+    return ComplexData(data_type=dict, value=None, name="Service", possible_values={
+        "ADDRESS": [address_schema()], "PORT": [port_schema()], "PROTOCOL": ["TCP", "UDP"], str: [int, float, None]
+    }, data_class=True)
+
+def service(index: int) -> dict:
+    return {"ADDRESS": f"10.0.{index // 256 % 256}.{index % 256}", "PORT": 1 + index % 65535, "PROTOCOL": "TCP", "WEIGHT": 0.5}
+
+# Cases definition (size -> measured callable)
+def primitive_case(size: int) -> Callable:
+    schema = port_schema()
+    values = [1 + index % 65535 for index in range(size)]
+    return lambda: [schema.is_valid(value) for value in values]
+
+def regex_case(size: int) -> Callable:
+    schema = address_schema()
+    values = [f"192.168.{index // 256 % 256}.{index % 256}" for index in range(size)]
+    return lambda: [schema.is_valid(value) for value in values]
+
+def wide_dict_case(size: int) -> Callable:
+    schema = ComplexData(data_type=dict, value=None, possible_values={f"FIELD_{index}": [service_schema()] for index in range(size)}, data_class=True)
+    data = {f"FIELD_{index}": service(index) for index in range(size)}
+    return lambda: schema.validate(data)
+
+def deep_dict_case(size: int) -> Callable:
+    # One nesting level per 10 elements (bounded by the recursion limit)
+    schema, data = service_schema(), service(0)
+    for depth in range(max(1, size // 10)):
+        schema = ComplexData(data_type=dict, value=None, possible_values={"LEVEL": [depth], "CHILD": [schema]}, data_class=True)
+        data = {"LEVEL": depth, "CHILD": data}
+    return lambda: schema.validate(data)
+
+def union_case(size: int) -> Callable:
+    Internet = ComplexData(data_type=dict, value=None, name="Internet", possible_values={"TYPE": ["INTERNET"], "ADDRESS": [address_schema()]}, data_class=True)
+    Serial = ComplexData(data_type=dict, value=None, name="Serial", possible_values={"TYPE": ["SERIAL"], "BAUDS": [9600, 115200]}, data_class=True)
+    schema = ComplexData(data_type=list, value=None, possible_values=[Internet, Serial, port_schema(), "NONE", None], data_class=True)
+    members = [{"TYPE": "INTERNET", "ADDRESS": "10.0.0.1"}, {"TYPE": "SERIAL", "BAUDS": 9600}, 80, "NONE", None]
+    data = [members[index % len(members)] for index in range(size)]
+    return lambda: schema.validate(data)
+
+def catalog(size: int) -> ComplexData:
+    return ComplexData(data_type=dict, value={f"SERVICE_{index}": service(index) for index in range(size)}, possible_values={str: [service_schema()]})
+
+def to_dict_case(size: int) -> Callable:
+    return catalog(size).to_dict
+
+def from_dict_case(size: int) -> Callable:
+    data = catalog(size).to_dict()
+    return lambda: ComplexData.from_dict(data)
+
+def json_round_trip_case(size: int) -> Callable:
+    document = catalog(size).to_json()
+    return lambda: ComplexData.from_json(document).to_json()
+
+CASES: Dict[str, Callable] = {
+    "primitive_validation": primitive_case,
+    "regex_validation": regex_case,
+    "wide_dict_validation": wide_dict_case,
+    "deep_dict_validation": deep_dict_case,
+    "union_validation": union_case,
+    "to_dict": to_dict_case,
+    "from_dict": from_dict_case,
+    "json_round_trip": json_round_trip_case,
+}
+
+# Functions definition
+def measure(function: Callable, repeat: int) -> dict:
+    "Best and median time per call (calls per repetition calibrated to at least 0.2 seconds)."
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {"best_ms": min(times) * 1000, "median_ms": statistics.median(times) * 1000, "number": number, "repeat": repeat}
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(sizes: tuple = SIZES, cases: Optional[list] = None, repeat: int = 5) -> dict:
+    "Run the suite and return the results document."
+    results = {}
+    for name in cases or CASES:
+        results[name] = {}
+        for size in sizes:
+            results[name][str(size)] = measure(CASES[name](size), repeat)
+    return {
+        "suite_version": SUITE_VERSION,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD) -> list:
+    "Cases present in both documents, with the relative change of the best time (positive: slower)."
+    changes = []
+    for name, sizes in current["results"].items():
+        for size, result in sizes.items():
+            previous = baseline.get("results", {}).get(name, {}).get(size)
+            if previous is None:
+                continue
+            change = result["best_ms"] / previous["best_ms"] - 1
+            changes.append({
+                "case": name, "size": int(size), "baseline_ms": previous["best_ms"], "current_ms": result["best_ms"],
+                "change": change, "regression": change > threshold,
+            })
+    return changes
+
+def main(arguments: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="DataValue benchmark suite")
+    parser.add_argument("--output", help="JSON file for the results")
+    parser.add_argument("--compare", help="JSON results of a previous run (baseline)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Relative slowdown reported as a regression")
+    parser.add_argument("--case", action="append", choices=list(CASES), help="Case to run (repeatable, default: all)")
+    parser.add_argument("--quick", action="store_true", help="Small sizes and fewer repetitions")
+    options = parser.parse_args(arguments)
+
+    document = run(QUICK_SIZES if options.quick else SIZES, options.case, repeat=3 if options.quick else 5)
+    for name, sizes in document["results"].items():
+        for size, result in sizes.items():
+            print(f"[*] {name:<22} {size:>6} | best {result['best_ms']:10.4f} ms | median {result['median_ms']:10.4f} ms")
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=4)
+        print(f"[OK] Results written to {options.output}")
+
+    if options.compare:
+        with open(options.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        changes = compare(baseline, document, options.threshold)
+        for change in changes:
+            mark = "REGRESSION" if change["regression"] else "ok"
+            print(f"[*] {change['case']:<22} {change['size']:>6} | {change['baseline_ms']:10.4f} -> {change['current_ms']:10.4f} ms ({change['change']:+.1%}) {mark}")
+        if any(change["regression"] for change in changes):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
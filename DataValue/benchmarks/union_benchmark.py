@@ -0,0 +1,39 @@
+# Library import
+import timeit
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_variants(count: int) -> list:
+    variants = []
+    for number in range(count):
+        # Variants differ by the range of their (large) ITEMS payload
+        item = PrimitiveData(data_type=int, value=None, minimum_size=number * 1000, maximum_size=number * 1000 + 999, data_class=True)
+        variants.append(ComplexData(data_type=dict, value=None, name=f"VARIANT_{number}", possible_values={
+            "ITEMS": ComplexData(data_type=list, value=None, possible_values=[item], data_class=True),
+            "LABEL": [PrimitiveData(data_type=str, value=None, maximum_length=64, data_class=True)]
+        }, data_class=True))
+    return variants
+
+# Benchmark execution
+def run(variants: int = 10, elements: int = 2000, repeat: int = 3) -> dict:
+    schema = ComplexData(data_type=list, value=None, possible_values=build_variants(variants), data_class=True)
+
+    # Every element matches the last variant: all previous branches fail
+    payload = [
+        {"ITEMS": list(range((variants - 1) * 1000, (variants - 1) * 1000 + 200)), "LABEL": f"record {number}"}
+        for number in range(elements)
+    ]
+
+    seconds = min(timeit.repeat(lambda: schema.validate(payload), repeat=repeat, number=1))
+    return {
+        "variants": variants,
+        "elements": elements,
+        "seconds": seconds,
+        "us_per_failed_branch": seconds / (elements * (variants - 1)) * 1e6
+    }
+
+if __name__ == "__main__":
+    results = run()
+    print(f"[*] Union-heavy collection: {results['elements']} elements, {results['variants']} variants")
+    print(f"    - Validation time: {results['seconds'] * 1000:.2f} ms")
+    print(f"    - Cost per failed branch: {results['us_per_failed_branch']:.3f} us")
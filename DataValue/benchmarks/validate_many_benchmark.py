@@ -0,0 +1,36 @@
+# Library import
+import time
+from datavalue import PrimitiveData
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Benchmark execution
+def run(elements: int = 10_000_000) -> dict:
+    Amount = PrimitiveData(data_type=int, value=None, minimum_length=1, maximum_length=7, minimum_size=0, maximum_size=1_000_000, possible_values=None, data_class=True)
+    Status = PrimitiveData(data_type=int, value=None, possible_values=(100, 200, 201, 204, 301, 404, 500), data_class=True)
+
+    results = {"elements": elements}
+    if numpy is not None:
+        values = numpy.random.default_rng(0).integers(-10, 1_100_000, size=elements)
+        codes = numpy.random.default_rng(1).choice([200, 201, 404, 418, 500], size=elements)
+        for label, schema, data in (("range_and_digits", Amount, values), ("possible_values", Status, codes)):
+            start = time.perf_counter()
+            schema.validate_many(data)
+            results[f"vectorized_{label}_seconds"] = time.perf_counter() - start
+
+    # Element-wise reference on a sample (extrapolated)
+    sample = list(range(100_000))
+    start = time.perf_counter()
+    Amount.validate_many(sample)
+    results["python_seconds_extrapolated"] = (time.perf_counter() - start) * elements / len(sample)
+    return results
+
+if __name__ == "__main__":
+    results = run()
+    print(f"[*] Batch validation of {results['elements']:,} numeric values")
+    for key, value in results.items():
+        if key != "elements":
+            print(f"    - {key}: {value:.3f} s")
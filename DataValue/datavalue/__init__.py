@@ -1,3 +1,6 @@
 # Library import
 from .classes.primitive_data import PrimitiveData
-from .classes.complex_data import ComplexData
\ No newline at end of file
+from .classes.complex_data import ComplexData
+from .classes.compiler import CompiledValidator
+from .classes.registry import SchemaRegistry
+from .classes.cache import SchemaCache
\ No newline at end of file
@@ -0,0 +1,107 @@
+# Library import
+import array
+from typing import Any, Iterable, Optional, Tuple
+from .primitive_data import PrimitiveData
+
+try:
+    import numpy
+except ImportError: # Optional dependency: pure Python validation is used
+    numpy = None
+
+# Constants definition
+NUMPY_KINDS: dict = {"b": bool, "i": int, "u": int, "f": float}
+
+# Functions definition
+def validate_many(schema: PrimitiveData, values: Iterable) -> Tuple[Any, Any]:
+    """
+    Valida un conjunto de valores contra un esquema PrimitiveData.
+
+    Retorna la mascara de resultados (por elemento) y los indices rechazados. Si
+    los valores son un numpy.ndarray o array.array numerico (y numpy esta
+    instalado), ambos se retornan como numpy.ndarray, y los valores se validan
+    como sus equivalentes en Python (ndarray.tolist()).
+    """
+    if numpy is not None and isinstance(values, (numpy.ndarray, array.array)):
+        candidate = numpy.asarray(values)
+        mask = _vectorized_mask(schema, candidate)
+        if mask is not None:
+            return mask, numpy.flatnonzero(~mask)
+        values = candidate.tolist()
+
+    predicate = schema.compile().is_valid
+    mask = [predicate(value) for value in values]
+    return mask, [position for position, valid in enumerate(mask) if not valid]
+
+def _digit_count(values: Any) -> Any:
+    # Decimal digits of |value|, as counted by PrimitiveData for int values
+    if values.dtype.kind == "b":
+        return numpy.zeros(values.shape, dtype=numpy.int64) # str(True) has no digits
+    if values.dtype.kind == "i":
+        magnitude = numpy.abs(values.astype(numpy.int64)).astype(numpy.uint64)
+    else:
+        magnitude = values.astype(numpy.uint64)
+    powers = numpy.array([10 ** exponent for exponent in range(1, 20)], dtype=numpy.uint64)
+    return numpy.searchsorted(powers, magnitude, side="right") + 1
+
+def _numeric_literals(literals: frozenset) -> list:
+    return [
+        int(literal) if isinstance(literal, bool) else literal
+        for literal in literals
+        if isinstance(literal, (int, float)) and (not isinstance(literal, int) or -2 ** 63 <= literal < 2 ** 64)
+    ]
+
+def _vectorized_mask(schema: PrimitiveData, values: Any) -> Optional[Any]:
+    python_type = NUMPY_KINDS.get(values.dtype.kind)
+    if python_type is None or values.ndim != 1:
+        return None # Not vectorizable: validated element by element
+
+    mask = numpy.ones(values.shape, dtype=bool)
+    if not isinstance(schema.data_type, (type, tuple)) or not issubclass(python_type, schema.data_type):
+        mask[:] = False
+        return mask
+
+    # Elements that also need the Python (non-vectorizable) rules
+    refine = numpy.zeros(values.shape, dtype=bool)
+
+    # Validacion de longitud (digitos)
+    if schema.minimum_length is not None or schema.maximum_length is not None:
+        if python_type is float:
+            refine[:] = True
+        else:
+            digits = _digit_count(values)
+            if schema.minimum_length is not None:
+                mask &= digits >= schema.minimum_length
+            if schema.maximum_length is not None:
+                mask &= digits <= schema.maximum_length
+
+    # Validacion de tamaño (magnitud): NaN is never below/above a limit
+    if schema.minimum_size is not None:
+        mask &= ~(values < schema.minimum_size)
+    if schema.maximum_size is not None:
+        mask &= ~(values > schema.maximum_size)
+
+    # Validacion de posibles valores (conjunto)
+    if schema.possible_values is not None:
+        index = schema._possible_index
+        if index is None:
+            raise TypeError(f"Possible values must be iterable. Received: {type(schema.possible_values).__name__}")
+
+        if index.types and issubclass(python_type, index.types):
+            matched = numpy.ones(values.shape, dtype=bool)
+        else:
+            literals = _numeric_literals(index.literals)
+            matched = numpy.isin(values, literals) if literals else numpy.zeros(values.shape, dtype=bool)
+
+        if index.schemas:
+            refine |= ~matched
+        else:
+            mask &= matched
+
+    # The regular expression only applies to str/bytes values
+    pending = numpy.flatnonzero(mask & refine)
+    if len(pending):
+        predicate = schema.compile().is_valid
+        for position in pending:
+            mask[position] = predicate(values[position].item())
+
+    return mask
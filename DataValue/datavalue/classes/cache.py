@@ -0,0 +1,239 @@
+# Library import
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+# Constants definition
+SCALAR_TYPES: frozenset = frozenset({str, bytes, int, float, bool})
+MISSING: Any = object()
+
+# Classes definition
+class SchemaCache:
+    """
+    Cache LRU (acotado) de esquemas deserializados.
+
+    La clave es el hash SHA-256 del texto JSON (from_json), o de la forma
+    canonica (JSON) del diccionario (from_dict); solo se almacena el contenido
+    que json.dumps no modifica. Los esquemas se retornan congelados
+    (freeze()) y compartidos: una consulta exitosa omite el analisis del JSON,
+    la reconstruccion, y la validacion del constructor.
+    """
+    def __init__(self, maximum_size: int = 128) -> None:
+        if not isinstance(maximum_size, int) or maximum_size < 1:
+            raise ValueError(f"The maximum size must be a positive integer. Received: {maximum_size}")
+
+        self.maximum_size = maximum_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._schemas: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    # Private methods
+    @staticmethod
+    def _key(schema_class: type, content: Any) -> tuple:
+        if isinstance(content, str):
+            content = content.encode("UTF-8")
+        return (schema_class, hashlib.sha256(content).digest())
+
+    def _get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            schema = self._schemas.get(key)
+            if schema is None:
+                self.misses += 1
+                return None
+            self._schemas.move_to_end(key)
+            self.hits += 1
+            return schema
+
+    def _put(self, key: tuple, schema: Any) -> Any:
+        schema.freeze()
+        with self._lock:
+            # Concurrent misses: the first stored instance is the shared one
+            schema = self._schemas.setdefault(key, schema)
+            self._schemas.move_to_end(key)
+            while len(self._schemas) > self.maximum_size:
+                self._schemas.popitem(last=False)
+                self.evictions += 1
+        return schema
+
+    # Public methods
+    def load_json(self, schema_class: type, text_content: Any, registry: Optional[Any] = None) -> Any:
+        key = self._key(schema_class, text_content)
+        schema = self._get(key)
+        if schema is None:
+            schema = self._put(key, schema_class.from_json(text_content, registry))
+        return schema
+
+    def load_dict(self, schema_class: type, data: dict, registry: Optional[Any] = None) -> Any:
+        try:
+            # Key order is kept: the mapping rules are applied in definition order
+            content = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError):
+            content = None
+
+        if content is None:
+            return schema_class.from_dict(data, registry)
+
+        # Keyed by the JSON form alone: hits skip the coercion check
+        key = self._key(schema_class, content)
+        schema = self._get(key)
+        if schema is None:
+            schema = schema_class.from_dict(data, registry)
+            # Content coerced by json.dumps (1 -> "1" keys, tuples -> lists) is not stored
+            if json.loads(content) == data:
+                schema = self._put(key, schema)
+        return schema
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._schemas),
+                "maximum_size": self.maximum_size
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self.hits = self.misses = self.evictions = 0
+
+class ResultCache:
+    """
+    Cache LRU de resultados de validacion de un esquema.
+
+    Solo se almacenan valores inmutables (str, bytes, int, float, bool, tuple,
+    frozenset), identificados por su valor y su tipo (1, 1.0 y True son claves
+    distintas). Los valores mutables omiten el cache. La memoria se acota por
+    cantidad de entradas y por tamaño aproximado (sys.getsizeof) de los valores.
+
+    Los cambios de los sub-esquemas no invalidan el cache de su esquema padre:
+    el esquema congela sus sub-esquemas al habilitar el cache, que solo se
+    utiliza cuando todos estan congelados.
+    """
+    def __init__(self, maximum_size: int = 4096, maximum_bytes: int = 1048576, maximum_item_bytes: int = 1024) -> None:
+        for label, limit in (("maximum size", maximum_size), ("maximum bytes", maximum_bytes), ("maximum item bytes", maximum_item_bytes)):
+            if not isinstance(limit, int) or limit < 1:
+                raise ValueError(f"The {label} must be a positive integer. Received: {limit}")
+
+        self.maximum_size = maximum_size
+        self.maximum_bytes = maximum_bytes
+        self.maximum_item_bytes = min(maximum_item_bytes, maximum_bytes)
+        self._results: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bypasses: int = 0
+        self.evictions: int = 0
+        self.size_bytes: int = 0
+        self.sub_schemas_frozen: bool = False # Frozen sub-schemas stay frozen: verified until it holds
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __getstate__(self) -> dict:
+        # Transferred to worker processes without its entries
+        return {"maximum_size": self.maximum_size, "maximum_bytes": self.maximum_bytes, "maximum_item_bytes": self.maximum_item_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    # Private methods
+    @classmethod
+    def _key(cls, value: Any) -> Any:
+        # Type-tagged key (TypeError for non cacheable values)
+        value_type = type(value)
+        if value_type in SCALAR_TYPES:
+            return (value_type, value)
+        if value_type is tuple:
+            item_types = tuple(map(type, value))
+            if SCALAR_TYPES.issuperset(item_types):
+                return (tuple, value, item_types) # Flat tuple: the item types align with the items
+            return (tuple, tuple([cls._key(item) for item in value]))
+        if value_type is frozenset:
+            return (frozenset, frozenset([cls._key(item) for item in value]))
+        raise TypeError(f"Non cacheable value: {value_type.__name__}")
+
+    @classmethod
+    def _size(cls, value: Any) -> int:
+        if type(value) is tuple or type(value) is frozenset:
+            return sys.getsizeof(value) + sum(cls._size(item) for item in value)
+        return sys.getsizeof(value)
+
+    # Public methods
+    def usable(self, sub_schemas: Callable[[], Iterable]) -> bool:
+        "Whether the stored results can be used: only when every sub-schema is frozen (their changes are not observed)."
+        if self.sub_schemas_frozen:
+            return True
+        if all(schema.frozen for schema in sub_schemas()):
+            self.sub_schemas_frozen = True
+            return True
+        self.bypasses += 1
+        return False
+
+    def check(self, value: Any, check: Callable[[Any], Any]) -> Any:
+        "Cached result of check(value); the check runs on misses and non cacheable values."
+        value_type = type(value)
+        if value_type in SCALAR_TYPES:
+            key = (value_type, value)
+        else:
+            try:
+                key = self._key(value)
+            except TypeError:
+                self.bypasses += 1
+                return check(value)
+
+        # Fast path: dict lookup (counters are approximate under concurrent use)
+        result = self._results.get(key, MISSING)
+        if result is not MISSING:
+            self.hits += 1
+            try:
+                self._results.move_to_end(key)
+            except KeyError:
+                pass # Evicted by another thread
+            return result[0]
+
+        result = check(value)
+        size = self._size(value)
+        with self._lock:
+            self.misses += 1
+            if size <= self.maximum_item_bytes and key not in self._results:
+                self._results[key] = (result, size)
+                self.size_bytes += size
+                while len(self._results) > self.maximum_size or self.size_bytes > self.maximum_bytes:
+                    self.size_bytes -= self._results.popitem(last=False)[1][1]
+                    self.evictions += 1
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypasses": self.bypasses,
+                "evictions": self.evictions,
+                "size": len(self._results),
+                "size_bytes": self.size_bytes,
+                "maximum_size": self.maximum_size,
+                "maximum_bytes": self.maximum_bytes
+            }
+
+    def invalidate(self) -> None:
+        "Drop the stored results (the schema constraints changed); the counters are kept."
+        with self._lock:
+            self._results.clear()
+            self.size_bytes = 0
+            self.sub_schemas_frozen = False # possible_values may have been replaced
+
+    def clear(self) -> None:
+        self.invalidate()
+        with self._lock:
+            self.hits = self.misses = self.bypasses = self.evictions = 0
@@ -0,0 +1,280 @@
+# Library import
+import struct
+from typing import Any, Dict, List
+from .primitive_data import PrimitiveData
+from .complex_data import ComplexData
+
+# Constants definition
+MAGIC: bytes = b"DV"
+VERSION: int = 1
+MAXIMUM_DEPTH: int = 256
+
+# Value tags
+TAG_NONE = 0x00
+TAG_FALSE = 0x01
+TAG_TRUE = 0x02
+TAG_INT = 0x03
+TAG_FLOAT = 0x04
+TAG_STR = 0x05
+TAG_STR_REF = 0x06
+TAG_BYTES = 0x07
+TAG_BYTEARRAY = 0x08
+TAG_LIST = 0x09
+TAG_TUPLE = 0x0A
+TAG_SET = 0x0B
+TAG_FROZENSET = 0x0C
+TAG_DICT = 0x0D
+TAG_TYPE = 0x0E
+TAG_PRIMITIVE = 0x0F
+TAG_COMPLEX = 0x10
+
+# Schema field tags (0 ends the field list)
+FIELD_END = 0
+FIELDS: tuple = (
+    (1, "data_type"), (2, "value"), (3, "name"), (4, "description"),
+    (5, "maximum_length"), (6, "minimum_length"), (7, "maximum_size"), (8, "minimum_size"),
+    (9, "possible_values"), (10, "regular_expression"), (11, "data_class"), (12, "discriminator")
+)
+FIELD_NAMES: Dict[int, str] = dict(FIELDS)
+
+# Secure type mapping (type codes)
+TYPES: tuple = (type(None), bool, int, float, str, bytes, bytearray, list, tuple, set, frozenset, dict)
+TYPE_CODES: Dict[type, int] = {data_type: code for code, data_type in enumerate(TYPES)}
+
+FLOAT_FORMAT = struct.Struct(">d")
+
+# Classes definition
+class Encoder:
+    "Codificador binario etiquetado. Las cadenas repetidas se codifican como referencias."
+    __slots__ = ("buffer", "strings")
+
+    def __init__(self) -> None:
+        self.buffer = bytearray(MAGIC)
+        self.buffer.append(VERSION)
+        self.strings: Dict[str, int] = {}
+
+    # Private methods
+    def _varint(self, number: int) -> None:
+        buffer = self.buffer
+        while number > 0x7F:
+            buffer.append((number & 0x7F) | 0x80)
+            number >>= 7
+        buffer.append(number)
+
+    def _sized(self, tag: int, data: bytes) -> None:
+        self.buffer.append(tag)
+        self._varint(len(data))
+        self.buffer += data
+
+    def _items(self, tag: int, items: Any) -> None:
+        self.buffer.append(tag)
+        self._varint(len(items))
+        for item in items:
+            self.encode(item)
+
+    def _mapping(self, mapping: Any) -> None:
+        self.buffer.append(TAG_DICT)
+        self._varint(len(mapping))
+        for key, value in mapping.items():
+            self.encode(key)
+            self.encode(value)
+
+    def _schema(self, tag: int, schema: Any) -> None:
+        self.buffer.append(tag)
+        for field_tag, attribute in FIELDS:
+            content = getattr(schema, attribute, None)
+            if content is None or (attribute == "data_class" and content is False):
+                continue
+            self._varint(field_tag)
+            self.encode(content)
+        self._varint(FIELD_END)
+
+    # Public methods
+    def encode(self, element: Any) -> None:
+        element_type = type(element)
+
+        if element is None:
+            self.buffer.append(TAG_NONE)
+        elif element_type is bool:
+            self.buffer.append(TAG_TRUE if element else TAG_FALSE)
+        elif element_type is int:
+            self.buffer.append(TAG_INT)
+            self._varint(element << 1 if element >= 0 else ((-element) << 1) - 1) # Zigzag
+        elif element_type is float:
+            self.buffer.append(TAG_FLOAT)
+            self.buffer += FLOAT_FORMAT.pack(element)
+        elif element_type is str:
+            reference = self.strings.get(element)
+            if reference is not None:
+                self.buffer.append(TAG_STR_REF)
+                self._varint(reference)
+            else:
+                self.strings[element] = len(self.strings)
+                self._sized(TAG_STR, element.encode("UTF-8"))
+        elif element_type is bytes:
+            self._sized(TAG_BYTES, element)
+        elif element_type is bytearray:
+            self._sized(TAG_BYTEARRAY, element)
+        elif element_type is list:
+            self._items(TAG_LIST, element)
+        elif element_type is tuple:
+            self._items(TAG_TUPLE, element)
+        elif element_type is set:
+            self._items(TAG_SET, element)
+        elif element_type is frozenset:
+            self._items(TAG_FROZENSET, element)
+        elif element_type is dict:
+            self._mapping(element)
+        elif element_type is type:
+            code = TYPE_CODES.get(element)
+            if code is None:
+                raise TypeError(f"Unsupported or unsafe data type: {element.__name__}")
+            self.buffer.append(TAG_TYPE)
+            self._varint(code)
+        elif isinstance(element, ComplexData):
+            self._schema(TAG_COMPLEX, element)
+        elif isinstance(element, PrimitiveData):
+            self._schema(TAG_PRIMITIVE, element)
+        elif isinstance(element, list):
+            self._items(TAG_LIST, element) # Subclasses (track(), lazy values) are decoded as plain lists
+        elif isinstance(element, dict):
+            self._mapping(element)
+        else:
+            raise TypeError(f"Object of type {element_type.__name__} is not binary serializable")
+
+class Decoder:
+    "Decodificador del formato binario etiquetado."
+    __slots__ = ("data", "position", "strings", "depth")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.position = 0
+        self.strings: List[str] = []
+        self.depth = 0
+
+        if bytes(self.data[:2]) != MAGIC:
+            raise ValueError("Invalid binary format: magic number not found")
+        if len(self.data) < 3 or self.data[2] != VERSION:
+            raise ValueError(f"Unsupported binary format version: {self.data[2] if len(self.data) > 2 else None}")
+        self.position = 3
+
+    # Private methods
+    def _byte(self) -> int:
+        if self.position >= len(self.data):
+            raise ValueError("Invalid binary format: unexpected end of data")
+        byte = self.data[self.position]
+        self.position += 1
+        return byte
+
+    def _varint(self) -> int:
+        number = shift = 0
+        while True:
+            byte = self._byte()
+            number |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return number
+            shift += 7
+
+    def _take(self, size: int) -> memoryview:
+        end = self.position + size
+        if end > len(self.data):
+            raise ValueError("Invalid binary format: unexpected end of data")
+        chunk = self.data[self.position:end]
+        self.position = end
+        return chunk
+
+    def _schema(self, schema_class: type) -> Any:
+        arguments = {}
+        while True:
+            field_tag = self._varint()
+            if field_tag == FIELD_END:
+                break
+            attribute = FIELD_NAMES.get(field_tag)
+            if attribute is None:
+                raise ValueError(f"Invalid binary format: unknown field tag {field_tag}")
+            arguments[attribute] = self.decode()
+
+        if "data_type" not in arguments:
+            raise ValueError("Invalid binary format: missing data type")
+        if schema_class is PrimitiveData:
+            arguments.pop("discriminator", None)
+        arguments.setdefault("value", None)
+        return schema_class(**arguments)
+
+    # Public methods
+    def decode(self) -> Any:
+        tag = self._byte()
+
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_FALSE:
+            return False
+        if tag == TAG_TRUE:
+            return True
+        if tag == TAG_INT:
+            number = self._varint()
+            return -((number + 1) >> 1) if number & 1 else number >> 1
+        if tag == TAG_FLOAT:
+            return FLOAT_FORMAT.unpack(self._take(8))[0]
+        if tag == TAG_STR:
+            text = str(self._take(self._varint()), "UTF-8")
+            self.strings.append(text)
+            return text
+        if tag == TAG_STR_REF:
+            reference = self._varint()
+            if reference >= len(self.strings):
+                raise ValueError(f"Invalid binary format: unknown string reference {reference}")
+            return self.strings[reference]
+        if tag == TAG_BYTES:
+            return bytes(self._take(self._varint()))
+        if tag == TAG_BYTEARRAY:
+            return bytearray(self._take(self._varint()))
+        if tag == TAG_TYPE:
+            code = self._varint()
+            if code >= len(TYPES):
+                raise ValueError(f"Invalid binary format: unknown type code {code}")
+            return TYPES[code]
+
+        # Containers and schemas (recursive)
+        self.depth += 1
+        if self.depth > MAXIMUM_DEPTH:
+            raise ValueError("Invalid binary format: maximum nesting depth exceeded")
+        try:
+            if tag in (TAG_LIST, TAG_TUPLE, TAG_SET, TAG_FROZENSET):
+                items = [self.decode() for _ in range(self._varint())]
+                if tag == TAG_LIST:
+                    return items
+                try:
+                    return (tuple, set, frozenset)[tag - TAG_TUPLE](items)
+                except TypeError:
+                    raise ValueError("Invalid binary format: unhashable set element") from None
+            if tag == TAG_DICT:
+                result = {}
+                for _ in range(self._varint()):
+                    key, value = self.decode(), self.decode()
+                    try:
+                        result[key] = value
+                    except TypeError:
+                        raise ValueError("Invalid binary format: unhashable dictionary key") from None
+                return result
+            if tag == TAG_PRIMITIVE:
+                return self._schema(PrimitiveData)
+            if tag == TAG_COMPLEX:
+                return self._schema(ComplexData)
+        finally:
+            self.depth -= 1
+
+        raise ValueError(f"Invalid binary format: unknown tag {tag}")
+
+# Functions definition
+def dumps(element: Any) -> bytes:
+    encoder = Encoder()
+    encoder.encode(element)
+    return bytes(encoder.buffer)
+
+def loads(data: bytes) -> Any:
+    decoder = Decoder(data)
+    element = decoder.decode()
+    if decoder.position != len(decoder.data):
+        raise ValueError("Invalid binary format: trailing data")
+    return element
@@ -0,0 +1,428 @@
+# Library import
+import hashlib
+import marshal
+import math
+import os
+import stat
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+from .primitive_data import PrimitiveData
+from .complex_data import ComplexData
+from .compiler import CompiledValidator, TEXT_TYPES, NUMERIC_TYPES
+from .index import ValidatorIndex, nested_schemas
+
+# Constants definition
+GENERATOR_VERSION: int = 1 # Part of the cache key: bump when the generated code changes
+TYPE_NAMES: Dict[type, str] = {
+    str: "str", int: "int", float: "float", bool: "bool", bytes: "bytes", bytearray: "bytearray",
+    list: "list", tuple: "tuple", set: "set", frozenset: "frozenset", dict: "dict", type(None): "_NoneType"
+}
+HASHABLE_TYPES: tuple = (str, int, float, bool, bytes, type(None))
+HEADER: str = '''# Generated by datavalue (code generation version {version}): do not edit.
+# Schema: {name}
+import re
+
+_NoneType = type(None)
+
+def _contains(literals, element):
+    try:
+        return element in literals
+    except TypeError:
+        return False
+
+def _get(rules, key):
+    try:
+        return rules.get(key)
+    except TypeError:
+        return None
+
+def _binary_pattern(expression):
+    try:
+        return re.compile(expression.encode() if isinstance(expression, str) else expression)
+    except (re.error, ValueError, TypeError):
+        return None
+'''
+LOADED: Dict[str, Any] = {} # Code objects of this process, by cache file
+
+# Functions definition
+def default_cache_directory() -> str:
+    directory = os.environ.get("DATAVALUE_CACHE_DIR")
+    if directory:
+        return directory
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "datavalue", "validators")
+
+def _literal(element: Any) -> str:
+    # Source of a literal that evaluates to an equal value of the same type
+    element_type = type(element)
+    if element_type in (str, int, bool, bytes, type(None)):
+        return repr(element)
+    if element_type is float and math.isfinite(element):
+        return repr(element)
+    if element_type is tuple:
+        return "(" + "".join(_literal(item) + ", " for item in element) + ")"
+    if element_type is list:
+        return "[" + ", ".join(_literal(item) for item in element) + "]"
+    if element_type is dict:
+        return "{" + ", ".join(f"{_literal(key)}: {_literal(item)}" for key, item in element.items()) + "}"
+    if element_type is frozenset:
+        return "frozenset((" + "".join(item + ", " for item in sorted(map(_literal, element))) + "))"
+    raise NotInlinable(f"Literal of type {element_type.__name__} can not be inlined")
+
+def _type_name(data_type: Any) -> str:
+    name = TYPE_NAMES.get(data_type)
+    if name is None:
+        raise NotInlinable(f"Type {data_type!r} can not be inlined")
+    return name
+
+def _subclass(data_type: Any, types: tuple) -> bool:
+    return isinstance(data_type, type) and issubclass(data_type, types)
+
+# Classes definition
+class NotInlinable(Exception):
+    "Schema content without a source form: the schema is validated by its interpreted is_valid()."
+
+class SourceGenerator:
+    """
+    Generador del codigo fuente de un validador: una funcion por esquema (y sub-
+    esquema), con las restricciones como verificaciones en linea y los literales
+    como constantes del modulo.
+
+    El modulo define build(S), que recibe los esquemas en el orden de recorrido
+    (para el valor de validate(None), y los esquemas sin forma de codigo).
+    """
+    __slots__ = ("schemas", "numbers", "constants", "constant_names", "definitions", "tables", "counter")
+
+    def __init__(self, root: Any) -> None:
+        self.schemas: List[Any] = []
+        self.numbers: Dict[int, int] = {}
+        self.constants: List[str] = []
+        self.constant_names: Dict[str, str] = {}
+        self.definitions: List[str] = []
+        self.tables: List[str] = []
+        self.counter: int = 0
+        self._number(root)
+
+    # Private methods
+    def _number(self, schema: Any) -> None:
+        # Depth-first order: shared sub-schemas are generated once
+        if id(schema) in self.numbers:
+            return None
+        self.numbers[id(schema)] = len(self.schemas)
+        self.schemas.append(schema)
+        for child in nested_schemas(schema.possible_values):
+            self._number(child)
+
+    def _constant(self, prefix: str, expression: str) -> str:
+        name = self.constant_names.get(expression)
+        if name is None:
+            name = self.constant_names[expression] = f"{prefix}{len(self.constants)}"
+            self.constants.append(f"{name} = {expression}")
+        return name
+
+    def _name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def _function(self, prefix: str, parameter: str, expression: str) -> str:
+        name = self._name(prefix)
+        self.definitions.append(f"    def {name}({parameter}):\n        return {expression}\n")
+        return name
+
+    def _matcher(self, index: ValidatorIndex, variable: str, hashable: bool = False) -> str:
+        # Same order as ValidatorIndex.match: literals, types, schemas
+        parts = []
+        if index.literals:
+            literals = self._constant("L", _literal(frozenset(index.literals)))
+            parts.append(f"{variable} in {literals}" if hashable else f"_contains({literals}, {variable})")
+        for literal in index.unhashable_literals:
+            parts.append(f"{variable} == {_literal(literal)}")
+        if index.types:
+            names = "".join(_type_name(data_type) + ", " for data_type in index.types)
+            parts.append(f"isinstance({variable}, ({names}))")
+        for schema in index.schemas:
+            parts.append(f"s{self.numbers[id(schema)]}({variable})")
+        return " or ".join(parts) if parts else "False"
+
+    def _primitive(self, schema: PrimitiveData) -> List[str]:
+        data_type = schema.data_type
+        lines = [f"if not isinstance(value, {_type_name(data_type)}): return False"]
+
+        minimum, maximum = schema.minimum_length, schema.maximum_length
+        if minimum is not None or maximum is not None:
+            if _subclass(data_type, TEXT_TYPES):
+                lines.append("length = len(value)")
+                guard = ""
+            else:
+                lines += [
+                    "if isinstance(value, (str, bytes, bytearray)): length = len(value)",
+                    "elif type(value) is int: length = len(str(value)) - (value < 0)",
+                    "elif isinstance(value, (int, float)): length = len([digit for digit in str(value) if digit.isdigit()])",
+                    "else: length = None",
+                ]
+                guard = "length is not None and "
+            if minimum is not None:
+                lines.append(f"if {guard}length < {_literal(minimum)}: return False")
+            if maximum is not None:
+                lines.append(f"if {guard}length > {_literal(maximum)}: return False")
+
+        minimum, maximum = schema.minimum_size, schema.maximum_size
+        if minimum is not None or maximum is not None:
+            indent = ""
+            if not _subclass(data_type, NUMERIC_TYPES):
+                lines.append("if isinstance(value, (int, float)):")
+                indent = "    "
+            if minimum is not None:
+                lines.append(f"{indent}if value < {_literal(minimum)}: return False")
+            if maximum is not None:
+                lines.append(f"{indent}if value > {_literal(maximum)}: return False")
+
+        if schema.possible_values is not None:
+            if schema._possible_index is None:
+                lines.append("return False") # Not iterable: rejected by validate()
+                return lines
+            hashable = _subclass(data_type, HASHABLE_TYPES)
+            lines.append(f"if not ({self._matcher(schema._possible_index, 'value', hashable)}): return False")
+
+        expression = schema.regular_expression
+        if expression is not None:
+            text_pattern = self._constant("P", f"re.compile({_literal(expression)})") if isinstance(expression, str) else "None"
+            binary_pattern = self._constant("P", f"_binary_pattern({_literal(expression)})")
+            text_check = "return False" if text_pattern == "None" else f"if {text_pattern}.fullmatch(value) is None: return False"
+            binary_check = f"if {binary_pattern} is None or {binary_pattern}.fullmatch(value) is None: return False"
+            if _subclass(data_type, str):
+                lines.append(text_check)
+            elif _subclass(data_type, (bytes, bytearray)):
+                lines.append(binary_check)
+            else:
+                lines += [
+                    "if isinstance(value, str):", f"    {text_check}",
+                    "elif isinstance(value, (bytes, bytearray)):", f"    {binary_check}",
+                ]
+
+        return lines
+
+    def _mapping(self, schema: ComplexData) -> List[str]:
+        key_index = schema._key_index
+        exact = ", ".join(
+            f"{_literal(key)}: ({position}, {self._function('r', 'item', self._matcher(value_index, 'item'))})"
+            for key, (position, value_index) in key_index.exact.items()
+        )
+        rules = self._name("M")
+        self.tables.append(f"    {rules} = {{{exact}}}\n")
+
+        if not key_index.scanned:
+            return [
+                "for key, item in value.items():",
+                f"    rule = _get({rules}, key)",
+                "    if rule is None or not rule[1](item): return False",
+            ]
+
+        # Type/schema keys: the first matching rule defined before the exact key wins
+        lines = [
+            "for key, item in value.items():",
+            f"    rule = _get({rules}, key)",
+            f"    limit = rule[0] if rule is not None else {key_index.size}",
+        ]
+        keyword = "if"
+        for position, schema_key, value_index in key_index.scanned:
+            key_matcher = self._matcher(ValidatorIndex([schema_key]), "key")
+            check = self._function("r", "item", self._matcher(value_index, "item"))
+            lines.append(f"    {keyword} {position} < limit and ({key_matcher}): check = {check}")
+            keyword = "elif"
+        lines += [
+            "    elif rule is None: return False",
+            "    else: check = rule[1]",
+            "    if not check(item): return False",
+        ]
+        return lines
+
+    def _positional(self, schema: ComplexData) -> List[str]:
+        if schema._positional_index is None:
+            return ["return False"] # Not a (keys, values) schema: rejected by validate()
+
+        keys_index, values_index = schema._positional_index
+        lines = ["for key, item in value.items():"]
+        if keys_index is not None:
+            lines.append(f"    if not ({self._matcher(keys_index, 'key')}): return False")
+        if values_index is not None:
+            lines.append(f"    if not ({self._matcher(values_index, 'item')}): return False")
+        return lines if len(lines) > 1 else []
+
+    def _discriminated(self, schema: ComplexData) -> str:
+        # Tagged elements only try the schemas registered for their tag
+        index, discriminator_index = schema._element_index, schema._discriminator_index
+        matcher = self._matcher(index, "element")
+        literal_matcher = self._matcher(ValidatorIndex(list(index.literals) + list(index.unhashable_literals) + list(index.types)), "element")
+        cases = ", ".join(
+            f"{_literal(tag)}: {self._function('c', 'element', self._matcher(ValidatorIndex(schemas), 'element'))}"
+            for tag, schemas in discriminator_index.cases.items()
+        )
+        fallback = self._function("c", "element", self._matcher(ValidatorIndex(discriminator_index.fallback), "element"))
+        literal_prefix = "" if literal_matcher == "False" else f"{literal_matcher} or "
+        table = self._name("C")
+        self.tables.append(f"    {table} = {{{cases}}}\n")
+
+        name = self._name("d")
+        discriminator = _literal(discriminator_index.discriminator)
+        self.definitions.append(
+            f"    def {name}(element):\n"
+            f"        if type(element) is dict and {discriminator} in element:\n"
+            f"            try:\n"
+            f"                case = {table}.get(element[{discriminator}], {fallback})\n"
+            f"            except TypeError:\n"
+            f"                return {matcher}\n"
+            f"            return {literal_prefix}case(element)\n"
+            f"        return {matcher}\n"
+        )
+        return f"{name}(element)"
+
+    def _complex(self, schema: ComplexData) -> List[str]:
+        data_type = schema.data_type
+        lines = [f"if not isinstance(value, {_type_name(data_type)}): return False", "length = len(value)"]
+        if schema.minimum_length is not None:
+            lines.append(f"if length < {_literal(schema.minimum_length)}: return False")
+        if schema.maximum_length is not None:
+            lines.append(f"if length > {_literal(schema.maximum_length)}: return False")
+
+        if not schema.possible_values:
+            return lines
+
+        # Only the content checks reachable for the data type are generated
+        if issubclass(data_type, dict):
+            return lines + (self._mapping(schema) if schema._key_index is not None else self._positional(schema))
+
+        if schema._element_index is None:
+            return lines + ["for element in value:", "    return False"]
+        if schema._discriminator_index is not None:
+            return lines + ["for element in value:", f"    if not {self._discriminated(schema)}: return False"]
+        return lines + ["for element in value:", f"    if not ({self._matcher(schema._element_index, 'element')}): return False"]
+
+    def _schema_function(self, number: int, schema: Any) -> str:
+        try:
+            lines = self._complex(schema) if isinstance(schema, ComplexData) else self._primitive(schema)
+        except NotInlinable:
+            return f"    def s{number}(value):\n        return S[{number}].is_valid(value)\n"
+
+        # Same semantics as validate(None): the schema value is validated
+        body = "".join(f"            {line}\n" for line in lines)
+        return (
+            f"    def s{number}(value):\n"
+            f"        if value is None:\n"
+            f"            value = S[{number}].value\n"
+            f"        try:\n{body}"
+            f"            return True\n"
+            f"        except Exception:\n"
+            f"            return False\n"
+        )
+
+    def _shape(self, element: Any) -> str:
+        # Canonical form of the validator content: sub-schemas by traversal number
+        if isinstance(element, (PrimitiveData, ComplexData)):
+            return f"S{self.numbers[id(element)]}"
+        if isinstance(element, type):
+            return _type_name(element)
+        if isinstance(element, dict):
+            return "{" + ", ".join(f"{self._shape(key)}: {self._shape(item)}" for key, item in element.items()) + "}"
+        if type(element) in (list, tuple):
+            return type(element).__name__ + "(" + ", ".join(self._shape(item) for item in element) + ")"
+        if type(element) in (set, frozenset):
+            return "set(" + ", ".join(sorted(self._shape(item) for item in element)) + ")"
+        return _literal(element)
+
+    # Public methods
+    def fingerprint(self) -> Optional[str]:
+        "Canonical description of everything the generated code depends on (None: content without a source form)."
+        try:
+            return "\n".join(
+                f"{type(schema).__name__}|{self._shape(schema.data_type)}|{self._shape(schema._constraints.values())}"
+                f"|{self._shape(getattr(schema, 'discriminator', None))}|{self._shape(schema.possible_values)}"
+                for schema in self.schemas
+            )
+        except NotInlinable:
+            return None
+
+    def source(self) -> str:
+        functions = [self._schema_function(number, schema) for number, schema in enumerate(self.schemas)]
+        root = self.schemas[0]
+        header = HEADER.format(version=GENERATOR_VERSION, name=str(root.name or type(root).__name__).replace("\n", " "))
+        constants = "".join(line + "\n" for line in self.constants)
+        return (
+            f"{header}\n{constants}\ndef build(S):\n"
+            + "".join(functions) + "".join(self.definitions) + "".join(self.tables)
+            + "    return s0\n"
+        )
+
+# Functions definition
+def generate_source(schema: Any) -> str:
+    return SourceGenerator(schema).source()
+
+def cache_key(schema: Any, generator: Optional[SourceGenerator] = None) -> Optional[str]:
+    "Hash of the canonical schema content (None if some content has no source form: not cached)."
+    fingerprint = (generator or SourceGenerator(schema)).fingerprint()
+    if fingerprint is None:
+        return None
+    return hashlib.sha256(f"{GENERATOR_VERSION}:{sys.implementation.cache_tag}:{fingerprint}".encode("UTF-8")).hexdigest()
+
+def _trusted(status: os.stat_result) -> bool:
+    # Executed code: only files of the current user, not writable by other users
+    if hasattr(os, "getuid") and status.st_uid != os.getuid():
+        return False
+    return not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+def _read_code(path: str) -> Optional[Any]:
+    try:
+        with open(path, "rb") as file:
+            # Verified on the open descriptor: the file can not be replaced in between
+            if not _trusted(os.fstat(file.fileno())):
+                return None # Regenerated (and replaced, if the directory allows it)
+            return marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None # Missing or corrupt: regenerated
+
+def _write_code(path: str, code: Any) -> None:
+    # Atomic replace: concurrent workers never read a partial file (mkstemp creates it with mode 0o600)
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                marshal.dump(code, file)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+    except OSError:
+        pass # Read-only or full cache directory: the validator still works
+
+def compile_source(schema: Any, cache_directory: Optional[str] = None, cache: bool = True) -> CompiledValidator:
+    """
+    Genera el codigo fuente especializado del esquema, lo compila, y lo almacena
+    en disco (por el hash del esquema canonico): los procesos que inician con
+    el mismo esquema cargan el codigo compilado, sin generarlo.
+    """
+    generator = SourceGenerator(schema)
+    key = cache_key(schema, generator) if cache else None
+    path = os.path.join(cache_directory or default_cache_directory(), f"{key}.{sys.implementation.cache_tag}.marshal") if key is not None else None
+    code = LOADED.get(path) if path is not None else None
+
+    if code is None and path is not None:
+        code = _read_code(path)
+        stored = code is not None
+    else:
+        stored = True
+
+    if code is None:
+        code = compile(generator.source(), f"<datavalue validator {key or 'uncached'}>", "exec")
+
+    namespace: Dict[str, Any] = {}
+    exec(code, namespace)
+    predicate = namespace["build"](tuple(generator.schemas))
+
+    # Only code that was executed successfully is stored
+    if path is not None:
+        LOADED[path] = code
+        if not stored:
+            _write_code(path, code)
+    return CompiledValidator(schema, predicate)
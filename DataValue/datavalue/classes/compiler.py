@@ -0,0 +1,332 @@
+# Library import
+import re
+from typing import Any, Callable, Dict, Optional
+from .primitive_data import PrimitiveData
+from .complex_data import ComplexData
+from .index import ValidatorIndex, KeyIndex, DiscriminatorIndex
+
+# Constants definition
+Predicate = Callable[[Any], bool]
+TEXT_TYPES: tuple = (str, bytes, bytearray)
+NUMERIC_TYPES: tuple = (int, float)
+
+# Classes definition
+class CompiledValidator:
+    """
+    Validador especializado de un esquema PrimitiveData/ComplexData.
+
+    Es una instantanea del esquema en el momento de la compilacion: si se
+    modifican las restricciones del esquema, se debe compilar de nuevo.
+    """
+    __slots__ = ("schema", "is_valid")
+
+    def __init__(self, schema: Any, predicate: Predicate) -> None:
+        self.schema = schema
+        self.is_valid: Predicate = predicate
+
+    def __call__(self, data: Any = None) -> bool:
+        # Fast path: only the configured checks are executed
+        if self.is_valid(data):
+            return True
+
+        # Slow path: the interpreted validation builds the detailed exception
+        return self.schema.validate(data)
+
+    def __repr__(self) -> str:
+        return f"<CompiledValidator {self.schema.__class__.__name__}: {self.schema.name or self.schema.data_type.__name__}>"
+
+# Functions definition
+def compile_schema(schema: Any) -> CompiledValidator:
+    return CompiledValidator(schema, _safe_predicate(schema, {}))
+
+def _safe_predicate(schema: Any, memo: Dict[int, Predicate]) -> Predicate:
+    # Shared sub-schemas are compiled only once
+    predicate = memo.get(id(schema))
+    if predicate is None:
+        if isinstance(schema, ComplexData):
+            predicate = _compile_complex(schema, memo)
+        else:
+            predicate = _compile_primitive(schema, memo)
+        memo[id(schema)] = predicate
+
+    # Same semantics as validate(None): the schema value is validated
+    def safe_predicate(element: Any) -> bool:
+        if element is None:
+            element = schema.value
+        try:
+            return predicate(element)
+        except Exception:
+            return False
+
+    return safe_predicate
+
+def _compile_matcher(index: ValidatorIndex, memo: Dict[int, Predicate]) -> Predicate:
+    literals = index.literals
+    unhashable_literals = index.unhashable_literals
+    match_type = index.match_type if index.types else None
+    predicates = tuple(_safe_predicate(schema, memo) for schema in index.schemas)
+
+    # Common shapes: only literals, or only schemas
+    if not unhashable_literals and match_type is None:
+        if not predicates:
+            def literal_matcher(element: Any) -> bool:
+                try:
+                    return element in literals
+                except TypeError:
+                    return False
+            return literal_matcher
+
+        if not literals:
+            if len(predicates) == 1:
+                return predicates[0]
+
+            def schema_matcher(element: Any) -> bool:
+                for predicate in predicates:
+                    if predicate(element):
+                        return True
+                return False
+            return schema_matcher
+
+    def matcher(element: Any) -> bool:
+        try:
+            if element in literals:
+                return True
+        except TypeError:
+            pass
+        for literal in unhashable_literals:
+            if element == literal:
+                return True
+        if match_type is not None and match_type(element):
+            return True
+        for predicate in predicates:
+            if predicate(element):
+                return True
+        return False
+
+    return matcher
+
+def _reject(value: Any) -> bool:
+    return False
+
+def _chain(data_type: Any, checks: list) -> Predicate:
+    checks = tuple(checks)
+
+    if not checks:
+        return lambda value: isinstance(value, data_type)
+
+    if len(checks) == 1:
+        check = checks[0]
+        return lambda value: isinstance(value, data_type) and check(value)
+
+    def predicate(value: Any) -> bool:
+        if not isinstance(value, data_type):
+            return False
+        for check in checks:
+            if not check(value):
+                return False
+        return True
+
+    return predicate
+
+def _compile_length(minimum: Optional[int], maximum: Optional[int], data_type: Any) -> Predicate:
+    def in_range(length: int) -> bool:
+        if minimum is not None and length < minimum:
+            return False
+        if maximum is not None and length > maximum:
+            return False
+        return True
+
+    if isinstance(data_type, type) and issubclass(data_type, TEXT_TYPES):
+        return lambda value: in_range(len(value))
+
+    def check_length(value: Any) -> bool:
+        if isinstance(value, TEXT_TYPES):
+            return in_range(len(value))
+        if type(value) is int:
+            return in_range(len(str(value)) - (value < 0))
+        if isinstance(value, NUMERIC_TYPES):
+            return in_range(len([digit for digit in str(value) if digit.isdigit()]))
+        return True
+
+    return check_length
+
+def _compile_size(minimum: Any, maximum: Any) -> Predicate:
+    def check_size(value: Any) -> bool:
+        if not isinstance(value, NUMERIC_TYPES):
+            return True
+        if minimum is not None and value < minimum:
+            return False
+        if maximum is not None and value > maximum:
+            return False
+        return True
+
+    return check_size
+
+def _compile_regular_expression(expression: Any) -> Predicate:
+    # Patterns are compiled once, for text and binary values
+    text_pattern = re.compile(expression) if isinstance(expression, str) else None
+    try:
+        binary_pattern = re.compile(expression.encode() if isinstance(expression, str) else expression)
+    except (re.error, ValueError, TypeError):
+        binary_pattern = None
+
+    def check_regular_expression(value: Any) -> bool:
+        if isinstance(value, str):
+            pattern = text_pattern
+        elif isinstance(value, (bytes, bytearray)):
+            pattern = binary_pattern
+        else:
+            return True
+        return pattern is not None and pattern.fullmatch(value) is not None
+
+    return check_regular_expression
+
+def _compile_primitive(schema: PrimitiveData, memo: Dict[int, Predicate]) -> Predicate:
+    checks = []
+
+    if schema.minimum_length is not None or schema.maximum_length is not None:
+        checks.append(_compile_length(schema.minimum_length, schema.maximum_length, schema.data_type))
+
+    if schema.minimum_size is not None or schema.maximum_size is not None:
+        checks.append(_compile_size(schema.minimum_size, schema.maximum_size))
+
+    if schema.possible_values is not None:
+        if schema._possible_index is None:
+            checks.append(_reject) # Not iterable: rejected by validate()
+        else:
+            checks.append(_compile_matcher(schema._possible_index, memo))
+
+    if schema.regular_expression is not None:
+        checks.append(_compile_regular_expression(schema.regular_expression))
+
+    return _chain(schema.data_type, checks)
+
+def _compile_mapping(key_index: KeyIndex, memo: Dict[int, Predicate]) -> Predicate:
+    # Exact keys: dict lookup; type/schema keys: scanned in definition order
+    exact = {key: (position, _compile_matcher(value_index, memo)) for key, (position, value_index) in key_index.exact.items()}
+    scanned = tuple(
+        (position, _compile_matcher(ValidatorIndex([schema_key]), memo), _compile_matcher(value_index, memo))
+        for position, schema_key, value_index in key_index.scanned
+    )
+    size = key_index.size
+
+    if not scanned:
+        def check_exact_mapping(data: dict) -> bool:
+            for input_key, input_value in data.items():
+                try:
+                    exact_rule = exact.get(input_key)
+                except TypeError:
+                    return False
+                if exact_rule is None or not exact_rule[1](input_value):
+                    return False
+            return True
+        return check_exact_mapping
+
+    def check_mapping(data: dict) -> bool:
+        for input_key, input_value in data.items():
+            try:
+                exact_rule = exact.get(input_key)
+            except TypeError:
+                exact_rule = None
+            limit = exact_rule[0] if exact_rule is not None else size
+
+            value_matcher = None
+            for position, key_matcher, scanned_matcher in scanned:
+                if position >= limit:
+                    break
+                if key_matcher(input_key):
+                    value_matcher = scanned_matcher
+                    break
+            if value_matcher is None:
+                if exact_rule is None:
+                    return False
+                value_matcher = exact_rule[1]
+
+            if not value_matcher(input_value):
+                return False
+        return True
+
+    return check_mapping
+
+def _compile_positional(positional_index: Optional[tuple], memo: Dict[int, Predicate]) -> Predicate:
+    if positional_index is None:
+        return _reject # Not a (keys, values) schema: rejected by validate()
+
+    keys_index, values_index = positional_index
+    key_matcher = _compile_matcher(keys_index, memo) if keys_index is not None else None
+    value_matcher = _compile_matcher(values_index, memo) if values_index is not None else None
+
+    def check_positional(data: dict) -> bool:
+        for key, value in data.items():
+            if key_matcher is not None and not key_matcher(key):
+                return False
+            if value_matcher is not None and not value_matcher(value):
+                return False
+        return True
+
+    return check_positional
+
+def _compile_discriminated(index: ValidatorIndex, discriminator_index: DiscriminatorIndex, matcher: Predicate, memo: Dict[int, Predicate]) -> Predicate:
+    # Tagged elements only try the schemas registered for their tag
+    discriminator = discriminator_index.discriminator
+    cases = {tag: _compile_matcher(ValidatorIndex(schemas), memo) for tag, schemas in discriminator_index.cases.items()}
+    fallback = _compile_matcher(ValidatorIndex(discriminator_index.fallback), memo)
+    literal_index = ValidatorIndex(list(index.literals) + list(index.unhashable_literals) + list(index.types))
+    literal_matcher = _compile_matcher(literal_index, memo)
+
+    def discriminated_matcher(element: Any) -> bool:
+        if type(element) is dict and discriminator in element:
+            try:
+                case_matcher = cases.get(element[discriminator], fallback)
+            except TypeError:
+                return matcher(element)
+            return literal_matcher(element) or case_matcher(element)
+        return matcher(element)
+
+    return discriminated_matcher
+
+def _compile_complex(schema: ComplexData, memo: Dict[int, Predicate]) -> Predicate:
+    checks = []
+    minimum, maximum = schema.minimum_length, schema.maximum_length
+
+    if minimum is not None or maximum is not None:
+        def check_length(value: Any) -> bool:
+            length = len(value)
+            if minimum is not None and length < minimum:
+                return False
+            if maximum is not None and length > maximum:
+                return False
+            return True
+        checks.append(check_length)
+    else:
+        # validate() always computes the length, so unsized values are rejected
+        checks.append(lambda value: len(value) >= 0)
+
+    possible_values = schema.possible_values
+    if possible_values:
+        # Only the content checks reachable for the data type are compiled
+        data_type = schema.data_type
+        accepts_dict = not isinstance(data_type, type) or issubclass(data_type, dict) or issubclass(dict, data_type)
+        accepts_collection = not isinstance(data_type, type) or not issubclass(data_type, dict)
+
+        dictionary_check = element_matcher = _reject
+        if accepts_dict:
+            if schema._key_index is not None:
+                dictionary_check = _compile_mapping(schema._key_index, memo)
+            else:
+                dictionary_check = _compile_positional(schema._positional_index, memo)
+        if accepts_collection and schema._element_index is not None:
+            element_matcher = _compile_matcher(schema._element_index, memo)
+            if schema._discriminator_index is not None:
+                element_matcher = _compile_discriminated(schema._element_index, schema._discriminator_index, element_matcher, memo)
+
+        def check_content(value: Any) -> bool:
+            if isinstance(value, dict):
+                return dictionary_check(value)
+            for element in value:
+                if not element_matcher(element):
+                    return False
+            return True
+        checks.append(check_content)
+
+    return _chain(schema.data_type, checks)
@@ -2,10 +2,19 @@
 from typing import Type, Optional, Any, Iterable, Dict, Union
 from .. import exceptions
 from .primitive_data import PrimitiveData
+from .index import ValidatorIndex, KeyIndex, DiscriminatorIndex, immutable_validators, nested_schemas
+from .layout import constraints, constraint_property, slot_state, restore_slots
 import json
 
 # Classes definition
 class ComplexData:
+    # Compact instances: the rarely used constraints live in a shared record (layout.Constraints)
+    __slots__ = (
+        "data_type", "value", "name", "data_class", "_constraints", "_discriminator", "_possible_values",
+        "_element_index", "_key_index", "_positional_index", "_discriminator_index",
+        "_pending_content", "_frozen", "_result_cache", "__weakref__"
+    )
+
     def __init__(self,
         data_type: Type[list] | Type[tuple] | Type[set] | Type[frozenset] | Type[dict],
         value: Any,
@@ -14,46 +23,171 @@ class ComplexData:
         maximum_length: Optional[int] = None, minimum_length: Optional[int] = None,
         possible_values: Optional[Union[Iterable, Dict[Any, Any]]] = None,
         
-        data_class: Optional[bool] = False
+        data_class: Optional[bool] = False,
+        discriminator: Optional[Any] = None
     ) -> None:
+        # Slot defaults (checked by the assignments below)
+        object.__setattr__(self, "_frozen", False)
+        object.__setattr__(self, "_result_cache", None)
+        object.__setattr__(self, "_pending_content", None)
+
         # Instance properties assignment
         self.data_type = data_type
         self.value = value
         self.name = name
-        self.description = description
-        self.maximum_length = maximum_length; self.minimum_length = minimum_length
+        self._constraints = constraints(description, maximum_length, minimum_length)
+        self._discriminator = discriminator
         self.possible_values = possible_values
         self.data_class = data_class
 
         # Validate constructor parameters
-        if self.possible_values:
-            # 1. Caso Diccionario (Mapping Schema)
-            if self.data_type is dict and isinstance(self.possible_values, dict):
-                pass # Es un esquema de mapeo válido
-
-            # 2. Caso Colecciones (list/tuple)
-            elif isinstance(self.possible_values, (list, tuple)):
-                if self.data_type is dict:
-                    if len(self.possible_values) not in (1, 2):
-                        raise ValueError("Possible values for dict must be 1 (keys) or 2 (keys, values) list/tuples.")
-                    if not isinstance(self.possible_values[0], (list, tuple)):
-                        raise ValueError("The first element of possible_values for dict must be a list/tuple of keys.")
-            else:
-                raise ValueError(f"Possible values must be list/tuple or dict. Received: {type(self.possible_values).__name__}")
-        
+        self._check_possible_values(self.possible_values)
 
         # Execute instance data validation
         if not self.data_class:
             self.validate()
     
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset attributes: the content of lazy schemas is built on first use
+        if name == "_pending_content" or name.startswith("__") or self._pending_content is None:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        self._materialize()
+        return getattr(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(f"Cannot modify frozen {self.__class__.__name__} attribute: {name}")
+        object.__setattr__(self, name, value)
+
+        # Stored validation results depend on the schema constraints
+        if self._result_cache is not None:
+            self._result_cache.invalidate()
+
+    def __getstate__(self) -> dict:
+        return slot_state(self)
+
+    def __setstate__(self, state: dict) -> None:
+        restore_slots(self, state)
+
+    # Properties
+    description = constraint_property("description")
+    maximum_length = constraint_property("maximum_length")
+    minimum_length = constraint_property("minimum_length")
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    @property
+    def result_cache(self) -> Optional[Any]:
+        return self._result_cache
+
+    @property
+    def possible_values(self) -> Optional[Union[Iterable, Dict[Any, Any]]]:
+        return self._possible_values
+
+    @possible_values.setter
+    def possible_values(self, possible_values: Optional[Union[Iterable, Dict[Any, Any]]]) -> None:
+        # Immutable copy: the indexes are built once (other types are reported by _check_possible_values)
+        if isinstance(possible_values, (list, tuple, dict)):
+            possible_values = immutable_validators(possible_values, positional=self.data_type is dict)
+        self._possible_values = possible_values
+        self._build_indexes()
+        if self._result_cache is not None:
+            self._freeze_sub_schemas()
+
+    @property
+    def discriminator(self) -> Optional[Any]:
+        return self._discriminator
+
+    @discriminator.setter
+    def discriminator(self, discriminator: Optional[Any]) -> None:
+        self._discriminator = discriminator
+        self._build_indexes()
+
     # Private methods
+    def _sub_schemas(self) -> Iterable:
+        return nested_schemas(self.possible_values)
+
+    def _freeze_sub_schemas(self) -> None:
+        # Required by the result cache: the results of the schema depend on its sub-schemas
+        for schema in self._sub_schemas():
+            if not schema.frozen:
+                schema.freeze()
+
+    def _build_indexes(self) -> None:
+        # Lookup structures built once per schema, instead of per validated element
+        possible_values = self._possible_values
+        self._element_index: Optional[ValidatorIndex] = None
+        self._key_index: Optional[KeyIndex] = None
+        self._positional_index: Optional[tuple] = None
+        self._discriminator_index: Optional[DiscriminatorIndex] = None
+
+        if not possible_values or not isinstance(possible_values, (dict, list, tuple, set, frozenset)):
+            return None
+
+        self._element_index = ValidatorIndex(possible_values)
+        if self._discriminator is not None:
+            self._discriminator_index = DiscriminatorIndex(self._discriminator, self._element_index.schemas)
+
+        if isinstance(possible_values, dict):
+            self._key_index = KeyIndex(possible_values)
+        elif isinstance(possible_values, (list, tuple)) and len(possible_values) == 2:
+            keys_schema, values_schema = possible_values
+            try:
+                self._positional_index = (
+                    ValidatorIndex(keys_schema) if keys_schema else None,
+                    ValidatorIndex(values_schema) if values_schema else None
+                )
+            except TypeError:
+                self._positional_index = None # Not a (keys, values) schema
+        else:
+            self._positional_index = (self._element_index, None)
+
+    def _check_possible_values(self, possible_values: Any) -> None:
+        if not possible_values:
+            return None
+
+        # 1. Caso Diccionario (Mapping Schema)
+        if self.data_type is dict and isinstance(possible_values, dict):
+            pass # Es un esquema de mapeo válido
+
+        # 2. Caso Colecciones (list/tuple)
+        elif isinstance(possible_values, (list, tuple)):
+            if self.data_type is dict:
+                if len(possible_values) not in (1, 2):
+                    raise ValueError("Possible values for dict must be 1 (keys) or 2 (keys, values) list/tuples.")
+                if not isinstance(possible_values[0], (list, tuple)):
+                    raise ValueError("The first element of possible_values for dict must be a list/tuple of keys.")
+        else:
+            raise ValueError(f"Possible values must be list/tuple or dict. Received: {type(possible_values).__name__}")
+
+    def _defer(self, raw_possible_values: Any, loader: Any) -> None:
+        # Lazy schemas: possible_values and its indexes are built on first use (see __getattr__)
+        for name in ("_possible_values", "_element_index", "_key_index", "_positional_index", "_discriminator_index"):
+            object.__delattr__(self, name)
+        object.__setattr__(self, "_pending_content", (raw_possible_values, loader))
+
+    def _materialize(self) -> None:
+        raw_possible_values, loader = self._pending_content
+        possible_values = self._load_possible_values(raw_possible_values, self.data_type, loader)
+        self._check_possible_values(possible_values)
+
+        # Deferred schemas may already be frozen (registry, freeze())
+        frozen = self._frozen
+        object.__setattr__(self, "_frozen", False)
+        try:
+            self.possible_values = possible_values
+        finally:
+            object.__setattr__(self, "_frozen", frozen)
+        object.__setattr__(self, "_pending_content", None)
+        if frozen:
+            self.freeze()
+
     def _is_match(self, element: Any, schema: Any) -> bool:
         # Validate data types
         if isinstance(schema, (PrimitiveData, ComplexData)):
-            try:
-                return schema.validate(element)
-            except:
-                return False
+            return schema.is_valid(element)
         
         # Validate class data types
         if isinstance(schema, type):
@@ -62,65 +196,59 @@ class ComplexData:
         # Validate literal values
         return element == schema
             
-    def _validate_collection(self, data: Any) -> bool:
-        element_index: int = 0
+    def _check_collection(self, data: Any, start: int = 0) -> Optional[exceptions.ValidationFailure]:
+        index = self._element_index
+        discriminator_index = self._discriminator_index
+        element_index: int = start
         for element in data:
-            if not any(self._is_match(element, validator) for validator in self.possible_values):
-                raise ValueError(f"[ComplexData] Element: {element}, on index: {element_index} is not allowed.")
+            # Union discriminada: solo se prueban los esquemas del valor discriminador
+            candidates = discriminator_index.candidates(element) if discriminator_index is not None else None
+            if not index.match(element, self._is_match, candidates):
+                return exceptions.ValidationFailure(ValueError, "[ComplexData] Element: {}, on index: {} is not allowed.", (element, element_index))
             element_index += 1
         
         # Return results
-        return True
+        return None
 
-    def _validate_dictionary(self, data: Any) -> bool:
+    def _check_dictionary(self, data: Any) -> Optional[exceptions.ValidationFailure]:
         # ESCENARIO A: Schema Mapping (possible_values es un dict)
-        if isinstance(self.possible_values, dict):
+        if self._key_index is not None:
             for input_key, input_value in data.items():
-                matched_rule = False
-                for schema_key, value_validators in self.possible_values.items():
-                    # Validamos si la clave de entrada coincide con la regla (soporta Regex o Tipos)
-                    if self._is_match(input_key, schema_key):
-                        matched_rule = True
-                        
-                        # Normalizamos validadores a lista para permitir múltiples opciones por clave
-                        if not isinstance(value_validators, (list, tuple, set, frozenset)):
-                            validators = [value_validators]
-                        else:
-                            validators = value_validators
-                        
-                        if not any(self._is_match(input_value, v) for v in validators):
-                            raise ValueError(f"[ComplexData] Invalid value '{input_value}' for key '{input_key}'")
-                        break # Match encontrado para esta clave, pasar a la siguiente
-                
-                if not matched_rule:
-                    raise ValueError(f"[ComplexData] Key '{input_key}' is not allowed by schema mapping.")
-            return True
+                # Clave exacta por diccionario; reglas de tipo/esquema por recorrido
+                value_index = self._key_index.resolve(input_key, self._is_match)
+                if value_index is None:
+                    return exceptions.ValidationFailure(ValueError, "[ComplexData] Key '{}' is not allowed by schema mapping.", (input_key,))
+
+                if not value_index.match(input_value, self._is_match):
+                    return exceptions.ValidationFailure(ValueError, "[ComplexData] Invalid value '{}' for key '{}'", (input_value, input_key))
+            return None
 
         # ESCENARIO B: Validación Posicional/Tradicional
-        if not isinstance(self.possible_values, (list, tuple)) or len(self.possible_values) != 2:
-            keys_schema = self.possible_values
-            values_schema = None
-        else:
-            keys_schema, values_schema = self.possible_values
+        if self._positional_index is None:
+            raise TypeError(f"Invalid (keys, values) schema for dict: {self.possible_values}")
+        keys_index, values_index = self._positional_index
         
         for key, value in data.items():
-            if keys_schema:
-                if not any(self._is_match(key, validator) for validator in keys_schema):
-                    raise ValueError(f"[ComplexData] Invalid key: {key}")
+            if keys_index is not None:
+                if not keys_index.match(key, self._is_match):
+                    return exceptions.ValidationFailure(ValueError, "[ComplexData] Invalid key: {}", (key,))
             
-            if values_schema:
-                if not any(self._is_match(value, validator) for validator in values_schema):
-                    raise ValueError(f"[ComplexData] Invalid value '{value}' for key '{key}'")
+            if values_index is not None:
+                if not values_index.match(value, self._is_match):
+                    return exceptions.ValidationFailure(ValueError, "[ComplexData] Invalid value '{}' for key '{}'", (value, key))
 
-        return True
+        return None
 
     @classmethod
-    def _serialize_recursive(cls, element: Any) -> Any:
+    def _serialize_recursive(cls, element: Any, references: Optional[Any] = None) -> Any:
         # 1. Caso: Instancias de validadores propios
         if isinstance(element, (PrimitiveData, ComplexData)):
+            # Esquemas repetidos: referencia a DEFINITIONS
+            if references is not None and references.is_shared(element):
+                return references.reference(element)
             return {
                 "__type__": element.__class__.__name__,
-                "content": element.to_dict()
+                "content": element._to_dict(references)
             }
         
         # 2. Caso: Referencias a tipos de clase (int, str, etc.)
@@ -129,28 +257,28 @@ class ComplexData:
         
         # 3. Caso: Colecciones estándar
         if isinstance(element, (list, tuple, set, frozenset)):
-            return [cls._serialize_recursive(i) for i in element]
+            return [cls._serialize_recursive(i, references) for i in element]
         
         if isinstance(element, dict):
             new_dict = {}
             for k, v in element.items():
                 # Serialización de clave: si es compleja, se convierte a JSON string
                 # para mantener la validez del formato JSON.
-                serialized_key = cls._serialize_recursive(k)
+                serialized_key = cls._serialize_recursive(k, references)
                 if isinstance(serialized_key, (dict, list)):
                     import json
                     key_repr = json.dumps(serialized_key)
                 else:
                     key_repr = str(serialized_key)
                 
-                new_dict[key_repr] = cls._serialize_recursive(v)
+                new_dict[key_repr] = cls._serialize_recursive(v, references)
             return new_dict
         
         # 4. Caso: Literales
         return element
 
     @classmethod
-    def _deserialize_recursive(cls, element: Any) -> Any:
+    def _deserialize_recursive(cls, element: Any, loader: Any) -> Any:
         SAFE_TYPES = {
             "list": list, "tuple": tuple, "set": set, "frozenset": frozenset, 
             "dict": dict, "str": str, "int": int, "float": float, "bool": bool,
@@ -163,11 +291,15 @@ class ComplexData:
                 obj_type = element["__type__"]
                 content = element["content"]
                 if obj_type == "PrimitiveData":
-                    return PrimitiveData.from_dict(content)
+                    return loader.load(PrimitiveData, content)
                 elif obj_type == "ComplexData":
-                    return cls.from_dict(content)
+                    return loader.load(cls, content)
                 raise ValueError(f"Unknown serialized object type: {obj_type}")
 
+            # CASO A.1: Referencia a un esquema compartido (DEFINITIONS)
+            if "$ref" in element and len(element) == 1:
+                return loader.resolve(element["$ref"])
+
             # CASO B: Es una referencia a un tipo (__class__)
             if "__class__" in element:
                 type_name = element["__class__"]
@@ -182,38 +314,57 @@ class ComplexData:
                 # Detectar si la clave es un objeto empaquetado en string
                 if isinstance(k, str) and (k.startswith('{') or k.startswith('[')):
                     try:
-                        import json
-                        potential_obj = json.loads(k)
+                        potential_obj = loader.parse_key(k)
                         if isinstance(potential_obj, (dict, list)):
-                            processed_key = cls._deserialize_recursive(potential_obj)
+                            processed_key = cls._deserialize_recursive(potential_obj, loader)
                     except:
                         pass # Si falla, se queda como string literal
                 
-                decoded_dict[processed_key] = cls._deserialize_recursive(v)
+                decoded_dict[processed_key] = cls._deserialize_recursive(v, loader)
             return decoded_dict
 
         if isinstance(element, list):
-            return [cls._deserialize_recursive(item) for item in element]
+            return [cls._deserialize_recursive(item, loader) for item in element]
         
         return element
 
-    # Public methods
-    def to_dict(self) -> dict:
-        return {
+    def _to_dict(self, references: Optional[Any] = None) -> dict:
+        data_structure = {
             "DATA_TYPE":self.data_type.__name__ if hasattr(self.data_type, '__name__') else str(self.data_type),
             "NAME":self.name,
             "DESCRIPTION":self.description,
             "VALUE":self._serialize_recursive(self.value),
             "MAXIMUM_LENGTH":self.maximum_length,
             "MINIMUM_LENGTH":self.minimum_length,
-            "POSSIBLE_VALUES":self._serialize_recursive(self.possible_values) if self.possible_values is not None else None,
-            "DATA_CLASS":self.data_class,
-            "__type__":"ComplexData"
+            "POSSIBLE_VALUES":self._serialize_recursive(self.possible_values, references) if self.possible_values is not None else None,
+            "DATA_CLASS":self.data_class
         }
 
-    
+        # Only discriminated unions carry the key (the output of other schemas is unchanged)
+        if self.discriminator is not None:
+            data_structure["DISCRIMINATOR"] = self.discriminator
+        data_structure["__type__"] = "ComplexData"
+        return data_structure
+
+    @classmethod
+    def _load_possible_values(cls, raw_possible: Any, data_type: type, loader: Any) -> Any:
+        # Procesamos los possible_values con el motor recursivo
+        possible_values = cls._deserialize_recursive(raw_possible, loader) if raw_possible is not None else None
+        
+        # Corrección de tipo para tuplas (JSON no tiene tuplas, devuelve listas)
+        # Si su __init__ es estricto y requiere tupla para possible_values, convertimos aquí:
+        if isinstance(possible_values, list) and data_type != dict:
+             possible_values = tuple(possible_values)
+        
+        # Para dicts, mantenemos la lista de listas o convertimos según su preferencia estricta
+        if isinstance(possible_values, list) and data_type == dict:
+             # Opcional: convertir sub-listas a tuplas si su validador lo prefiere, 
+             # aunque su validación actual acepta listas.
+             pass
+        return possible_values
+
     @classmethod
-    def from_dict(cls, data: dict) -> 'ComplexData':
+    def _from_dict(cls, data: dict, loader: Any) -> 'ComplexData':
         # 1. Secure types mapping
         SAFE_TYPES = {
             "list": list, "tuple": tuple, "set": set, "frozenset": frozenset, 
@@ -228,20 +379,27 @@ class ComplexData:
         if not data_type:
             raise TypeError(f"Invalid root data type: {raw_type}")
 
-        # Procesamos los possible_values con el motor recursivo
+        # Modo diferido: los possible_values y el contenido del valor se procesan en su primer uso
         raw_possible = data.get("POSSIBLE_VALUES")
-        possible_values = cls._deserialize_recursive(raw_possible) if raw_possible is not None else None
-        
-        # Corrección de tipo para tuplas (JSON no tiene tuplas, devuelve listas)
-        # Si su __init__ es estricto y requiere tupla para possible_values, convertimos aquí:
-        if isinstance(possible_values, list) and data_type != dict:
-             possible_values = tuple(possible_values)
-        
-        # Para dicts, mantenemos la lista de listas o convertimos según su preferencia estricta
-        if isinstance(possible_values, list) and data_type == dict:
-             # Opcional: convertir sub-listas a tuplas si su validador lo prefiere, 
-             # aunque su validación actual acepta listas.
-             pass
+        if loader.lazy:
+            from .lazy import lazy_value
+            schema = cls(
+                data_type=data_type,
+                name=data.get("NAME"),
+                description=data.get("DESCRIPTION"),
+                value=None,
+                maximum_length=data.get("MAXIMUM_LENGTH"),
+                minimum_length=data.get("MINIMUM_LENGTH"),
+                data_class=True,
+                discriminator=data.get("DISCRIMINATOR")
+            )
+            if raw_possible is not None:
+                schema._defer(raw_possible, loader)
+            schema.data_class = data.get("DATA_CLASS", False)
+            schema.value = lazy_value(schema, data.get("VALUE"))
+            return schema
+
+        possible_values = cls._load_possible_values(raw_possible, data_type, loader)
 
         return cls(
             data_type=data_type,
@@ -251,54 +409,197 @@ class ComplexData:
             maximum_length=data.get("MAXIMUM_LENGTH"),
             minimum_length=data.get("MINIMUM_LENGTH"),
             possible_values=possible_values,
-            data_class=data.get("DATA_CLASS", False)
+            data_class=data.get("DATA_CLASS", False),
+            discriminator=data.get("DISCRIMINATOR")
         )
 
-    
+    # Public methods
+    def to_dict(self, references: bool = False) -> dict:
+        "Serialize the schema. With references, repeated sub-schemas are emitted once (DEFINITIONS/$ref)."
+        if references:
+            from .registry import SchemaReferences
+            return SchemaReferences(self).document(self)
+        return self._to_dict()
+
     @classmethod
-    def from_json(cls, text_content: str) -> 'ComplexData':
+    def from_dict(cls, data: dict, registry: Optional[Any] = None, cache: Optional[Any] = None, lazy: bool = False) -> 'ComplexData':
+        """
+        Rebuild a schema. With a SchemaRegistry, identical sub-schemas resolve to one shared frozen instance.
+        With lazy, nested sub-schemas are built on first use, and the value entries are validated on first access.
+        """
+        if cache is not None:
+            if lazy:
+                raise ValueError("Lazy loading is not supported with a schema cache (cached schemas are fully built).")
+            return cache.load_dict(cls, data, registry)
+        from .registry import SchemaLoader
+        return SchemaLoader.document(cls, data, registry, lazy)
+
+    @classmethod
+    def from_json(cls, text_content: str, registry: Optional[Any] = None, cache: Optional[Any] = None, lazy: bool = False) -> 'ComplexData':
+        if cache is not None and not lazy:
+            return cache.load_json(cls, text_content, registry)
         try:
             data = json.loads(text_content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
-        return cls.from_dict(data)
+        return cls.from_dict(data, registry, cache, lazy)
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=4)
+    def to_json(self, references: bool = False) -> str:
+        return json.dumps(self.to_dict(references), indent=4)
     
-    def validate(self, data: Any = None) -> bool:
-        # Determine objective data
-        if data is None:
-            objective_data = self.value
-        else:
-            objective_data = data
+    def to_bytes(self) -> bytes:
+        "Compact tagged binary serialization (raw bytes, varint lengths, string references)."
+        from . import codec
+        return codec.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ComplexData':
+        from . import codec
+        instance = codec.loads(data)
+        if not isinstance(instance, cls):
+            raise TypeError(f"Expected serialized {cls.__name__}. Received: {type(instance).__name__}")
+        return instance
 
+    def _check_shape(self, objective_data: Any) -> Optional[exceptions.ValidationFailure]:
         # Data type validation
         if not isinstance(objective_data, self.data_type):
-            raise exceptions.DataTypeException(
-                f"Incorrect data type.\nExpected: {self.data_type.__name__} - Received: {type(objective_data).__name__}"
+            return exceptions.ValidationFailure(
+                exceptions.DataTypeException,
+                "Incorrect data type.\nExpected: {0.__name__} - Received: {1.__name__}", (self.data_type, type(objective_data))
             )
     
         # Length validation
         current_length = len(objective_data)
+        rules = self._constraints # Shared constraints record, read once
         
-        if self.minimum_length is not None and current_length < self.minimum_length:
-            raise ValueError(f"Minimum length not reached: {current_length} < {self.minimum_length}")
+        if rules.minimum_length is not None and current_length < rules.minimum_length:
+            return exceptions.ValidationFailure(ValueError, "Minimum length not reached: {} < {}", (current_length, rules.minimum_length))
     
-        if self.maximum_length is not None and current_length > self.maximum_length:
-            raise ValueError(f"Maximum length reached: {current_length} > {self.maximum_length}")
+        if rules.maximum_length is not None and current_length > rules.maximum_length:
+            return exceptions.ValidationFailure(ValueError, "Maximum length reached: {} > {}", (current_length, rules.maximum_length))
+
+        return None
+
+    def _check(self, objective_data: Any) -> Optional[exceptions.ValidationFailure]:
+        # Data type and length validation
+        failure = self._check_shape(objective_data)
+        if failure is not None:
+            return failure
     
         # Content validation and recurse
         if self.possible_values:
             # Validate dictionaries
             if isinstance(objective_data, dict):
-                self._validate_dictionary(objective_data)
+                return self._check_dictionary(objective_data)
             else:
-                self._validate_collection(objective_data)
+                return self._check_collection(objective_data)
+        
+        # Return results
+        return None
+
+    def validate(self, data: Any = None) -> bool:
+        # Determine objective data
+        if data is None:
+            objective_data = self.value
+        else:
+            objective_data = data
+
+        # The detailed message is only formatted here, for the top-level caller
+        if self._result_cache is not None and self._result_cache.usable(self._sub_schemas):
+            failure = self._result_cache.check(objective_data, self._check)
+        else:
+            failure = self._check(objective_data)
+        if failure is not None:
+            raise failure.exception()
         
         # Return results
         return True
 
+    def is_valid(self, data: Any = None) -> bool:
+        "Non-raising validation: no exception (nor message) is built for rejected values."
+        try:
+            objective = self.value if data is None else data
+            if self._result_cache is not None and self._result_cache.usable(self._sub_schemas):
+                return self._result_cache.check(objective, self._check) is None
+            return self._check(objective) is None
+        except Exception:
+            return False
+
+    def validate_parallel(self,
+        data: Any = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 10000,
+        executor: str = "process"
+    ) -> bool:
+        "Validate a large collection in chunks, on a process (or thread) pool."
+        from .parallel import validate_parallel
+        return validate_parallel(self, self.value if data is None else data, workers, chunk_size, executor)
+
+    def enable_result_cache(self, maximum_size: int = 4096, maximum_bytes: int = 1048576) -> Any:
+        "Memoize validation results of immutable values (str, bytes, int, float, bool, tuple, frozenset). Freezes the sub-schemas."
+        from .cache import ResultCache
+        self._freeze_sub_schemas()
+        object.__setattr__(self, "_result_cache", ResultCache(maximum_size, maximum_bytes))
+        return self._result_cache
+
+    def disable_result_cache(self) -> None:
+        object.__setattr__(self, "_result_cache", None)
+
+    def enable_profiling(self, nested: bool = True) -> Any:
+        "Count calls, time, failures per rule and union-branch hits (of the sub-schemas too, with nested)."
+        from .profiling import enable_profiling
+        return enable_profiling(self, nested)
+
+    def disable_profiling(self, nested: bool = True) -> None:
+        from .profiling import disable_profiling
+        disable_profiling(self, nested)
+
+    def profile_snapshot(self) -> Optional[dict]:
+        "Profiling counters of the schema (None when not profiled)."
+        from .profiling import PROFILES
+        profile = PROFILES.get(id(self))
+        return profile.snapshot() if profile is not None else None
+
+    def freeze(self) -> 'ComplexData':
+        "Make the schema (and its sub-schemas) immutable, as required for shared instances."
+        object.__setattr__(self, "_frozen", True)
+        if self._pending_content is not None:
+            return self # Sub-schemas are frozen when built
+        self._freeze_sub_schemas()
+        return self
+
+    def track(self) -> Any:
+        "Wrap the value in an observable list/dict that records the mutated indices/keys (see revalidate())."
+        from .tracking import TRACKED_TYPES, track
+        if not isinstance(self.value, TRACKED_TYPES):
+            self.value = track(self.value)
+        return self.value
+
+    def revalidate(self) -> bool:
+        "Validate the length and only the elements mutated since the last successful revalidate()."
+        from .tracking import revalidate
+        return revalidate(self)
+
+    def validate_stream(self, fileobj: Any, format: Optional[str] = None, chunk_size: int = 65536) -> bool:
+        "Validate a JSON array (or JSONL) file incrementally, with constant memory."
+        from .stream import validate_stream
+        return validate_stream(self, fileobj, format, chunk_size)
+
+    def compile(self) -> Any:
+        "Build a specialized validator callable, recursing into compiled child validators."
+        from .compiler import compile_schema
+        return compile_schema(self)
+
+    def compile_source(self, cache_directory: Optional[str] = None, cache: bool = True) -> Any:
+        "Generate, compile and cache on disk (by schema hash) a specialized validator module."
+        from .codegen import compile_source
+        return compile_source(self, cache_directory, cache)
+
+    def to_source(self) -> str:
+        "Python source of the generated validator module (see compile_source())."
+        from .codegen import generate_source
+        return generate_source(self)
+
     def cli_capture(self, prompt_context: str = "") -> Any:
         """Punto de entrada para la hidratación de datos desde CLI."""
         if self.data_type is dict:
@@ -0,0 +1,249 @@
+# Library import
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Constants definition
+COLLECTION_TYPES: tuple = (list, tuple, set, frozenset)
+
+# Functions definition
+def is_schema(validator: Any) -> bool:
+    # Imported on demand: complex_data depends on this module
+    from .primitive_data import PrimitiveData
+    from .complex_data import ComplexData
+    return isinstance(validator, (PrimitiveData, ComplexData))
+
+def nested_schemas(element: Any) -> Iterable:
+    "Schemas held by a validator container (dict keys/values and nested collections); not recursive into schemas."
+    if is_schema(element):
+        yield element
+    elif isinstance(element, dict):
+        for key, item in element.items():
+            yield from nested_schemas(key)
+            yield from nested_schemas(item)
+    elif isinstance(element, COLLECTION_TYPES):
+        for item in element:
+            yield from nested_schemas(item)
+
+def normalize_validators(validators: Any) -> Iterable:
+    if not isinstance(validators, COLLECTION_TYPES):
+        return [validators]
+    return validators
+
+def immutable_validators(validators: Any, positional: bool = False) -> Any:
+    """
+    Copia inmutable de un conjunto de validadores (possible_values): los
+    indices se construyen una unica vez, por lo que las modificaciones en su
+    lugar (ej: possible_values.append(...)) se rechazan en vez de ignorarse.
+    Para modificar los validadores se asigna un nuevo conjunto al esquema.
+
+    Los literales anidados no se modifican (ej: una lista literal sigue siendo
+    una lista); positional convierte las listas de claves y valores de un
+    esquema de diccionario (keys, values).
+    """
+    if isinstance(validators, dict):
+        return ValidatorMapping({key: _immutable_collection(value) for key, value in validators.items()})
+    if isinstance(validators, (set, frozenset)):
+        return frozenset(validators)
+    if isinstance(validators, (str, bytes, tuple)) and not positional:
+        return validators # Already immutable
+    try:
+        items = tuple(validators)
+    except TypeError:
+        return validators # Not iterable: reported by validate()
+    if positional:
+        return tuple(_immutable_collection(item) for item in items)
+    return items
+
+def _immutable_collection(validators: Any) -> Any:
+    if isinstance(validators, list):
+        return tuple(validators)
+    if isinstance(validators, set):
+        return frozenset(validators)
+    return validators
+
+# Classes definition
+class ValidatorIndex:
+    """
+    Indice de un conjunto de validadores (possible_values).
+
+    Los literales hashables se consultan en un frozenset, los tipos de dato se
+    resuelven por el tipo concreto del elemento (con cache), y unicamente los
+    esquemas (PrimitiveData/ComplexData) y los literales no hashables se recorren.
+    """
+    __slots__ = ("literals", "unhashable_literals", "types", "schemas", "_type_cache")
+
+    def __init__(self, validators: Iterable) -> None:
+        literals = set()
+        unhashable_literals = []
+        types = []
+        schemas = []
+
+        for validator in validators:
+            if isinstance(validator, type):
+                types.append(validator)
+            elif is_schema(validator):
+                schemas.append(validator)
+            else:
+                try:
+                    literals.add(validator)
+                except TypeError:
+                    unhashable_literals.append(validator)
+
+        self.literals: frozenset = frozenset(literals)
+        self.unhashable_literals: tuple = tuple(unhashable_literals)
+        self.types: tuple = tuple(types)
+        self.schemas: tuple = tuple(schemas)
+        self._type_cache: Dict[type, bool] = {}
+
+    def __getstate__(self) -> tuple:
+        return (self.literals, self.unhashable_literals, self.types, self.schemas)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.literals, self.unhashable_literals, self.types, self.schemas = state
+        self._type_cache = {}
+
+    # Public methods
+    def match_type(self, element: Any) -> bool:
+        element_type = type(element)
+        result = self._type_cache.get(element_type)
+        if result is None:
+            result = self._type_cache[element_type] = isinstance(element, self.types)
+        return result
+
+    def match_literal(self, element: Any) -> bool:
+        try:
+            if element in self.literals:
+                return True
+        except TypeError:
+            pass # Unhashable element: only comparable by equality
+
+        for literal in self.unhashable_literals:
+            if element == literal:
+                return True
+        return False
+
+    def match(self, element: Any, match_schema: Callable[[Any, Any], bool], schemas: Optional[tuple] = None) -> bool:
+        if self.match_literal(element):
+            return True
+
+        if self.types and self.match_type(element):
+            return True
+
+        for schema in (self.schemas if schemas is None else schemas):
+            if match_schema(element, schema):
+                return True
+        return False
+
+class KeyIndex:
+    """
+    Indice de un esquema de mapeo (possible_values de tipo dict).
+
+    Las claves literales se resuelven con un diccionario; las reglas de tipo y de
+    esquema se recorren en orden, conservando la prioridad de la primera regla
+    definida que coincide con la clave.
+    """
+    __slots__ = ("exact", "scanned", "size")
+
+    def __init__(self, mapping: dict) -> None:
+        self.exact: Dict[Any, Tuple[int, ValidatorIndex]] = {}
+        self.scanned: list = []
+        self.size: int = len(mapping)
+
+        for position, (schema_key, value_validators) in enumerate(mapping.items()):
+            value_index = ValidatorIndex(normalize_validators(value_validators))
+
+            if isinstance(schema_key, type) or is_schema(schema_key):
+                self.scanned.append((position, schema_key, value_index))
+            else:
+                self.exact[schema_key] = (position, value_index)
+
+        self.scanned = tuple(self.scanned)
+
+    # Public methods
+    def resolve(self, key: Any, match_key: Callable[[Any, Any], bool]) -> Optional[ValidatorIndex]:
+        try:
+            exact_rule = self.exact.get(key)
+        except TypeError:
+            exact_rule = None
+
+        limit = exact_rule[0] if exact_rule is not None else self.size
+        for position, schema_key, value_index in self.scanned:
+            if position >= limit:
+                break
+            if match_key(key, schema_key):
+                return value_index
+
+        return exact_rule[1] if exact_rule is not None else None
+
+class DiscriminatorIndex:
+    """
+    Indice de uniones discriminadas: asocia el valor de la clave discriminadora
+    (ej: "TYPE") con los esquemas de mapeo que lo aceptan.
+
+    Un esquema es discriminable si su clave discriminadora es exacta, solo acepta
+    literales, y ninguna regla de tipo/esquema anterior puede capturarla. Los
+    esquemas no discriminables se prueban siempre.
+    """
+    __slots__ = ("discriminator", "cases", "fallback")
+
+    def __init__(self, discriminator: Any, schemas: Iterable) -> None:
+        cases: Dict[Any, list] = {}
+        fallback = []
+
+        for schema in schemas:
+            literals = self._discriminator_literals(discriminator, schema)
+            if literals is None:
+                fallback.append(schema)
+                continue
+            for literal in literals:
+                cases.setdefault(literal, []).append(schema)
+
+        self.discriminator = discriminator
+        self.fallback: tuple = tuple(fallback)
+        self.cases: Dict[Any, tuple] = {literal: tuple(case) + self.fallback for literal, case in cases.items()}
+
+    @staticmethod
+    def _discriminator_literals(discriminator: Any, schema: Any) -> Optional[frozenset]:
+        key_index = getattr(schema, "_key_index", None)
+        if key_index is None:
+            return None
+
+        exact_rule = key_index.exact.get(discriminator)
+        if exact_rule is None:
+            return None
+
+        position, value_index = exact_rule
+        if any(scanned[0] < position for scanned in key_index.scanned):
+            return None
+        if value_index.types or value_index.schemas or value_index.unhashable_literals or not value_index.literals:
+            return None
+
+        return value_index.literals
+
+    # Public methods
+    def candidates(self, element: Any) -> Optional[tuple]:
+        # None: the element does not carry the discriminator, every schema applies
+        if not isinstance(element, dict):
+            return None
+        try:
+            tag = element[self.discriminator]
+        except (KeyError, TypeError):
+            return None
+
+        try:
+            return self.cases.get(tag, self.fallback)
+        except TypeError:
+            return None
+
+class ValidatorMapping(dict):
+    "Mapping schema (possible_values of type dict) with its index already built: read-only."
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("possible_values is immutable (its index is built once): assign a new mapping to the schema")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    update = setdefault = pop = popitem = clear = _immutable
+
+    def __reduce__(self) -> tuple:
+        # Restored through the constructor (pickle would call __setitem__)
+        return (self.__class__, (dict(self),))
@@ -0,0 +1,85 @@
+# Library import
+from operator import attrgetter
+from typing import Any, Optional
+from weakref import WeakValueDictionary
+
+# Constants definition
+CONSTRAINT_FIELDS: tuple = ("description", "maximum_length", "minimum_length", "maximum_size", "minimum_size", "regular_expression")
+INTERNED: WeakValueDictionary = WeakValueDictionary()
+
+# Classes definition
+class Constraints:
+    """
+    Restricciones poco frecuentes de un esquema (descripcion, longitudes,
+    magnitudes, expresion regular), almacenadas fuera de la instancia.
+
+    Los registros son inmutables e internados: los esquemas con las mismas
+    restricciones (la mayoria, sin restricciones) comparten una unica instancia.
+    """
+    __slots__ = CONSTRAINT_FIELDS + ("__weakref__",)
+
+    def __init__(self, *values: Any) -> None:
+        for field, value in zip(CONSTRAINT_FIELDS, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Constraints records are immutable (use replace())")
+
+    def __reduce__(self) -> tuple:
+        return (constraints, self.values())
+
+    # Public methods
+    def values(self) -> tuple:
+        return tuple(getattr(self, field) for field in CONSTRAINT_FIELDS)
+
+    def replace(self, field: str, value: Any) -> 'Constraints':
+        "Interned record with one field changed."
+        values = list(self.values())
+        values[CONSTRAINT_FIELDS.index(field)] = value
+        return constraints(*values)
+
+# Functions definition
+def constraints(
+    description: Optional[Any] = None,
+    maximum_length: Optional[Any] = None, minimum_length: Optional[Any] = None,
+    maximum_size: Optional[Any] = None, minimum_size: Optional[Any] = None,
+    regular_expression: Optional[Any] = None
+) -> Constraints:
+    "Shared record of the given constraints."
+    values = (description, maximum_length, minimum_length, maximum_size, minimum_size, regular_expression)
+
+    # Type-tagged key: 1, 1.0 and True are kept apart (to_dict output)
+    try:
+        key = tuple((type(value), value) for value in values)
+        record = INTERNED.get(key)
+    except TypeError:
+        return Constraints(*values) # Unhashable constraint: not shared
+    if record is None:
+        record = INTERNED.setdefault(key, Constraints(*values))
+    return record
+
+def constraint_property(field: str) -> property:
+    "Public attribute stored in the shared constraints record (assignment replaces the record)."
+    def setter(instance: Any, value: Any) -> None:
+        instance._constraints = instance._constraints.replace(field, value)
+    return property(attrgetter(f"_constraints.{field}"), setter)
+
+def slot_state(instance: Any) -> dict:
+    "Assigned slots of an instance (pickling and copying)."
+    state = {}
+    for schema_class in type(instance).__mro__:
+        for name in schema_class.__dict__.get("__slots__", ()):
+            if name in ("__weakref__", "__dict__"):
+                continue
+            try:
+                # Slot descriptor: unset slots do not reach __getattr__ (lazy content stays pending)
+                state[name] = schema_class.__dict__[name].__get__(instance, schema_class)
+            except AttributeError:
+                pass
+    state.update(getattr(instance, "__dict__", {})) # Subclasses without __slots__
+    return state
+
+def restore_slots(instance: Any, state: dict) -> None:
+    # Assigned directly: frozen instances are restored as frozen
+    for name, value in state.items():
+        object.__setattr__(instance, name, value)
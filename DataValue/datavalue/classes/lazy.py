@@ -0,0 +1,224 @@
+# Library import
+from typing import Any, Iterable, Iterator
+
+# Classes definition
+class LazyDict(dict):
+    """
+    Valor diferido de un esquema de diccionario (from_dict(lazy=True)): cada
+    entrada se valida (completa) en su primer acceso, y las entradas validas se
+    recuerdan. El tipo y la longitud se validan al construir el esquema.
+
+    Los accesos de bajo nivel (ej: dict(valor), json.dumps(valor)) no validan.
+    """
+    __slots__ = ("schema", "validated")
+
+    def __init__(self, schema: Any, content: dict) -> None:
+        super().__init__(content)
+        self.schema = schema
+        self.validated: set = set()
+
+    # Private methods
+    def _entry(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        if key not in self.validated:
+            if self.schema.possible_values:
+                failure = self.schema._check_dictionary({key: value})
+                if failure is not None:
+                    raise failure.exception()
+            self.validated.add(key)
+        return value
+
+    # Public methods
+    def validate(self) -> bool:
+        "Validate the entries not accessed yet."
+        if len(self.validated) < len(self):
+            pending = {key: value for key, value in super().items() if key not in self.validated}
+            if self.schema.possible_values:
+                failure = self.schema._check_dictionary(pending)
+                if failure is not None:
+                    raise failure.exception()
+            self.validated.update(pending)
+        return True
+
+    def __reduce__(self) -> tuple:
+        # Restored through the constructor (pickle would fill the dictionary with __setitem__ before the slots exist);
+        # the schema is restored as state, as it may hold this value
+        return (self.__class__, (None, dict.copy(self)), (None, {"schema": self.schema, "validated": set(self.validated)}))
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._entry(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._entry(key) if key in self else default
+
+    def values(self) -> Any:
+        self.validate()
+        return super().values()
+
+    def items(self) -> Any:
+        self.validate()
+        return super().items()
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.validated.discard(key)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.validated.discard(key)
+
+    def __ior__(self, values: Any) -> 'LazyDict':
+        self.update(values)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            value = self._entry(key)
+            del self[key]
+            return value
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple:
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        super().clear()
+        self.validated.clear()
+
+class LazyList(list):
+    """
+    Valor diferido de un esquema de coleccion (from_dict(lazy=True)): cada
+    elemento se valida (completo) en su primer acceso por indice o recorrido.
+    Las operaciones que desplazan elementos descartan los indices validados.
+    """
+    __slots__ = ("schema", "validated")
+
+    def __init__(self, schema: Any, content: Iterable) -> None:
+        super().__init__(content)
+        self.schema = schema
+        self.validated: set = set()
+
+    # Private methods
+    def _element(self, index: int) -> Any:
+        value = super().__getitem__(index)
+        if index < 0:
+            index += len(self)
+        if index not in self.validated:
+            if self.schema.possible_values:
+                failure = self.schema._check_collection((value,), index)
+                if failure is not None:
+                    raise failure.exception()
+            self.validated.add(index)
+        return value
+
+    def _moved(self) -> None:
+        self.validated.clear()
+
+    # Public methods
+    def validate(self) -> bool:
+        "Validate the elements not accessed yet."
+        for index in range(len(self)):
+            self._element(index)
+        return True
+
+    def __reduce__(self) -> tuple:
+        # Restored through the constructor, without validating the elements (see LazyDict.__reduce__)
+        return (self.__class__, (None, list.copy(self)), (None, {"schema": self.schema, "validated": set(self.validated)}))
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._element(position) for position in range(*index.indices(len(self)))]
+        return self._element(index)
+
+    def __iter__(self) -> Iterator:
+        index = 0
+        while index < len(self):
+            yield self._element(index)
+            index += 1
+
+    def __reversed__(self) -> Iterator:
+        for index in range(len(self) - 1, -1, -1):
+            yield self._element(index)
+
+    def copy(self) -> list:
+        return self[:]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        if isinstance(index, slice):
+            self._moved()
+        else:
+            self.validated.discard(index + len(self) if index < 0 else index)
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._moved()
+
+    def __iadd__(self, values: Iterable) -> 'LazyList':
+        self.extend(values)
+        return self
+
+    def __imul__(self, times: int) -> 'LazyList':
+        super().__imul__(times)
+        return self # Repeated elements are validated on access
+
+    def insert(self, index: int, value: Any) -> None:
+        super().insert(index, value)
+        self._moved()
+
+    def pop(self, index: int = -1) -> Any:
+        value = self._element(index)
+        super().pop(index)
+        self._moved()
+        return value
+
+    def remove(self, value: Any) -> None:
+        del self[self.index(value)]
+
+    def clear(self) -> None:
+        super().clear()
+        self._moved()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._moved()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._moved()
+
+# Constants definition
+LAZY_TYPES: tuple = (LazyList, LazyDict)
+
+# Functions definition
+def lazy_value(schema: Any, value: Any) -> Any:
+    """
+    Valor de un esquema diferido: las listas y diccionarios se envuelven (su
+    contenido se valida en cada acceso); el tipo y la longitud se validan aqui,
+    o el valor completo si no es una lista o diccionario.
+    """
+    if isinstance(value, dict):
+        value = LazyDict(schema, value)
+    elif isinstance(value, list):
+        value = LazyList(schema, value)
+
+    if not schema.data_class:
+        failure = schema._check_shape(value) if isinstance(value, LAZY_TYPES) else schema._check(value)
+        if failure is not None:
+            raise failure.exception()
+    return value
@@ -0,0 +1,91 @@
+# Library import
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Iterator, Optional, Tuple
+from .complex_data import ComplexData
+from .. import exceptions
+
+# Constants definition
+EXECUTORS: tuple = ("process", "thread")
+PENDING_CHUNKS_PER_WORKER: int = 2 # Submitted chunks not yet resolved (bounds the data in flight)
+
+# Worker state: the schema is transferred once per worker process
+_worker_schema: Optional[ComplexData] = None
+
+# Functions definition
+def _initialize_worker(schema: ComplexData) -> None:
+    global _worker_schema
+    _worker_schema = schema
+
+def _check_chunk(chunk: list, start: int, schema: Optional[ComplexData] = None) -> Optional[exceptions.ValidationFailure]:
+    schema = schema if schema is not None else _worker_schema
+
+    # Dictionaries are transferred as (key, value) pairs
+    if isinstance(chunk, tuple):
+        return schema._check_dictionary(dict(chunk))
+    return schema._check_collection(chunk, start)
+
+def _chunks(data: Any, chunk_size: int) -> Iterator[Tuple[Any, int]]:
+    if isinstance(data, dict):
+        items = list(data.items())
+        for start in range(0, len(items), chunk_size):
+            yield tuple(items[start:start + chunk_size]), start
+        return None
+
+    elements = data if isinstance(data, (list, tuple)) else list(data)
+    for start in range(0, len(elements), chunk_size):
+        yield list(elements[start:start + chunk_size]), start
+
+def _build_executor(schema: ComplexData, workers: int, executor: str) -> Executor:
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=(schema,))
+
+def validate_parallel(schema: ComplexData, data: Any, workers: Optional[int] = None, chunk_size: int = 10000, executor: str = "process") -> bool:
+    """
+    Valida una coleccion (o diccionario) grande por bloques independientes.
+
+    El tipo de dato y la longitud se validan en el proceso principal; el contenido
+    se divide en bloques de `chunk_size` elementos que se validan en paralelo. Si
+    varios bloques fallan, se reporta el primer elemento invalido (el mismo que
+    reportaria validate()).
+
+    - executor="process": ProcessPoolExecutor (el esquema y los datos deben ser serializables con pickle)
+    - executor="thread": ThreadPoolExecutor (util en compilaciones de Python sin GIL)
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor}. Expected one of: {EXECUTORS}")
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive: {chunk_size}")
+
+    workers = workers if workers else (os.cpu_count() or 1)
+
+    # Small collections (or without content rules) are validated sequentially
+    if workers == 1 or not schema.possible_values or not isinstance(data, schema.data_type) or len(data) <= chunk_size:
+        return schema.validate(data)
+
+    # Data type and length validation
+    failure = schema._check_shape(data)
+    if failure is not None:
+        raise failure.exception()
+
+    # Content validation: chunks are resolved in order, for a deterministic first failure
+    extra_arguments = (schema,) if executor == "thread" else ()
+    chunks = _chunks(data, chunk_size)
+    with _build_executor(schema, workers, executor) as pool:
+        # At most PENDING_CHUNKS_PER_WORKER chunks per worker in flight: the next one is submitted as each resolves
+        futures = deque(pool.submit(_check_chunk, chunk, start, *extra_arguments) for chunk, start in islice(chunks, workers * PENDING_CHUNKS_PER_WORKER))
+        while futures:
+            failure = futures.popleft().result()
+            if failure is not None:
+                for pending in futures:
+                    pending.cancel()
+                raise failure.exception()
+
+            following = next(chunks, None)
+            if following is not None:
+                futures.append(pool.submit(_check_chunk, *following, *extra_arguments))
+
+    return True
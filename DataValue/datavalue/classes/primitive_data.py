@@ -2,11 +2,19 @@
 import re
 from typing import Type, Optional, Any, Iterable, Union
 from .. import exceptions
+from .index import ValidatorIndex, immutable_validators, nested_schemas
+from .layout import constraints, constraint_property, slot_state, restore_slots
 import json
 import base64
 
 # Classes definition
 class PrimitiveData:
+    # Compact instances: the rarely used constraints live in a shared record (layout.Constraints)
+    __slots__ = (
+        "data_type", "value", "name", "data_class", "_constraints",
+        "_possible_values", "_possible_index", "_frozen", "_result_cache", "__weakref__"
+    )
+
     def __init__(self,
         data_type: Type,
         value: Any,
@@ -19,28 +27,83 @@ class PrimitiveData:
         
         data_class: Optional[bool] = False
     ) -> None:
+        # Slot defaults (checked by the assignments below)
+        object.__setattr__(self, "_frozen", False)
+        object.__setattr__(self, "_result_cache", None)
+
         # Instance properties assignment
         self.data_type = data_type
         self.value = value
         self.name = name
-        self.description = description
-        self.maximum_length = maximum_length; self.minimum_length = minimum_length
-        self.maximum_size = maximum_size; self.minimum_size = minimum_size
+        self._constraints = constraints(description, maximum_length, minimum_length, maximum_size, minimum_size, regular_expression)
         self.possible_values = possible_values
-        self.regular_expression = regular_expression
         self.data_class = data_class
         
         if not self.data_class:
             self.validate()
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(f"Cannot modify frozen {self.__class__.__name__} attribute: {name}")
+        object.__setattr__(self, name, value)
+
+        # Stored validation results depend on the schema constraints
+        if self._result_cache is not None:
+            self._result_cache.invalidate()
+
+    def __getstate__(self) -> dict:
+        return slot_state(self)
+
+    def __setstate__(self, state: dict) -> None:
+        restore_slots(self, state)
+
+    # Properties
+    description = constraint_property("description")
+    maximum_length = constraint_property("maximum_length")
+    minimum_length = constraint_property("minimum_length")
+    maximum_size = constraint_property("maximum_size")
+    minimum_size = constraint_property("minimum_size")
+    regular_expression = constraint_property("regular_expression")
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    @property
+    def result_cache(self) -> Optional[Any]:
+        return self._result_cache
+
+    @property
+    def possible_values(self) -> Optional[Iterable]:
+        return self._possible_values
+
+    @possible_values.setter
+    def possible_values(self, possible_values: Optional[Iterable]) -> None:
+        # The index is built once per schema, instead of per validated value (immutable copy: in-place edits would be ignored)
+        if possible_values is not None:
+            possible_values = immutable_validators(possible_values)
+        self._possible_values = possible_values
+        try:
+            self._possible_index = ValidatorIndex(possible_values) if possible_values is not None else None
+        except TypeError:
+            self._possible_index = None # Not iterable: reported by validate()
+        if self._result_cache is not None:
+            self._freeze_sub_schemas()
+
     # Private methods
+    def _sub_schemas(self) -> tuple:
+        return self._possible_index.schemas if self._possible_index is not None else ()
+
+    def _freeze_sub_schemas(self) -> None:
+        # Required by the result cache: the results of the schema depend on its sub-schemas
+        for schema in nested_schemas(self.possible_values):
+            if not schema.frozen:
+                schema.freeze()
+
     def _is_match(self, element: Any, schema: Any) -> bool:        
         if isinstance(schema, PrimitiveData):
-            try:
-                # Si el validador hijo no lanza excepción, el match es exitoso
-                return schema.validate(element)
-            except (exceptions.DataValueException, ValueError, TypeError):
-                return False
+            # Validacion sin excepciones: el mensaje de error no se construye
+            return schema.is_valid(element)
         
         # 2. Caso: El esquema es un tipo de dato (clase como str, int)
         if isinstance(schema, type):
@@ -62,14 +125,16 @@ class PrimitiveData:
         else:
             return None
     
-    # Public methods
-    def to_dict(self) -> dict:
+    def _to_dict(self, references: Optional[Any] = None) -> dict:
         normalized_possible = None
         if self.possible_values is not None:
             normalized_possible = []
             for item in self.possible_values:
                 if isinstance(item, PrimitiveData):
-                    normalized_possible.append(item.to_dict())
+                    if references is not None and references.is_shared(item):
+                        normalized_possible.append(references.reference(item))
+                    else:
+                        normalized_possible.append(item._to_dict(references))
                 elif isinstance(item, type):
                     normalized_possible.append({"__class__": item.__name__})
                 else:
@@ -97,16 +162,13 @@ class PrimitiveData:
         }
 
         return data_structure
-    
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=4)
-    
+
     @classmethod
-    def from_dict(cls, data: dict) -> 'PrimitiveData':
+    def _from_dict(cls, data: dict, loader: Any) -> 'PrimitiveData':
         expected_keys = {
             "DATA_TYPE", "VALUE", "NAME", "DESCRIPTION", "MAXIMUM_LENGTH", "MINIMUM_LENGTH",
             "MAXIMUM_SIZE", "MINIMUM_SIZE", "POSSIBLE_VALUES",
-            "REGULAR_EXPRESSION", "DATA_CLASS", "__type__"
+            "REGULAR_EXPRESSION", "DATA_CLASS", "DEFINITIONS", "__type__"
         }
         
         unknown_keys = set(data.keys()) - expected_keys
@@ -140,7 +202,9 @@ class PrimitiveData:
             for item in raw_possible:
                 if isinstance(item, dict):
                     if item.get("__type__") == "PrimitiveData":
-                        possible_values.append(cls.from_dict(item))
+                        possible_values.append(loader.load(cls, item))
+                    elif "$ref" in item and len(item) == 1:
+                        possible_values.append(loader.resolve(item["$ref"]))
                     elif "__class__" in item:
                         possible_values.append(type_mapping.get(item["__class__"]))
                     else:
@@ -162,74 +226,187 @@ class PrimitiveData:
             regular_expression=data.get("REGULAR_EXPRESSION"),
             data_class=data.get("DATA_CLASS", False)
         )
-        
+
+    # Public methods
+    def to_dict(self, references: bool = False) -> dict:
+        "Serialize the schema. With references, repeated sub-schemas are emitted once (DEFINITIONS/$ref)."
+        if references:
+            from .registry import SchemaReferences
+            return SchemaReferences(self).document(self)
+        return self._to_dict()
+
+    @classmethod
+    def from_dict(cls, data: dict, registry: Optional[Any] = None, cache: Optional[Any] = None) -> 'PrimitiveData':
+        "Rebuild a schema. With a SchemaRegistry, identical sub-schemas resolve to one shared frozen instance."
+        if cache is not None:
+            return cache.load_dict(cls, data, registry)
+        from .registry import SchemaLoader
+        return SchemaLoader.document(cls, data, registry)
+
+    def to_json(self, references: bool = False) -> str:
+        return json.dumps(self.to_dict(references), indent=4)
+    
+    def to_bytes(self) -> bytes:
+        "Compact tagged binary serialization (raw bytes, varint lengths, string references)."
+        from . import codec
+        return codec.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PrimitiveData':
+        from . import codec
+        instance = codec.loads(data)
+        if not isinstance(instance, cls):
+            raise TypeError(f"Expected serialized {cls.__name__}. Received: {type(instance).__name__}")
+        return instance
+
     @classmethod
-    def from_json(cls, text_content: str) -> 'PrimitiveData':
+    def from_json(cls, text_content: str, registry: Optional[Any] = None, cache: Optional[Any] = None) -> 'PrimitiveData':
+        if cache is not None:
+            return cache.load_json(cls, text_content, registry)
         try:
             data_table = json.loads(text_content)
         except json.JSONDecodeError as Error:
             raise ValueError(f"Invalid JSON format: {Error}")
             
-        return cls.from_dict(data_table)
-
-    def validate(self, data: Optional[Any] = None) -> bool:
-        # Define the data to validate
-        if data is None:
-            data_objective = self.value
-        else:
-            data_objective = data
+        return cls.from_dict(data_table, registry)
 
+    def _check(self, data_objective: Any) -> Optional[exceptions.ValidationFailure]:
         # Validacion de tipo de dato
         if not isinstance(data_objective, self.data_type):
-            raise exceptions.DataTypeException(
-                f"Incorrect data type.\nExpected: {self.data_type.__name__} - Received: {type(data_objective).__name__}"
+            return exceptions.ValidationFailure(
+                exceptions.DataTypeException,
+                "Incorrect data type.\nExpected: {0.__name__} - Received: {1.__name__}", (self.data_type, type(data_objective))
             )
         
+        rules = self._constraints # Shared constraints record, read once
+
         # Validacion de longitud de caracteres (minimo, y maximo)
-        if self.minimum_length is not None or self.maximum_length is not None:
+        if rules.minimum_length is not None or rules.maximum_length is not None:
             length = self.__get_length(data_objective)
             
             if length is not None:
-                if self.minimum_length is not None and length < self.minimum_length:
-                    raise exceptions.LengthException(f"Character/digit length below the minimum: {length} < {self.minimum_length}")
-                elif self.maximum_length is not None and length > self.maximum_length:
-                    raise exceptions.LengthException(f"Character/digit length above the maximum: {length} > {self.maximum_length}")
+                if rules.minimum_length is not None and length < rules.minimum_length:
+                    return exceptions.ValidationFailure(exceptions.LengthException, "Character/digit length below the minimum: {} < {}", (length, rules.minimum_length))
+                elif rules.maximum_length is not None and length > rules.maximum_length:
+                    return exceptions.ValidationFailure(exceptions.LengthException, "Character/digit length above the maximum: {} > {}", (length, rules.maximum_length))
         
         # Validacion de tamaño (magnitud)
-        if self.minimum_size is not None or self.maximum_size is not None:
+        if rules.minimum_size is not None or rules.maximum_size is not None:
             if isinstance(data_objective, (int, float)):
-                if self.minimum_size is not None and data_objective < self.minimum_size:
-                    raise exceptions.SizeException(f"Numerical value below the minimum: {data_objective} < {self.minimum_size}")
-                if self.maximum_size is not None and data_objective > self.maximum_size:
-                    raise exceptions.SizeException(f"Numerical value above the maximum: {data_objective} > {self.maximum_size}")
+                if rules.minimum_size is not None and data_objective < rules.minimum_size:
+                    return exceptions.ValidationFailure(exceptions.SizeException, "Numerical value below the minimum: {} < {}", (data_objective, rules.minimum_size))
+                if rules.maximum_size is not None and data_objective > rules.maximum_size:
+                    return exceptions.ValidationFailure(exceptions.SizeException, "Numerical value above the maximum: {} > {}", (data_objective, rules.maximum_size))
         
         # Validacion de posibles valores (conjunto)
         if self.data_type is bool:
             if data_objective not in (True, False):
-                raise exceptions.PossibleValueException(
-                    f"The boolean value has to be True or False: {data_objective} != True/False"
+                return exceptions.ValidationFailure(
+                    exceptions.PossibleValueException,
+                    "The boolean value has to be True or False: {} != True/False", (data_objective,)
                 )
         
         if self.possible_values is not None:
-            # Implementación de any() con _is_match para soportar la composición de tipos
-            if not any(self._is_match(data_objective, validator) for validator in self.possible_values):
-                raise exceptions.PossibleValueException(
-                    f"Value '{data_objective}' is not allowed by any of the provided validators."
+            if self._possible_index is None:
+                raise TypeError(f"Possible values must be iterable. Received: {type(self.possible_values).__name__}")
+
+            # Literales por frozenset, tipos por cache, y _is_match para la composición de esquemas
+            if not self._possible_index.match(data_objective, self._is_match):
+                return exceptions.ValidationFailure(
+                    exceptions.PossibleValueException,
+                    "Value '{}' is not allowed by any of the provided validators.", (data_objective,)
                 )
         
         # Validacion de expresion regular
-        if self.regular_expression is not None:
+        if rules.regular_expression is not None:
             if isinstance(data_objective, (str, bytes, bytearray)):
                 # Soporte para bytes/bytearray convirtiendo el patrón si es necesario
-                pattern = self.regular_expression
+                pattern = rules.regular_expression
                 if isinstance(data_objective, (bytes, bytearray)) and isinstance(pattern, str):
                     pattern = pattern.encode()
                 
                 if not re.fullmatch(pattern, data_objective):
-                    raise exceptions.RegularExpressionException(f"The value does not meet the required pattern: {self.regular_expression}")
+                    return exceptions.ValidationFailure(exceptions.RegularExpressionException, "The value does not meet the required pattern: {}", (rules.regular_expression,))
+        
+        return None
+
+    def validate(self, data: Optional[Any] = None) -> bool:
+        # Define the data to validate
+        if data is None:
+            data_objective = self.value
+        else:
+            data_objective = data
+
+        # The detailed message is only formatted here, for the top-level caller
+        if self._result_cache is not None and self._result_cache.usable(self._sub_schemas):
+            failure = self._result_cache.check(data_objective, self._check)
+        else:
+            failure = self._check(data_objective)
+        if failure is not None:
+            raise failure.exception()
         
         return True
 
+    def is_valid(self, data: Optional[Any] = None) -> bool:
+        "Non-raising validation: no exception (nor message) is built for rejected values."
+        try:
+            objective = self.value if data is None else data
+            if self._result_cache is not None and self._result_cache.usable(self._sub_schemas):
+                return self._result_cache.check(objective, self._check) is None
+            return self._check(objective) is None
+        except Exception:
+            return False
+
+    def validate_many(self, values: Iterable) -> tuple:
+        "Validate a column of values: returns the per-item mask and the rejected indices."
+        from .batch import validate_many
+        return validate_many(self, values)
+
+    def enable_result_cache(self, maximum_size: int = 4096, maximum_bytes: int = 1048576) -> Any:
+        "Memoize validation results of immutable values (str, bytes, int, float, bool, tuple, frozenset). Freezes the sub-schemas."
+        from .cache import ResultCache
+        self._freeze_sub_schemas()
+        object.__setattr__(self, "_result_cache", ResultCache(maximum_size, maximum_bytes))
+        return self._result_cache
+
+    def disable_result_cache(self) -> None:
+        object.__setattr__(self, "_result_cache", None)
+
+    def enable_profiling(self, nested: bool = True) -> Any:
+        "Count calls, time, failures per rule and union-branch hits (of the sub-schemas too, with nested)."
+        from .profiling import enable_profiling
+        return enable_profiling(self, nested)
+
+    def disable_profiling(self, nested: bool = True) -> None:
+        from .profiling import disable_profiling
+        disable_profiling(self, nested)
+
+    def profile_snapshot(self) -> Optional[dict]:
+        "Profiling counters of the schema (None when not profiled)."
+        from .profiling import PROFILES
+        profile = PROFILES.get(id(self))
+        return profile.snapshot() if profile is not None else None
+
+    def freeze(self) -> 'PrimitiveData':
+        "Make the schema (and its sub-schemas) immutable, as required for shared instances."
+        object.__setattr__(self, "_frozen", True)
+        self._freeze_sub_schemas()
+        return self
+
+    def compile(self) -> Any:
+        "Build a specialized validator callable with only the configured checks."
+        from .compiler import compile_schema
+        return compile_schema(self)
+
+    def compile_source(self, cache_directory: Optional[str] = None, cache: bool = True) -> Any:
+        "Generate, compile and cache on disk (by schema hash) a specialized validator module."
+        from .codegen import compile_source
+        return compile_source(self, cache_directory, cache)
+
+    def to_source(self) -> str:
+        "Python source of the generated validator module (see compile_source())."
+        from .codegen import generate_source
+        return generate_source(self)
 
     def cli_capture(self, prompt_context: str = "") -> Any:
         label = self.name if self.name else f"Data ({self.data_type.__name__})"
@@ -0,0 +1,176 @@
+# Library import
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+from .. import exceptions
+from .primitive_data import PrimitiveData
+from .complex_data import ComplexData
+from .index import nested_schemas
+
+# Constants definition
+SCHEMA_CLASSES: tuple = (PrimitiveData, ComplexData)
+RULES: tuple = ("type", "length", "size", "possible_values", "regex")
+RULE_EXCEPTIONS: Dict[type, str] = {
+    exceptions.DataTypeException: "type",
+    exceptions.LengthException: "length",
+    exceptions.SizeException: "size",
+    exceptions.PossibleValueException: "possible_values",
+    exceptions.RegularExpressionException: "regex",
+}
+PROFILES: Dict[int, 'SchemaProfile'] = {} # Profiled schemas, by id (each profile keeps its schema alive)
+ORIGINALS: Dict[type, tuple] = {} # Non-instrumented (_check, _is_match) of the patched classes
+STACKS = threading.local() # Per thread: time spent in profiled sub-schemas, per open call
+
+# Functions definition
+def schema_label(schema: Any) -> str:
+    if isinstance(schema.name, str) and schema.name:
+        return schema.name
+    data_type = getattr(schema.data_type, "__name__", str(schema.data_type))
+    return f"{schema.__class__.__name__}({data_type})"
+
+def _unique_label(labels: dict, schema: Any) -> str:
+    label = base = schema_label(schema)
+    suffix = 1
+    while label in labels:
+        suffix += 1
+        label = f"{base}#{suffix}"
+    return label
+
+def _rule(schema: Any, data: Any, failure: exceptions.ValidationFailure) -> str:
+    rule = RULE_EXCEPTIONS.get(failure.exception_type)
+    if rule is not None:
+        return rule
+
+    # ComplexData reports its length and content failures as ValueError
+    if isinstance(schema, ComplexData):
+        shape = ComplexData._check_shape(schema, data)
+        if shape is None:
+            return "possible_values"
+        return RULE_EXCEPTIONS.get(shape.exception_type, "length")
+    return "possible_values"
+
+def _profiled_check(check: Callable) -> Callable:
+    def _check(self: Any, data: Any) -> Optional[exceptions.ValidationFailure]:
+        profile = PROFILES.get(id(self))
+        if profile is None:
+            return check(self, data)
+
+        stack = getattr(STACKS, "stack", None)
+        if stack is None:
+            stack = STACKS.stack = []
+        stack.append(0.0)
+        start = perf_counter()
+        try:
+            failure = check(self, data)
+        except Exception:
+            profile.errors += 1
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            profile.calls += 1
+            profile.total_time += elapsed
+            profile.own_time += elapsed - children
+
+        if failure is not None:
+            rule = _rule(self, data, failure)
+            profile.failures[rule] = profile.failures.get(rule, 0) + 1
+        return failure
+    return _check
+
+def _profiled_match(match: Callable) -> Callable:
+    def _is_match(self: Any, element: Any, schema: Any) -> bool:
+        result = match(self, element, schema)
+        profile = PROFILES.get(id(self))
+        if profile is not None and isinstance(schema, SCHEMA_CLASSES):
+            branch = profile.branches.get(id(schema))
+            if branch is None:
+                branch = profile.branches[id(schema)] = [schema, 0, 0]
+            branch[1] += 1
+            if result:
+                branch[2] += 1
+        return result
+    return _is_match
+
+def _install() -> None:
+    # Instrumented methods only while some schema is profiled: no cost otherwise
+    for schema_class in SCHEMA_CLASSES:
+        if schema_class not in ORIGINALS:
+            ORIGINALS[schema_class] = (schema_class._check, schema_class._is_match)
+            schema_class._check = _profiled_check(schema_class._check)
+            schema_class._is_match = _profiled_match(schema_class._is_match)
+
+def _uninstall() -> None:
+    for schema_class, (check, match) in list(ORIGINALS.items()):
+        schema_class._check = check
+        schema_class._is_match = match
+        del ORIGINALS[schema_class]
+
+def enable_profiling(schema: Any, nested: bool = True) -> 'SchemaProfile':
+    "Profile a schema (and, with nested, every sub-schema it holds)."
+    profile = PROFILES.get(id(schema))
+    if profile is None:
+        profile = PROFILES[id(schema)] = SchemaProfile(schema)
+        if nested:
+            for child in nested_schemas(schema.possible_values):
+                enable_profiling(child, nested)
+    _install()
+    return profile
+
+def disable_profiling(schema: Any, nested: bool = True) -> None:
+    if PROFILES.pop(id(schema), None) is not None and nested:
+        for child in nested_schemas(schema.possible_values):
+            disable_profiling(child, nested)
+    if not PROFILES:
+        _uninstall()
+
+def snapshot() -> dict:
+    "Counters of every profiled schema, by label (repeated labels get a #n suffix)."
+    result = {}
+    for profile in list(PROFILES.values()):
+        result[_unique_label(result, profile.schema)] = profile.snapshot()
+    return result
+
+# Classes definition
+class SchemaProfile:
+    """
+    Contadores de validacion de un esquema: llamadas, tiempo acumulado (total,
+    y propio sin los sub-esquemas perfilados), fallos por tipo de regla, y
+    aciertos por rama (sub-esquemas probados de possible_values).
+
+    Solo se mide la validacion interpretada (validate, is_valid, y los
+    sub-esquemas que estas recorren).
+    """
+    __slots__ = ("schema", "calls", "errors", "total_time", "own_time", "failures", "branches")
+
+    def __init__(self, schema: Any) -> None:
+        self.schema = schema
+        self.reset()
+
+    # Public methods
+    def reset(self) -> None:
+        self.calls: int = 0
+        self.errors: int = 0
+        self.total_time: float = 0.0
+        self.own_time: float = 0.0
+        self.failures: Dict[str, int] = {}
+        self.branches: Dict[int, list] = {}
+
+    def snapshot(self) -> dict:
+        failures = {rule: self.failures.get(rule, 0) for rule in RULES}
+        branches = {}
+        for branch, tries, hits in list(self.branches.values()):
+            branches[_unique_label(branches, branch)] = {"tries": tries, "hits": hits, "hit_rate": hits / tries if tries else 0.0}
+
+        return {
+            "calls": self.calls,
+            "failures": sum(failures.values()),
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "own_time": self.own_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+            "failures_by_rule": failures,
+            "branches": branches,
+        }
@@ -0,0 +1,281 @@
+# Library import
+import json
+import weakref
+from typing import Any, Dict, Optional
+from .primitive_data import PrimitiveData
+from .complex_data import ComplexData
+from .index import nested_schemas
+
+# Constants definition
+REFERENCE_KEY: str = "$ref"
+DEFINITIONS_KEY: str = "DEFINITIONS"
+SCHEMA_CLASSES: Dict[str, type] = {"PrimitiveData": PrimitiveData, "ComplexData": ComplexData}
+
+# Functions definition
+def is_reference(element: Any) -> bool:
+    return type(element) is dict and len(element) == 1 and REFERENCE_KEY in element
+
+def _is_wrapper(element: dict) -> bool:
+    # {"__type__": ..., "content": {...}}: sub-schema form used by ComplexData
+    return len(element) == 2 and "__type__" in element and "content" in element
+
+# Classes definition
+class _Token:
+    # Structural key identity: alive while an interned schema (or a parent key) refers to it
+    __slots__ = ("__weakref__",)
+
+class SchemaRegistry:
+    """
+    Registro de esquemas compartidos (hash-consing).
+
+    Los esquemas deserializados con el mismo contenido estructural (incluyendo
+    nombre, descripcion y restricciones) se resuelven a una unica instancia
+    inmutable (freeze()), compartida entre documentos.
+
+    El registro no mantiene vivos los esquemas: al liberarse, sus entradas (y
+    las claves estructurales que solo ellos utilizan) se descartan.
+    """
+    __slots__ = ("_keys", "_schemas")
+
+    def __init__(self) -> None:
+        self._keys: weakref.WeakValueDictionary = weakref.WeakValueDictionary() # tuple -> _Token
+        self._schemas: weakref.WeakValueDictionary = weakref.WeakValueDictionary() # (type, _Token) -> schema
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __contains__(self, schema: Any) -> bool:
+        return any(schema is shared for shared in self._schemas.values())
+
+    # Public methods
+    def token(self, key: tuple) -> _Token:
+        "Object standing for a structural key (nested keys stay shallow)."
+        token = self._keys.get(key)
+        if token is None:
+            token = self._keys[key] = _Token()
+        return token
+
+    def get(self, schema_class: type, token: _Token) -> Optional[Any]:
+        return self._schemas.get((schema_class, token))
+
+    def store(self, schema_class: type, token: _Token, schema: Any) -> Any:
+        return self._schemas.setdefault((schema_class, token), schema.freeze())
+
+    def intern(self, schema: Any) -> Any:
+        "Shared immutable instance structurally equal to the schema (and its sub-schemas)."
+        return type(schema).from_dict(schema.to_dict(references=True), registry=self)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._schemas.clear()
+
+class SchemaLoader:
+    """
+    Contexto de deserializacion de un documento: resuelve las referencias
+    ({"$ref": nombre}) de DEFINITIONS a una unica instancia por nombre, e interna
+    los sub-esquemas en el registro (si se especifica).
+
+    En modo diferido (lazy), los esquemas anidados se construyen en su primer
+    uso: el contexto (y el documento) se conserva mientras queden pendientes.
+    """
+    __slots__ = ("definitions", "registry", "loaded", "references", "tokens", "resolving", "keys", "lazy", "document_content")
+
+    def __init__(self, definitions: Optional[dict] = None, registry: Optional[SchemaRegistry] = None, lazy: bool = False) -> None:
+        if definitions is not None and not isinstance(definitions, dict):
+            raise ValueError(f"Schema definitions must be a dict. Received: {type(definitions).__name__}")
+
+        self.definitions: dict = definitions or {}
+        self.registry = registry
+        self.loaded: Dict[int, Any] = {}
+        self.references: Dict[str, Any] = {}
+        self.tokens: Dict[int, Any] = {}
+        self.resolving: set = set()
+        self.keys: Dict[str, Any] = {}
+        self.lazy = lazy
+        self.document_content: Optional[dict] = None
+
+    @classmethod
+    def document(cls, schema_class: type, data: dict, registry: Optional[SchemaRegistry] = None, lazy: bool = False) -> Any:
+        definitions = data.get(DEFINITIONS_KEY)
+        if definitions is not None:
+            data = {key: content for key, content in data.items() if key != DEFINITIONS_KEY}
+        loader = cls(definitions, registry, lazy)
+        # Loaded nodes are memoized by id: the content stays alive while schemas are pending
+        loader.document_content = data
+        return loader.load(schema_class, data)
+
+    # Private methods
+    def _definition(self, name: Any) -> dict:
+        try:
+            content = self.definitions[name]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unknown schema reference: {name}")
+        if not isinstance(content, dict):
+            raise ValueError(f"Invalid schema definition: {name}")
+        return content
+
+    def _key(self, element: Any) -> Any:
+        # Structural key: containers are reduced to registry tokens (memoized per node)
+        element_type = type(element)
+        if element_type is not dict and element_type is not list:
+            return (element_type, element) # Unhashable literals (not JSON content) are not interned
+
+        key = self.tokens.get(id(element))
+        if key is not None:
+            return key
+
+        if element_type is list:
+            key = self.registry.token(("list",) + tuple([self._key(item) for item in element]))
+        elif is_reference(element):
+            key = self._reference_key(element[REFERENCE_KEY])
+        elif _is_wrapper(element):
+            key = self._key(element["content"])
+        else:
+            parts = ["dict"]
+            for item_key, item in element.items():
+                # Schema keys are serialized as JSON strings (they may hold references)
+                if type(item_key) is str and item_key[:1] in ("{", "["):
+                    item_key = self.parse_key(item_key)
+                parts.append(self._key(item_key))
+                parts.append(self._key(item))
+            key = self.registry.token(tuple(parts))
+
+        self.tokens[id(element)] = key
+        return key
+
+    def _reference_key(self, name: Any) -> Any:
+        if name in self.resolving:
+            raise ValueError(f"Circular schema reference: {name}")
+        self.resolving.add(name)
+        try:
+            return self._key(self._definition(name))
+        finally:
+            self.resolving.discard(name)
+
+    # Public methods
+    def parse_key(self, key: str) -> Any:
+        "JSON content of a serialized dict key (kept alive: loaded nodes are memoized by id)."
+        content = self.keys.get(key)
+        if content is None:
+            try:
+                content = json.loads(key)
+            except ValueError:
+                content = key
+            self.keys[key] = content
+        return content
+
+    def load(self, schema_class: type, content: dict) -> Any:
+        "Build (or reuse) the schema of a serialized content."
+        schema = self.loaded.get(id(content))
+        if schema is not None:
+            return schema
+
+        token = None
+        if self.registry is not None:
+            try:
+                token = self._key(content)
+            except TypeError:
+                token = None
+            if token is not None:
+                schema = self.registry.get(schema_class, token)
+
+        if schema is None:
+            schema = schema_class._from_dict(content, self)
+            if token is not None:
+                schema = self.registry.store(schema_class, token, schema)
+
+        self.loaded[id(content)] = schema
+        return schema
+
+    def resolve(self, name: Any) -> Any:
+        "Schema of a named definition: every reference resolves to the same instance."
+        try:
+            schema = self.references.get(name)
+        except TypeError:
+            raise ValueError(f"Unknown schema reference: {name}")
+        if schema is not None:
+            return schema
+
+        if name in self.resolving:
+            raise ValueError(f"Circular schema reference: {name}")
+        content = self._definition(name)
+        schema_class = SCHEMA_CLASSES.get(content.get("__type__"))
+        if schema_class is None:
+            raise ValueError(f"Unknown serialized object type: {content.get('__type__')}")
+
+        self.resolving.add(name)
+        try:
+            schema = self.references[name] = self.load(schema_class, content)
+        finally:
+            self.resolving.discard(name)
+        return schema
+
+class SchemaReferences:
+    """
+    Contexto de serializacion de to_dict(references=True): los sub-esquemas
+    utilizados mas de una vez se emiten una sola vez en DEFINITIONS, y cada
+    aparicion como {"$ref": nombre}.
+    """
+    __slots__ = ("counts", "names", "keys", "definitions")
+
+    def __init__(self, root: Any) -> None:
+        self.counts: Dict[int, int] = {}
+        self.names: Dict[int, str] = {}
+        self.keys: Dict[Any, str] = {}
+        self.definitions: Dict[str, dict] = {}
+        self._count(root)
+
+    # Private methods
+    def _count(self, schema: Any) -> None:
+        occurrences = self.counts.get(id(schema), 0)
+        self.counts[id(schema)] = occurrences + 1
+        if not occurrences: # Children are only counted once
+            for child in nested_schemas(schema.possible_values):
+                self._count(child)
+
+    def _name(self, schema: Any) -> str:
+        base = schema.name if isinstance(schema.name, str) and schema.name else schema.__class__.__name__
+        name, suffix = base, 1
+        while name in self.definitions:
+            suffix += 1
+            name = f"{base}_{suffix}"
+        return name
+
+    @staticmethod
+    def _structure(element: Any) -> Any:
+        if isinstance(element, dict):
+            return ("dict",) + tuple((SchemaReferences._structure(key), SchemaReferences._structure(item)) for key, item in element.items())
+        if isinstance(element, list):
+            return ("list",) + tuple(SchemaReferences._structure(item) for item in element)
+        hash(element)
+        return (type(element), element)
+
+    # Public methods
+    def is_shared(self, schema: Any) -> bool:
+        return self.counts.get(id(schema), 0) > 1
+
+    def reference(self, schema: Any) -> dict:
+        name = self.names.get(id(schema))
+        if name is None:
+            content = schema._to_dict(self)
+
+            # Structurally identical definitions are emitted once
+            try:
+                key = self._structure(content)
+                name = self.keys.get(key)
+            except TypeError:
+                key = None
+            if name is None:
+                name = self._name(schema)
+                self.definitions[name] = content
+                if key is not None:
+                    self.keys[key] = name
+            self.names[id(schema)] = name
+
+        return {REFERENCE_KEY: name}
+
+    def document(self, root: Any) -> dict:
+        data = root._to_dict(self)
+        if self.definitions:
+            data[DEFINITIONS_KEY] = self.definitions
+        return data
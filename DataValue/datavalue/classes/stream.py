@@ -0,0 +1,198 @@
+# Library import
+import codecs
+import json
+import re
+from typing import Any, Iterator, Optional, Tuple
+from .complex_data import ComplexData
+
+# Constants definition
+FORMATS: tuple = ("array", "jsonl")
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_TYPES: tuple = (int, float)
+TRUNCATION_MARGIN: int = 8 # Longest partial token at the end of the buffer (ej: "\u00e", "fals")
+
+# Functions definition
+def _located_error(exception_type: type, message: str, byte_offset: int, element_index: Optional[int] = None) -> Exception:
+    error = exception_type(f"{message} (byte offset: {byte_offset})")
+    error.byte_offset = byte_offset
+    error.element_index = element_index
+    return error
+
+# Classes definition
+class JSONStreamReader:
+    """
+    Lector incremental de un arreglo JSON, o de un archivo JSONL (un valor por
+    linea). Solo conserva en memoria el bloque leido y el elemento actual.
+
+    Las posiciones de los elementos se reportan en bytes (UTF-8) desde el inicio
+    del archivo.
+    """
+    def __init__(self, fileobj: Any, chunk_size: int = 65536) -> None:
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(f"The chunk size must be a positive integer. Received: {chunk_size}")
+
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+        self.read_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("UTF-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer: str = ""
+        self.position: int = 0
+        self.offset: int = 0 # Bytes before the buffer
+        self.eof: bool = False
+        self.started: bool = False
+
+    # Private methods
+    def _fill(self) -> bool:
+        # Appends a chunk; the consumed text is dropped (the positions move to the buffer start)
+        if self.eof:
+            return False
+
+        chunk = self.fileobj.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            if isinstance(chunk, (bytes, bytearray)):
+                self.decoder.decode(b"", final=True) # Truncated UTF-8 sequence
+            return False
+
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = self.decoder.decode(chunk)
+            if not self.started and chunk.startswith("\ufeff"):
+                self.offset, chunk = 3, chunk[1:] # UTF-8 BOM (accepted by json.load)
+        self.started = True
+
+        if self.position:
+            self.offset += len(self.buffer[:self.position].encode("UTF-8"))
+            self.buffer = self.buffer[self.position:]
+            self.position = 0
+        self.buffer += chunk
+        return True
+
+    def _grow(self) -> bool:
+        # Incomplete element: the read size doubles, so large elements are parsed in linear time
+        self.read_size *= 2
+        return self._fill()
+
+    def _next_character(self) -> str:
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ""
+
+    def _invalid(self, message: str, position: Optional[int] = None) -> Exception:
+        return _located_error(ValueError, f"Invalid JSON: {message}", self.byte_offset(position))
+
+    def _decode(self) -> Tuple[int, Any]:
+        # The element start moves when the consumed text is dropped (on reads)
+        while True:
+            try:
+                element, end = self.json_decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as error:
+                truncated = error.msg.startswith("Unterminated string") or error.pos >= len(self.buffer) - TRUNCATION_MARGIN
+                if truncated and self._grow():
+                    continue
+                raise self._invalid(error.msg, error.pos)
+
+            # A number at the end of the buffer may continue in the next chunk
+            if type(element) in NUMBER_TYPES and len(self.buffer) - end < TRUNCATION_MARGIN and self._grow():
+                continue
+
+            self.read_size = self.chunk_size
+            start, self.position = self.position, end
+            return start, element
+
+    def _array(self) -> Iterator[Tuple[int, Any]]:
+        if self._next_character() != "[":
+            raise self._invalid("Expecting '['")
+        self.position += 1
+
+        character = self._next_character()
+        if character == "]":
+            self.position += 1
+        else:
+            while True:
+                if character == "":
+                    raise self._invalid("Unterminated array")
+                yield self._decode()
+
+                character = self._next_character()
+                if character == "]":
+                    self.position += 1
+                    break
+                if character != ",":
+                    raise self._invalid("Expecting ',' delimiter")
+                self.position += 1
+                character = self._next_character()
+                if character == "]":
+                    raise self._invalid("Expecting value")
+
+        if self._next_character() != "":
+            raise self._invalid("Extra data")
+
+    def _lines(self) -> Iterator[Tuple[int, Any]]:
+        while self._next_character() != "": # Blank lines are skipped
+            end = self.buffer.find("\n", self.position)
+            while end < 0 and self._grow():
+                end = self.buffer.find("\n", self.position)
+            if end < 0:
+                end = len(self.buffer)
+            self.read_size = self.chunk_size
+
+            try:
+                element = self.json_decoder.decode(self.buffer[self.position:end])
+            except json.JSONDecodeError as error:
+                raise self._invalid(error.msg, self.position + error.pos)
+            yield self.position, element
+            self.position = end
+
+    # Public methods
+    def byte_offset(self, position: Optional[int] = None) -> int:
+        "Byte offset of a buffer position (valid until the next read)."
+        position = self.position if position is None else position
+        return self.offset + len(self.buffer[:position].encode("UTF-8"))
+
+    def elements(self, format: Optional[str] = None) -> Iterator[Tuple[int, Any]]:
+        "(buffer position, element) pairs; without format, a document starting with '[' is read as an array."
+        if format is None:
+            format = "array" if self._next_character() == "[" else "jsonl"
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported stream format: {format}. Expected one of: {FORMATS}")
+        return self._array() if format == "array" else self._lines()
+
+def validate_stream(schema: ComplexData, fileobj: Any, format: Optional[str] = None, chunk_size: int = 65536) -> bool:
+    """
+    Valida un arreglo JSON (o un archivo JSONL) de forma incremental, como
+    validate(json.load(fileobj)), con memoria constante.
+
+    Cada elemento se valida al ser leido, y la longitud maxima se verifica sobre
+    la marcha. La excepcion del primer fallo incluye su posicion en bytes
+    (atributos byte_offset y element_index).
+    """
+    if format is not None and format not in FORMATS:
+        raise ValueError(f"Unsupported stream format: {format}. Expected one of: {FORMATS}")
+
+    # The document is decoded as a list
+    if not isinstance([], schema.data_type):
+        raise schema._check([]).exception()
+
+    reader = JSONStreamReader(fileobj, chunk_size)
+    maximum_length, minimum_length = schema.maximum_length, schema.minimum_length
+    check_content = bool(schema.possible_values)
+    length = 0
+
+    for position, element in reader.elements(format):
+        length += 1
+        if maximum_length is not None and length > maximum_length:
+            raise _located_error(ValueError, f"Maximum length reached: {length} > {maximum_length}", reader.byte_offset(position), length - 1)
+
+        if check_content:
+            failure = schema._check_collection((element,), length - 1)
+            if failure is not None:
+                raise _located_error(failure.exception_type, failure.message, reader.byte_offset(position), length - 1)
+
+    if minimum_length is not None and length < minimum_length:
+        raise _located_error(ValueError, f"Minimum length not reached: {length} < {minimum_length}", reader.byte_offset())
+
+    return True
@@ -0,0 +1,231 @@
+# Library import
+from bisect import bisect_left
+from typing import Any, Iterable
+from .complex_data import ComplexData
+
+# Classes definition
+class TrackedList(list):
+    """
+    Lista observable: registra los indices de los elementos asignados o
+    insertados desde la ultima revalidacion. Las eliminaciones no requieren
+    revalidar elementos (solo la longitud), y desplazan los indices registrados.
+    """
+    __slots__ = ("dirty", "all_dirty")
+
+    def __init__(self, iterable: Iterable = ()) -> None:
+        super().__init__(iterable)
+        self.dirty: set = set()
+        self.all_dirty: bool = True # Never validated
+
+    # Private methods
+    def _shift(self, start: int, amount: int) -> None:
+        if self.dirty:
+            self.dirty = {index + amount if index >= start else index for index in self.dirty}
+
+    def _remove_indices(self, removed: list) -> None:
+        # removed: sorted indices (before the deletion)
+        if self.dirty:
+            removed_set = set(removed)
+            self.dirty = {index - bisect_left(removed, index) for index in self.dirty if index not in removed_set}
+
+    def _insert_position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            return max(0, length + index)
+        return min(index, length)
+
+    # Public methods
+    def mark_clean(self) -> None:
+        self.dirty = set()
+        self.all_dirty = False
+
+    def mark_all(self) -> None:
+        self.all_dirty = True
+
+    def __reduce__(self) -> tuple:
+        # Restored through the constructor: pickle would fill the list with append() before the slots exist
+        return (self.__class__, (list(self),), (None, {"dirty": set(self.dirty), "all_dirty": self.all_dirty}))
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if not isinstance(index, slice):
+            super().__setitem__(index, value)
+            self.dirty.add(index + len(self) if index < 0 else index)
+            return None
+
+        previous_length = len(self)
+        start, stop, step = index.indices(previous_length)
+        super().__setitem__(index, value)
+
+        if step != 1:
+            self.dirty.update(range(start, stop, step)) # Extended slice: same length
+            return None
+
+        removed = max(0, stop - start)
+        added = len(self) - previous_length + removed
+        self._remove_indices(list(range(start, start + removed)))
+        self._shift(start, added)
+        self.dirty.update(range(start, start + added))
+
+    def __delitem__(self, index: Any) -> None:
+        length = len(self)
+        if isinstance(index, slice):
+            removed = sorted(range(*index.indices(length)))
+        else:
+            removed = [index + length if index < 0 else index]
+        super().__delitem__(index)
+        self._remove_indices(removed)
+
+    def __iadd__(self, values: Iterable) -> 'TrackedList':
+        self.extend(values)
+        return self
+
+    def __imul__(self, times: int) -> 'TrackedList':
+        super().__imul__(times)
+        if self.dirty:
+            self.all_dirty = True # Dirty elements repeated
+        if not self:
+            self.dirty = set()
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self.dirty.add(len(self) - 1)
+
+    def extend(self, values: Iterable) -> None:
+        previous_length = len(self)
+        super().extend(values)
+        self.dirty.update(range(previous_length, len(self)))
+
+    def insert(self, index: int, value: Any) -> None:
+        position = self._insert_position(index)
+        super().insert(index, value)
+        self._shift(position, 1)
+        self.dirty.add(position)
+
+    def pop(self, index: int = -1) -> Any:
+        length = len(self)
+        value = super().pop(index)
+        self._remove_indices([index + length if index < 0 else index])
+        return value
+
+    def remove(self, value: Any) -> None:
+        del self[self.index(value)]
+
+    def clear(self) -> None:
+        super().clear()
+        self.dirty = set()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        if self.dirty:
+            self.all_dirty = True # Dirty elements moved
+
+    def reverse(self) -> None:
+        super().reverse()
+        if self.dirty:
+            length = len(self)
+            self.dirty = {length - 1 - index for index in self.dirty}
+
+class TrackedDict(dict):
+    """
+    Diccionario observable: registra las claves asignadas desde la ultima
+    revalidacion. Las claves eliminadas no requieren revalidacion.
+    """
+    __slots__ = ("dirty", "all_dirty")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.dirty: set = set()
+        self.all_dirty: bool = True # Never validated
+
+    # Public methods
+    def mark_clean(self) -> None:
+        self.dirty = set()
+        self.all_dirty = False
+
+    def mark_all(self) -> None:
+        self.all_dirty = True
+
+    def __reduce__(self) -> tuple:
+        # Restored through the constructor: pickle would fill the dictionary with __setitem__ before the slots exist
+        return (self.__class__, (dict(self),), (None, {"dirty": set(self.dirty), "all_dirty": self.all_dirty}))
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.dirty.add(key)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.dirty.discard(key)
+
+    def __ior__(self, values: Any) -> 'TrackedDict':
+        self.update(values)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        value = super().pop(key, *default)
+        self.dirty.discard(key)
+        return value
+
+    def popitem(self) -> tuple:
+        key, value = super().popitem()
+        self.dirty.discard(key)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self.dirty = set()
+
+# Constants definition
+TRACKED_TYPES: tuple = (TrackedList, TrackedDict)
+
+# Functions definition
+def track(value: Any) -> Any:
+    if isinstance(value, dict):
+        return TrackedDict(value)
+    if isinstance(value, list):
+        return TrackedList(value)
+    raise TypeError(f"Only list and dict values can be tracked. Received: {type(value).__name__}")
+
+def revalidate(schema: ComplexData) -> bool:
+    """
+    Revalida el valor de un esquema: si es un valor observable (track()), solo
+    se validan el tipo de dato, la longitud, y los elementos modificados desde
+    la ultima revalidacion exitosa. En otro caso, se valida todo el valor.
+
+    Los elementos anidados modificados en su lugar (ej: value[0]["KEY"] = ...)
+    no se registran: se deben reasignar (value[0] = ...).
+    """
+    value = schema.value
+    if not isinstance(value, TRACKED_TYPES):
+        return schema.validate()
+
+    if value.all_dirty:
+        schema.validate()
+        value.mark_clean()
+        return True
+
+    failure = schema._check_shape(value)
+    if failure is None and schema.possible_values and value.dirty:
+        if isinstance(value, dict):
+            failure = schema._check_dictionary({key: value[key] for key in value.dirty})
+        else:
+            for index in sorted(value.dirty):
+                failure = schema._check_collection((value[index],), index)
+                if failure is not None:
+                    break
+
+    # Failed elements stay dirty until they are valid
+    if failure is not None:
+        raise failure.exception()
+    value.mark_clean()
+    return True
@@ -8,3 +8,23 @@ class LengthException(DataValueException): pass
 class SizeException(DataValueException): pass
 class PossibleValueException(DataValueException): pass
 class RegularExpressionException(DataValueException): pass
+
+# Validation results
+class ValidationFailure:
+    "Failed validation whose message is only formatted when the exception is requested."
+    __slots__ = ("exception_type", "template", "arguments")
+
+    def __init__(self, exception_type: type, template: str, arguments: tuple = ()) -> None:
+        self.exception_type = exception_type
+        self.template = template
+        self.arguments = arguments
+
+    @property
+    def message(self) -> str:
+        return self.template.format(*self.arguments)
+
+    def exception(self) -> Exception:
+        return self.exception_type(self.message)
+
+    def __repr__(self) -> str:
+        return f"<ValidationFailure {self.exception_type.__name__}>"
@@ -0,0 +1,102 @@
+# Library import
+from datavalue import ComplexData, PrimitiveData
+from datavalue.classes import codec
+
+# Schemas definition
+IPv4 = PrimitiveData(data_type=str, value=None, name="IPv4", minimum_length=7, maximum_length=15, regular_expression=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$", data_class=True)
+Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+Endpoint = ComplexData(data_type=dict, value=None, name="Endpoint", possible_values={"ADDRESS": [IPv4], "PORT": [Port], str: [int, float, None]}, data_class=True)
+Profile = ComplexData(data_type=dict, value=None, name="Profile", possible_values={
+    "TRANSPORT": ["INTERNET", "BLUETOOTH"],
+    "ADDRESSES": ComplexData(data_type=list, value=None, possible_values=[Endpoint], data_class=True, discriminator="TYPE"),
+}, data_class=True)
+
+# Tests definition
+def test_primitive_round_trip():
+    print("[*] Validating PrimitiveData binary round-trip...")
+    key = PrimitiveData(data_type=bytes, value=b"\x00\x01\xff" * 10, name="Key", description="Raw key", maximum_length=64)
+    restored = PrimitiveData.from_bytes(key.to_bytes())
+    assert restored.to_dict() == key.to_dict()
+    assert restored.value == key.value
+
+    amount = PrimitiveData(data_type=float, value=-12.5, minimum_size=-100.0, possible_values=(-12.5, 0.0, 3))
+    assert PrimitiveData.from_bytes(amount.to_bytes()).to_dict() == amount.to_dict()
+
+    big = PrimitiveData(data_type=int, value=-(2 ** 80), data_class=False)
+    assert PrimitiveData.from_bytes(big.to_bytes()).value == -(2 ** 80)
+    print("[OK] PrimitiveData round-trip completed.")
+
+def test_complex_round_trip():
+    print("[*] Validating ComplexData binary round-trip...")
+    restored = ComplexData.from_bytes(Profile.to_bytes())
+    assert restored.to_dict() == Profile.to_dict()
+    assert restored.possible_values["ADDRESSES"].discriminator == "TYPE"
+    assert restored.validate({"TRANSPORT": "INTERNET", "ADDRESSES": [{"ADDRESS": "10.0.0.1", "PORT": 80, "WEIGHT": 0.5}]})
+
+    values = ComplexData(data_type=tuple, value=(1, "A", b"\x00", (2.5, None), frozenset({3})), possible_values=None)
+    assert ComplexData.from_bytes(values.to_bytes()).value == values.value
+
+    # Compact: no base64, no repeated key strings
+    assert len(Profile.to_bytes()) < len(Profile.to_json().encode()) / 3
+    print("[OK] ComplexData round-trip completed.")
+
+def test_invalid_data():
+    print("[*] Validating malformed binary data...")
+    data = Profile.to_bytes()
+    for invalid in (b"", b"XX\x01", data[:-3], data + b"\x00"):
+        try:
+            ComplexData.from_bytes(invalid)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Malformed data accepted: {invalid[:10]!r}")
+    try:
+        PrimitiveData.from_bytes(data)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("ComplexData accepted as PrimitiveData.")
+    print("[OK] Malformed data rejected.")
+
+def test_value_subclasses():
+    print("[*] Validating tracked and lazy values...")
+    ports = ComplexData(data_type=list, value=[80, 443], possible_values=[Port])
+    ports.track().append(8080)
+    assert ComplexData.from_bytes(ports.to_bytes()).value == [80, 443, 8080]
+
+    document = Endpoint.to_dict()
+    document["VALUE"], document["DATA_CLASS"] = {"ADDRESS": "10.0.0.1", "PORT": 80}, False
+    lazy = ComplexData.from_dict(document, lazy=True)
+    assert type(ComplexData.from_bytes(lazy.to_bytes()).value) is dict
+    assert ComplexData.from_bytes(lazy.to_bytes()).value == {"ADDRESS": "10.0.0.1", "PORT": 80}
+
+    # Unhashable dictionary keys and set elements (list tag instead of tuple): ValueError
+    for container, position in (({(1,): 1}, 5), (frozenset({(1,)}), 4)):
+        data = bytearray(codec.dumps(container))
+        data[position] = codec.TAG_LIST
+        try:
+            codec.loads(bytes(data))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Unhashable key accepted.")
+
+    # Errors raised while decoding a dictionary value are not reported as unhashable keys
+    def failing_schema(self, schema_class):
+        raise TypeError("Schema constructor error")
+    original_schema, codec.Decoder._schema = codec.Decoder._schema, failing_schema
+    try:
+        codec.loads(codec.dumps({"PORT": Port}))
+    except TypeError as Error:
+        assert str(Error) == "Schema constructor error"
+    else:
+        raise AssertionError("Schema constructor error not raised.")
+    finally:
+        codec.Decoder._schema = original_schema
+    print("[OK] Tracked and lazy values completed.")
+
+if __name__ == "__main__":
+    test_primitive_round_trip()
+    test_complex_round_trip()
+    test_invalid_data()
+    test_value_subclasses()
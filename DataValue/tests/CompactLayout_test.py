@@ -0,0 +1,70 @@
+# Library import
+import copy
+import pickle
+from datavalue import ComplexData, PrimitiveData
+
+# Tests definition
+def test_shared_constraints():
+    print("[*] Validating shared constraint records...")
+    fields = [PrimitiveData(data_type=int, value=number, name=f"FIELD_{number}", minimum_size=0, maximum_size=255) for number in range(100)]
+    assert all(field._constraints is fields[0]._constraints for field in fields)
+    assert not hasattr(fields[0], "__dict__")
+    assert not hasattr(ComplexData(data_type=list, value=[1], possible_values=[int]), "__dict__")
+
+    # Assignment replaces the record of one instance only
+    fields[1].maximum_size = 10
+    assert fields[1].maximum_size == 10 and fields[0].maximum_size == 255
+    try:
+        fields[1].validate(11)
+    except Exception:
+        pass
+    else:
+        raise AssertionError("Updated constraint not applied.")
+
+    # Equal but differently typed constraints are kept apart (serialized output)
+    integer = PrimitiveData(data_type=float, value=None, minimum_size=1, data_class=True)
+    real = PrimitiveData(data_type=float, value=None, minimum_size=1.0, data_class=True)
+    assert integer._constraints is not real._constraints
+    assert type(integer.to_dict()["MINIMUM_SIZE"]) is int and type(real.to_dict()["MINIMUM_SIZE"]) is float
+    print("[OK] Constraint records shared.")
+
+def test_public_interface_unchanged():
+    print("[*] Validating attribute access and serialization...")
+    code = PrimitiveData(data_type=str, value="ab12", name="Code", description="Short code", minimum_length=2, maximum_length=8, regular_expression=r"^[a-z0-9]+$")
+    assert (code.description, code.minimum_length, code.maximum_length, code.regular_expression) == ("Short code", 2, 8, r"^[a-z0-9]+$")
+    assert code.maximum_size is None and code.minimum_size is None
+    assert PrimitiveData.from_dict(code.to_dict()).to_dict() == code.to_dict()
+
+    codes = ComplexData(data_type=list, value=["ab"], name="Codes", description="Codes", maximum_length=3, possible_values=[code], discriminator=None)
+    assert (codes.description, codes.maximum_length, codes.minimum_length) == ("Codes", 3, None)
+    assert ComplexData.from_dict(codes.to_dict()).to_dict() == codes.to_dict()
+    try:
+        code.unknown_attribute = True
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Attribute outside the slots assigned.")
+    print("[OK] Attribute access and serialization unchanged.")
+
+def test_pickle_and_copy():
+    print("[*] Validating pickling and copying of slotted instances...")
+    port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True).freeze()
+    restored = pickle.loads(pickle.dumps(port))
+    assert restored.frozen and restored.to_dict() == port.to_dict()
+    assert restored._constraints is port._constraints
+    try:
+        restored.maximum_size = 1
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Restored frozen schema modified.")
+
+    endpoints = ComplexData(data_type=list, value=None, possible_values=[port], maximum_length=4, data_class=True)
+    duplicate = copy.deepcopy(endpoints)
+    assert duplicate.to_dict() == endpoints.to_dict() and duplicate.is_valid([80]) and not duplicate.is_valid([0])
+    print("[OK] Pickling and copying completed.")
+
+if __name__ == "__main__":
+    test_shared_constraints()
+    test_public_interface_unchanged()
+    test_pickle_and_copy()
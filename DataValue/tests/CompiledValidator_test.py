@@ -0,0 +1,101 @@
+# Library import
+from datavalue import ComplexData, PrimitiveData
+
+# Helpers definition
+def interpreted_result(schema, value) -> bool:
+    try:
+        return schema.validate(value)
+    except Exception:
+        return False
+
+def compiled_result(validator, value) -> bool:
+    try:
+        return validator(value)
+    except Exception:
+        return False
+
+def assert_equivalent(schema, values) -> None:
+    validator = schema.compile()
+    for value in values:
+        expected = interpreted_result(schema, value)
+        assert compiled_result(validator, value) == expected, f"Mismatch on {value!r}"
+        assert validator.is_valid(value) == expected, f"Mismatch (is_valid) on {value!r}"
+
+# Schemas definition
+IPv4 = PrimitiveData(data_type=str, value=None, name="IPv4", regular_expression=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$", data_class=True)
+Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_length=1, maximum_length=5, minimum_size=1, maximum_size=65535, data_class=True)
+MAC = PrimitiveData(data_type=str, value=None, name="MAC", regular_expression=r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$", data_class=True)
+
+InternetAddr = ComplexData(data_type=dict, value=None, name="IP_Endpoint", possible_values={
+    "ADDRESS": [IPv4],
+    "PORT": [Port]
+}, data_class=True)
+
+BluetoothAddr = ComplexData(data_type=dict, value=None, name="BT_Endpoint", possible_values={
+    "ADDRESS": [MAC],
+    "PORT": [PrimitiveData(data_type=int, value=None, minimum_size=1, maximum_size=30, data_class=True)]
+}, data_class=True)
+
+ProfileSchema = ComplexData(data_type=dict, value=None, name="Profile", possible_values={
+    "TRANSPORT": ["INTERNET", "BLUETOOTH", "SERIAL"],
+    "ADDRESSES": ComplexData(data_type=list, value=None, possible_values=[InternetAddr, BluetoothAddr], data_class=True)
+}, data_class=True)
+
+# Tests definition
+def test_primitive_equivalence():
+    print("[*] Comparing compiled and interpreted PrimitiveData validation...")
+    assert_equivalent(Port, [None, 0, 1, 80, 65535, 65536, -5, True, 1.5, "80", b"80"])
+    assert_equivalent(IPv4, [None, "192.168.0.1", "999.1.1.1", "", "::1", 7, b"10.0.0.1"])
+    assert_equivalent(
+        PrimitiveData(data_type=bytes, value=None, maximum_length=4, regular_expression=r"^[A-Z]+$", data_class=True),
+        [b"ABCD", b"ABCDE", b"abc", "ABC", bytearray(b"AB"), None]
+    )
+    assert_equivalent(
+        PrimitiveData(data_type=float, value=None, minimum_length=2, maximum_size=10.5, data_class=True),
+        [1.0, 1.25, 10.5, 10.51, 1e20, 3, None]
+    )
+    assert_equivalent(
+        PrimitiveData(data_type=str, value=None, possible_values=("TCP", "UDP", Port), data_class=True),
+        ["TCP", "UDP", "SCTP", 80, None]
+    )
+    print("[OK] PrimitiveData compiled validation is equivalent.")
+
+def test_complex_equivalence():
+    print("[*] Comparing compiled and interpreted ComplexData validation...")
+    assert_equivalent(ProfileSchema, [
+        {"TRANSPORT": "INTERNET", "ADDRESSES": [{"ADDRESS": "192.168.1.50", "PORT": 8080}]},
+        {"TRANSPORT": "BLUETOOTH", "ADDRESSES": [{"ADDRESS": "00:11:22:33:44:55", "PORT": 3}]},
+        {"TRANSPORT": "BLUETOOTH", "ADDRESSES": [{"ADDRESS": "00:11:22:33:44:55", "PORT": 31}]},
+        {"TRANSPORT": "INTERNET", "ADDRESSES": [{"ADDRESS": "999.999.999.999", "PORT": 80}]},
+        {"TRANSPORT": "INTERNET", "ADDRESSES": [{"KEY_INTRUSION": "DANGER"}]},
+        {"TRANSPORT": "MODEM"},
+        {"UNKNOWN": 1},
+        {},
+        [],
+        None,
+    ])
+    assert_equivalent(
+        ComplexData(data_type=dict, value=None, possible_values=([str], [str, int]), data_class=True),
+        [{"USERNAME": "Specter", "AGE": 19}, {"AGE": 1.5}, {1: "A"}, {}]
+    )
+    assert_equivalent(
+        ComplexData(data_type=list, value=None, minimum_length=1, maximum_length=3, possible_values=["A", "B", int], data_class=True),
+        [["A"], ["A", 1, True], [], ["A", "B", "A", "B"], ["C"], ("A",)]
+    )
+    print("[OK] ComplexData compiled validation is equivalent.")
+
+def test_compiled_exceptions():
+    print("[*] Verifying compiled validator error reporting...")
+    validator = ProfileSchema.compile()
+    assert validator({"TRANSPORT": "SERIAL", "ADDRESSES": []}) is True
+    try:
+        validator({"TRANSPORT": "MODEM"})
+    except ValueError as Error:
+        print(f"[OK] Detailed exception preserved: {Error}")
+    else:
+        raise AssertionError("The compiled validator accepted an invalid payload.")
+
+if __name__ == "__main__":
+    test_primitive_equivalence()
+    test_complex_equivalence()
+    test_compiled_exceptions()
@@ -0,0 +1,53 @@
+# Library import
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_messages(discriminator=None) -> ComplexData:
+    Text = ComplexData(data_type=dict, value=None, name="Text", possible_values={"TYPE": ["TEXT"], "BODY": [str]}, data_class=True)
+    Image = ComplexData(data_type=dict, value=None, name="Image", possible_values={"TYPE": ["IMAGE", "PHOTO"], "DATA": [bytes]}, data_class=True)
+    Any = ComplexData(data_type=dict, value=None, name="Any", possible_values={str: [int]}, data_class=True)
+    return ComplexData(data_type=list, value=None, possible_values=[Text, Image, Any, "PING"], data_class=True, discriminator=discriminator)
+
+# Tests definition
+def test_discriminated_equivalence():
+    print("[*] Comparing discriminated and sequential union validation...")
+    sequential = build_messages()
+    discriminated = build_messages("TYPE")
+
+    assert set(discriminated._discriminator_index.cases) == {"TEXT", "IMAGE", "PHOTO"}
+    assert [schema.name for schema in discriminated._discriminator_index.fallback] == ["Any"]
+
+    payloads = [
+        [{"TYPE": "TEXT", "BODY": "Hola"}, {"TYPE": "PHOTO", "DATA": b"\x00"}, "PING"],
+        [{"TYPE": "TEXT", "DATA": b"\x00"}],
+        [{"TYPE": "VIDEO"}],
+        [{"TYPE": 7}],       # Only matched by the non-discriminated schema
+        [{"BODY": "Hola"}],  # No discriminator: every schema is tried
+        [{"TYPE": ["TEXT"]}],
+        ["PONG"],
+    ]
+    for payload in payloads:
+        expected = sequential.is_valid(payload)
+        assert discriminated.is_valid(payload) == expected, f"Mismatch on {payload}"
+        assert discriminated.compile().is_valid(payload) == expected, f"Mismatch (compiled) on {payload}"
+    print("[OK] Discriminated unions are equivalent.")
+
+def test_discriminator_serialization():
+    print("[*] Validating discriminator serialization...")
+    messages = build_messages("TYPE")
+    assert messages.to_dict()["DISCRIMINATOR"] == "TYPE"
+
+    reconstructed = ComplexData.from_json(messages.to_json())
+    assert reconstructed.discriminator == "TYPE"
+    assert set(reconstructed._discriminator_index.cases) == {"TEXT", "IMAGE", "PHOTO"}
+    assert reconstructed.validate([{"TYPE": "TEXT", "BODY": "Hola"}])
+
+    # Schemas without a discriminator keep their previous output (nested ones too)
+    assert "DISCRIMINATOR" not in messages.to_dict()["POSSIBLE_VALUES"][0]["content"]
+    assert "DISCRIMINATOR" not in build_messages().to_json()
+    assert ComplexData.from_json(build_messages().to_json()).discriminator is None
+    print("[OK] Discriminator preserved.")
+
+if __name__ == "__main__":
+    test_discriminated_equivalence()
+    test_discriminator_serialization()
@@ -0,0 +1,126 @@
+# Library import
+import builtins
+import marshal
+import os
+import tempfile
+from datavalue import ComplexData, PrimitiveData
+from datavalue.classes import codegen
+
+# Helpers definition
+def interpreted_result(schema, value) -> bool:
+    try:
+        return schema.validate(value)
+    except Exception:
+        return False
+
+def assert_equivalent(schema, values, directory) -> None:
+    validator = schema.compile_source(cache_directory=directory)
+    for value in values:
+        assert validator.is_valid(value) == interpreted_result(schema, value), f"Mismatch on {value!r}"
+
+# Schemas definition
+IPv4 = PrimitiveData(data_type=str, value=None, name="IPv4", regular_expression=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$", data_class=True)
+Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_length=1, maximum_length=5, minimum_size=1, maximum_size=65535, data_class=True)
+Endpoint = ComplexData(data_type=dict, value=None, name="Endpoint", possible_values={"ADDRESS": [IPv4], "PORT": [Port], str: [int, float, None]}, data_class=True)
+Internet = ComplexData(data_type=dict, value=None, possible_values={"TYPE": ["INTERNET"], "ADDRESS": [IPv4]}, data_class=True)
+Serial = ComplexData(data_type=dict, value=None, possible_values={"TYPE": ["SERIAL"], "BAUDS": [9600, 115200]}, data_class=True)
+Links = ComplexData(data_type=list, value=None, possible_values=[Internet, Serial, "NONE"], discriminator="TYPE", maximum_length=3, data_class=True)
+Profile = ComplexData(data_type=dict, value=None, name="Profile", possible_values={
+    "TRANSPORT": ["INTERNET", "BLUETOOTH"],
+    "ENDPOINTS": ComplexData(data_type=list, value=None, possible_values=[Endpoint], data_class=True),
+    "LINKS": [Links],
+}, data_class=True)
+
+# Tests definition
+def test_generated_equivalence():
+    print("[*] Comparing generated and interpreted validation...")
+    with tempfile.TemporaryDirectory() as directory:
+        assert_equivalent(Port, [None, 0, 1, 80, 65535, 65536, -5, True, 1.5, "80"], directory)
+        assert_equivalent(IPv4, ["192.168.0.1", "999.1.1.1", "", 7, b"10.0.0.1"], directory)
+        assert_equivalent(
+            PrimitiveData(data_type=bytes, value=None, maximum_length=4, regular_expression=r"^[A-Z]+$", data_class=True),
+            [b"ABCD", b"ABCDE", b"abc", "ABC", bytearray(b"AB")], directory
+        )
+        assert_equivalent(
+            PrimitiveData(data_type=float, value=None, minimum_length=2, maximum_size=10.5, possible_values=[1.25, 10.5, 1e20, 3], data_class=True),
+            [1.0, 1.25, 10.5, 1e20, 3, 3.0, None], directory
+        )
+        assert_equivalent(Profile, [
+            {"TRANSPORT": "INTERNET", "ENDPOINTS": [{"ADDRESS": "10.0.0.1", "PORT": 80, "WEIGHT": 0.5}]},
+            {"TRANSPORT": "INTERNET", "ENDPOINTS": [{"ADDRESS": "10.0.0.1", "PORT": 0}]},
+            {"TRANSPORT": "INTERNET", "ENDPOINTS": [{"PORT": 80, "WEIGHT": "HIGH"}]},
+            {"LINKS": [{"TYPE": "SERIAL", "BAUDS": 9600}, {"TYPE": "INTERNET", "ADDRESS": "10.0.0.2"}, "NONE"]},
+            {"LINKS": [{"TYPE": "SERIAL", "BAUDS": 1200}]},
+            {"LINKS": [{"TYPE": ["SERIAL"]}]},
+            {"LINKS": ["NONE"] * 4},
+            {"TRANSPORT": "MODEM"}, {(1, 2): 3}, {}, [], None,
+        ], directory)
+        assert_equivalent(
+            ComplexData(data_type=dict, value=None, possible_values=([str], [str, int]), data_class=True),
+            [{"USERNAME": "Specter", "AGE": 19}, {"AGE": 1.5}, {1: "A"}, {}], directory
+        )
+        assert_equivalent(
+            ComplexData(data_type=tuple, value=None, minimum_length=1, possible_values=["A", int, [1, 2]], data_class=True),
+            [("A",), ("A", 1, True), (), ("C",), ([1, 2],), ([1],), ["A"]], directory
+        )
+    print("[OK] Generated validation is equivalent.")
+
+def test_disk_cache():
+    print("[*] Validating the on-disk validator cache...")
+    with tempfile.TemporaryDirectory() as directory:
+        Profile.compile_source(cache_directory=directory)
+        files = os.listdir(directory)
+        assert len(files) == 1 and codegen.cache_key(Profile) in files[0]
+
+        # A new process only finds the file: the stored code is loaded, not generated
+        codegen.LOADED.clear()
+        generated = codegen.SourceGenerator.source
+        codegen.SourceGenerator.source = None
+        try:
+            validator = Profile.compile_source(cache_directory=directory)
+        finally:
+            codegen.SourceGenerator.source = generated
+        assert validator.is_valid({"TRANSPORT": "INTERNET"}) and not validator.is_valid({"TRANSPORT": "MODEM"})
+
+        # Corrupt files are regenerated; changed schemas use another key
+        with open(os.path.join(directory, files[0]), "wb") as file:
+            file.write(b"\x00corrupt")
+        codegen.LOADED.clear()
+        assert Profile.compile_source(cache_directory=directory).is_valid({"TRANSPORT": "BLUETOOTH"})
+        assert codegen.cache_key(Port) != codegen.cache_key(PrimitiveData(data_type=int, value=None, name="Port", maximum_size=10, data_class=True))
+    print("[OK] On-disk cache completed.")
+
+def test_untrusted_cache_files():
+    print("[*] Validating the permissions of the on-disk cache...")
+    with tempfile.TemporaryDirectory() as base:
+        directory = os.path.join(base, "validators")
+        Profile.compile_source(cache_directory=directory)
+        assert os.stat(directory).st_mode & 0o077 == 0
+        path = os.path.join(directory, os.listdir(directory)[0])
+
+        # Writable by other users: never executed, regenerated instead
+        with open(path, "wb") as file:
+            marshal.dump(compile("import builtins\nbuiltins.datavalue_untrusted = True\ndef build(S):\n    return lambda value: True", "<untrusted>", "exec"), file)
+        os.chmod(path, 0o666)
+        codegen.LOADED.clear()
+        validator = Profile.compile_source(cache_directory=directory)
+        assert not hasattr(builtins, "datavalue_untrusted") and not validator.is_valid({"TRANSPORT": "MODEM"})
+        assert os.stat(path).st_mode & 0o077 == 0
+    print("[OK] Untrusted cache files rejected.")
+
+def test_not_inlinable_content():
+    print("[*] Validating schemas with content without a source form...")
+    class Token(str):
+        pass
+
+    schema = ComplexData(data_type=list, value=[Token("A")], possible_values=[Token, Port])
+    validator = schema.compile_source(cache=False)
+    assert "S[0].is_valid(value)" in schema.to_source()
+    assert validator.is_valid([Token("A"), 80]) and not validator.is_valid(["A"]) and validator.is_valid(None)
+    print("[OK] Interpreted fallback completed.")
+
+if __name__ == "__main__":
+    test_generated_equivalence()
+    test_disk_cache()
+    test_untrusted_cache_files()
+    test_not_inlinable_content()
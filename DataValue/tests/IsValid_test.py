@@ -0,0 +1,55 @@
+# Library import
+from datavalue import ComplexData, PrimitiveData
+from datavalue import exceptions
+
+# Tests definition
+def test_is_valid_does_not_raise():
+    print("[*] Validating non-raising is_valid()...")
+    Port = PrimitiveData(data_type=int, value=None, minimum_size=1, maximum_size=65535, data_class=True)
+    Ports = ComplexData(data_type=list, value=None, maximum_length=3, possible_values=[Port], data_class=True)
+
+    assert Port.is_valid(80) is True
+    assert Port.is_valid(0) is False
+    assert Port.is_valid("80") is False
+    assert Ports.is_valid([80, 443]) is True
+    assert Ports.is_valid([80, 0]) is False
+    assert Ports.is_valid([1, 2, 3, 4]) is False
+    assert Ports.is_valid(7) is False # Unsized value
+    print("[OK] is_valid() returns booleans.")
+
+def test_lazy_messages():
+    print("[*] Validating lazily formatted error messages...")
+    Port = PrimitiveData(data_type=int, value=None, minimum_size=1, maximum_size=65535, data_class=True)
+
+    failure = Port._check(70000)
+    assert isinstance(failure, exceptions.ValidationFailure)
+    assert failure.exception_type is exceptions.SizeException
+    assert failure.message == "Numerical value above the maximum: 70000 > 65535"
+
+    try:
+        Port.validate("80")
+    except exceptions.DataTypeException as Error:
+        assert str(Error) == "Incorrect data type.\nExpected: int - Received: str"
+    else:
+        raise AssertionError("Invalid type accepted.")
+    print("[OK] Error messages preserved.")
+
+def test_union_branches():
+    print("[*] Validating union branches without exceptions...")
+    Text = ComplexData(data_type=dict, value=None, possible_values={"TYPE": ["TEXT"], "BODY": [str]}, data_class=True)
+    Image = ComplexData(data_type=dict, value=None, possible_values={"TYPE": ["IMAGE"], "DATA": [bytes]}, data_class=True)
+    Messages = ComplexData(data_type=list, value=None, possible_values=[Text, Image], data_class=True)
+
+    assert Messages.validate([{"TYPE": "TEXT", "BODY": "Hola"}, {"TYPE": "IMAGE", "DATA": b"\x89PNG"}])
+    try:
+        Messages.validate([{"TYPE": "VIDEO"}])
+    except ValueError as Error:
+        assert "on index: 0" in str(Error)
+    else:
+        raise AssertionError("Invalid union element accepted.")
+    print("[OK] Union branches validated.")
+
+if __name__ == "__main__":
+    test_is_valid_does_not_raise()
+    test_lazy_messages()
+    test_union_branches()
@@ -0,0 +1,129 @@
+# Library import
+import pickle
+from datavalue import ComplexData, PrimitiveData, SchemaRegistry
+
+# Schemas definition
+Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+Tags = ComplexData(data_type=list, value=None, name="Tags", possible_values=[str], data_class=True)
+Service = ComplexData(data_type=dict, value=None, name="Service", possible_values={"PORT": [Port], "TAGS": [Tags]}, data_class=True)
+Catalog = ComplexData(data_type=dict, value=None, name="Catalog", possible_values={str: [Service]}, minimum_length=1, data_class=True)
+
+def stored_document(services: dict, data_class: bool = False) -> dict:
+    document = Catalog.to_dict()
+    document["VALUE"] = services
+    document["DATA_CLASS"] = data_class
+    return document
+
+# Tests definition
+def test_deferred_sub_schemas():
+    print("[*] Validating deferred sub-schema construction...")
+    schema = ComplexData.from_dict(Catalog.to_dict(), lazy=True)
+    assert schema._pending_content is not None
+
+    # First use builds one level: nested schemas stay pending
+    service = schema.possible_values[str][0]
+    assert schema._pending_content is None
+    assert service._pending_content is not None
+    assert schema.validate({"WEB": {"PORT": 80, "TAGS": ["http"]}})
+    assert not schema.is_valid({"WEB": {"PORT": 0}})
+    assert schema.to_dict() == Catalog.to_dict()
+    print("[OK] Sub-schemas built on first use.")
+
+def test_value_validated_on_access():
+    print("[*] Validating per-entry validation of lazy values...")
+    document = stored_document({"WEB": {"PORT": 80, "TAGS": ["http"]}, "BROKEN": {"PORT": 0, "TAGS": []}})
+    schema = ComplexData.from_dict(document, lazy=True)
+    assert schema.value["WEB"] == {"PORT": 80, "TAGS": ["http"]}
+    assert schema.value.get("MISSING") is None
+    try:
+        schema.value["BROKEN"]
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid entry returned.")
+    try:
+        ComplexData.from_dict(document)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Eager load accepted an invalid value.")
+
+    # Reassigned entries are validated again on access
+    schema.value["BROKEN"] = {"PORT": 443, "TAGS": []}
+    assert schema.value.validate() and schema.validate()
+    schema.value["WEB"] = {"PORT": "80"}
+    try:
+        list(schema.value.items())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Reassigned invalid entry accepted.")
+
+    # Type and length are validated at load time
+    try:
+        ComplexData.from_dict(stored_document({}), lazy=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Minimum length not checked at load time.")
+    print("[OK] Lazy values validated on access.")
+
+def test_lazy_list_value():
+    print("[*] Validating lazy list values...")
+    document = Tags.to_dict()
+    document["VALUE"], document["DATA_CLASS"] = ["A", "B", 3], False
+    schema = ComplexData.from_dict(document, lazy=True)
+    assert schema.value[0] == "A" and schema.value[-2] == "B" and schema.value[:2] == ["A", "B"]
+    for invalid_read in (lambda: schema.value[2], lambda: list(schema.value), lambda: schema.value.validate()):
+        try:
+            invalid_read()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid element returned.")
+    del schema.value[2]
+    assert list(schema.value) == ["A", "B"] and schema.validate()
+    print("[OK] Lazy list values validated on access.")
+
+def test_registry_and_pickle():
+    print("[*] Validating lazy schemas with a registry and pickling...")
+    registry = SchemaRegistry()
+    schema = ComplexData.from_dict(Catalog.to_dict(references=True), registry=registry, lazy=True)
+    assert schema.frozen
+    assert schema.validate({"WEB": {"PORT": 80}})
+    assert schema.possible_values[str][0].frozen
+    try:
+        schema.name = "Other"
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Frozen lazy schema modified.")
+
+    restored = pickle.loads(pickle.dumps(ComplexData.from_dict(Catalog.to_dict(), lazy=True)))
+    assert restored.is_valid({"WEB": {"PORT": 80}}) and not restored.is_valid({"WEB": {"PORT": 0}})
+
+    # Lazy values: pickled without validating the pending entries (the schema and the value reference each other)
+    document = stored_document({"WEB": {"PORT": 80, "TAGS": ["http"]}, "BROKEN": {"PORT": 0, "TAGS": []}})
+    schema = ComplexData.from_dict(document, lazy=True)
+    assert schema.value["WEB"]["PORT"] == 80
+    for value in (schema.value, pickle.loads(pickle.dumps(schema)).value, pickle.loads(pickle.dumps(schema.value))):
+        assert type(value).__name__ == "LazyDict" and value.validated == {"WEB"}
+        assert value["WEB"] == {"PORT": 80, "TAGS": ["http"]} and value.schema.is_valid({"WEB": {"PORT": 80}})
+        try:
+            value["BROKEN"]
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid entry returned after pickling.")
+
+    document = Tags.to_dict()
+    document["VALUE"], document["DATA_CLASS"] = ["A", 3], False
+    tags = pickle.loads(pickle.dumps(ComplexData.from_dict(document, lazy=True)))
+    assert tags.value[0] == "A" and not tags.value.schema.is_valid(["A", 3])
+    print("[OK] Registry and pickling completed.")
+
+if __name__ == "__main__":
+    test_deferred_sub_schemas()
+    test_value_validated_on_access()
+    test_lazy_list_value()
+    test_registry_and_pickle()
@@ -0,0 +1,75 @@
+# Library import
+import threading
+from datavalue import ComplexData, PrimitiveData
+from datavalue.classes import parallel
+
+# Schemas definition
+Phone = PrimitiveData(data_type=str, value=None, minimum_length=7, maximum_length=15, regular_expression=r"^\+[1-9]\d{6,14}$", data_class=True)
+Phones = ComplexData(data_type=list, value=None, possible_values=[Phone], data_class=True)
+Directory = ComplexData(data_type=dict, value=None, possible_values=([str], [Phone]), data_class=True)
+
+# Tests definition
+def test_parallel_equivalence():
+    print("[*] Validating collections in parallel chunks...")
+    phones = [f"+52{number:010d}" for number in range(5000)]
+    for executor in ("thread", "process"):
+        assert Phones.validate_parallel(phones, workers=2, chunk_size=500, executor=executor)
+
+        invalid = list(phones)
+        invalid[1234] = "1234"
+        invalid[4321] = "4321"
+        try:
+            Phones.validate_parallel(invalid, workers=2, chunk_size=500, executor=executor)
+        except ValueError as Error:
+            # The first failing element is reported, as validate() does
+            assert "on index: 1234" in str(Error), str(Error)
+        else:
+            raise AssertionError("Invalid element accepted.")
+    print("[OK] Parallel collection validation is deterministic.")
+
+def test_parallel_dictionary():
+    print("[*] Validating dictionaries in parallel chunks...")
+    directory = {f"USER_{number}": f"+52{number:010d}" for number in range(3000)}
+    assert Directory.validate_parallel(directory, workers=2, chunk_size=250, executor="thread")
+
+    directory["USER_2000"] = "invalid"
+    try:
+        Directory.validate_parallel(directory, workers=2, chunk_size=250, executor="thread")
+    except ValueError as Error:
+        assert "USER_2000" in str(Error)
+    else:
+        raise AssertionError("Invalid value accepted.")
+    print("[OK] Parallel dictionary validation completed.")
+
+def test_bounded_submission():
+    print("[*] Validating the chunks in flight...")
+    produced, completed, maximum_pending = [0], [0], [0]
+    lock = threading.Lock()
+    chunks, check_chunk = parallel._chunks, parallel._check_chunk
+
+    def counted_chunks(data, chunk_size):
+        for chunk in chunks(data, chunk_size):
+            with lock:
+                produced[0] += 1
+                maximum_pending[0] = max(maximum_pending[0], produced[0] - completed[0])
+            yield chunk
+
+    def counted_check(*arguments):
+        try:
+            return check_chunk(*arguments)
+        finally:
+            with lock:
+                completed[0] += 1
+
+    parallel._chunks, parallel._check_chunk = counted_chunks, counted_check
+    try:
+        assert Phones.validate_parallel([f"+52{number:010d}" for number in range(5000)], workers=2, chunk_size=100, executor="thread")
+    finally:
+        parallel._chunks, parallel._check_chunk = chunks, check_chunk
+    assert produced[0] == 50 and maximum_pending[0] <= 2 * parallel.PENDING_CHUNKS_PER_WORKER
+    print("[OK] Chunks in flight bounded.")
+
+if __name__ == "__main__":
+    test_parallel_equivalence()
+    test_parallel_dictionary()
+    test_bounded_submission()
@@ -0,0 +1,49 @@
+# Library import
+from datavalue import ComplexData, PrimitiveData
+from datavalue.classes import profiling
+
+# Schemas definition
+Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+Code = PrimitiveData(data_type=str, value=None, name="Code", maximum_length=4, regular_expression=r"^[A-Z]+$", data_class=True)
+Field = ComplexData(data_type=list, value=None, name="Field", possible_values=[Port, Code], data_class=True)
+
+# Tests definition
+def test_counters():
+    print("[*] Validating profiling counters...")
+    profile = Field.enable_profiling()
+    try:
+        for value in ([80, "ABC"], [0], ["abc"], ["ABCDE"], [1.5], "80"):
+            Field.is_valid(value)
+
+        snapshot = Field.profile_snapshot()
+        assert snapshot["calls"] == 6 and snapshot["failures"] == 5
+        assert snapshot["failures_by_rule"]["type"] == 1 and snapshot["failures_by_rule"]["possible_values"] == 4
+        assert snapshot["branches"]["Code"] == {"tries": 5, "hits": 1, "hit_rate": 0.2}
+        assert snapshot["branches"]["Port"]["tries"] == 6 and snapshot["branches"]["Port"]["hits"] == 1
+        assert snapshot["total_time"] >= snapshot["own_time"] > 0
+
+        rules = Code.profile_snapshot()["failures_by_rule"]
+        assert (rules["regex"], rules["length"], rules["type"]) == (1, 1, 2)
+        assert Port.profile_snapshot()["failures_by_rule"]["size"] == 1
+        assert set(profiling.snapshot()) == {"Field", "Port", "Code"}
+
+        profile.reset()
+        assert Field.profile_snapshot()["calls"] == 0
+    finally:
+        Field.disable_profiling()
+    assert Field.profile_snapshot() is None and Port.profile_snapshot() is None
+    print("[OK] Profiling counters completed.")
+
+def test_disabled_without_cost():
+    print("[*] Validating the non-instrumented methods when disabled...")
+    originals = (PrimitiveData._check, PrimitiveData._is_match, ComplexData._check, ComplexData._is_match)
+    Port.enable_profiling()
+    assert PrimitiveData._check is not originals[0]
+    assert Field.is_valid([80]) and Field.profile_snapshot() is None # Not profiled: not recorded
+    Port.disable_profiling()
+    assert (PrimitiveData._check, PrimitiveData._is_match, ComplexData._check, ComplexData._is_match) == originals
+    print("[OK] Original methods restored.")
+
+if __name__ == "__main__":
+    test_counters()
+    test_disabled_without_cost()
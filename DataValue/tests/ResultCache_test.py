@@ -0,0 +1,87 @@
+# Library import
+from datavalue import ComplexData, PrimitiveData, exceptions
+
+# Tests definition
+def test_cached_results():
+    print("[*] Validating memoized results...")
+    country = PrimitiveData(data_type=str, value=None, name="Country", regular_expression=r"^[A-Z]{2}$", possible_values=["MX", "US", "ES"], data_class=True)
+    cache = country.enable_result_cache()
+    for _ in range(3):
+        assert country.validate("MX")
+        assert not country.is_valid("FR")
+        try:
+            country.validate("FR")
+        except exceptions.PossibleValueException:
+            pass
+        else:
+            raise AssertionError("A cached failure was accepted.")
+    assert cache.stats()["hits"] == 7 and cache.stats()["misses"] == 2
+
+    # Mutable values bypass the cache
+    pairs = ComplexData(data_type=list, value=None, possible_values=[int], data_class=True)
+    pairs_cache = pairs.enable_result_cache()
+    assert pairs.validate([1, 2]) and pairs.validate([1, 2])
+    assert pairs_cache.stats()["bypasses"] == 2 and len(pairs_cache) == 0
+    print("[OK] Repeated values resolved from the cache.")
+
+def test_type_tagged_keys():
+    print("[*] Validating type-tagged keys...")
+    flag = PrimitiveData(data_type=int, value=None, possible_values=[1], data_class=True)
+    flag.enable_result_cache()
+    assert flag.is_valid(1)
+    assert not flag.is_valid(1.0) # Equal (1 == 1.0), but rejected by data type
+
+    pairs = ComplexData(data_type=tuple, value=None, possible_values=[int], data_class=True)
+    pairs.enable_result_cache()
+    assert pairs.is_valid((1, 2))
+    assert not pairs.is_valid((1.0, 2))
+    print("[OK] Equal values of distinct types never share a result.")
+
+def test_invalidation_and_bounds():
+    print("[*] Validating invalidation and eviction...")
+    code = PrimitiveData(data_type=str, value=None, maximum_length=3, data_class=True)
+    cache = code.enable_result_cache(maximum_size=2)
+    assert code.is_valid("ABC")
+    code.maximum_length = 2
+    assert not code.is_valid("ABC")
+
+    for value in ("A", "B", "C"):
+        code.is_valid(value)
+    assert len(cache) == 2 and cache.stats()["evictions"] >= 1
+
+    # Large values are never stored (size-aware bound)
+    code.is_valid("X" * 4096)
+    assert "X" * 4096 not in [key[1] for key in cache._results]
+    code.disable_result_cache()
+    assert code.result_cache is None
+    print("[OK] Results invalidated on schema changes and bounded.")
+
+def test_sub_schema_changes():
+    print("[*] Validating parents of sub-schemas...")
+    level = PrimitiveData(data_type=int, value=None, maximum_size=10, data_class=True)
+    levels = ComplexData(data_type=tuple, value=None, possible_values=[level], data_class=True)
+    cache = levels.enable_result_cache()
+    assert level.frozen and not levels.frozen # The results depend on the sub-schemas: frozen on enabling
+
+    assert levels.is_valid((5,)) and levels.is_valid((5,))
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1 and cache.stats()["bypasses"] == 0
+    try:
+        level.maximum_size = 3
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("A sub-schema of a cached schema was modified.")
+
+    # Replaced sub-schemas are frozen too (and the stored results dropped)
+    strict = PrimitiveData(data_type=int, value=None, maximum_size=3, data_class=True)
+    levels.possible_values = [strict]
+    assert strict.frozen and len(cache) == 0
+    assert not levels.is_valid((5,)) and not levels.is_valid((5,))
+    assert cache.stats()["hits"] == 2 and cache.stats()["bypasses"] == 0
+    print("[OK] Parent results never depend on mutable sub-schemas.")
+
+if __name__ == "__main__":
+    test_cached_results()
+    test_type_tagged_keys()
+    test_invalidation_and_bounds()
+    test_sub_schema_changes()
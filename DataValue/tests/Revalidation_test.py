@@ -0,0 +1,135 @@
+# Library import
+import copy
+import pickle
+import random
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+def build_settings() -> ComplexData:
+    return ComplexData(data_type=dict, value={f"KEY_{number}": number for number in range(1000)}, maximum_length=1001, possible_values=(
+        [str], [PrimitiveData(data_type=int, value=None, minimum_size=0, data_class=True)]
+    ))
+
+def build_ports() -> ComplexData:
+    Port = PrimitiveData(data_type=int, value=None, minimum_size=1, maximum_size=65535, data_class=True)
+    return ComplexData(data_type=list, value=list(range(1, 1001)), maximum_length=1002, possible_values=[Port])
+
+# Tests definition
+def test_dirty_tracking():
+    print("[*] Validating dirty index tracking...")
+    ports = build_ports()
+    value = ports.track()
+    assert value.all_dirty
+    assert ports.revalidate() and not value.all_dirty and not value.dirty
+
+    value[5] = 80; value[-1] = 443
+    value.insert(0, 22)
+    assert value.dirty == {0, 6, 1000}
+    del value[3]
+    value.pop(0)
+    assert value.dirty == {4, 998}
+    value[10:12] = [1, 2, 3]
+    assert value.dirty == {4, 10, 11, 12, 999}
+    value.reverse()
+    assert value.dirty == {1000 - 1 - index for index in (4, 10, 11, 12, 999)}
+    print("[OK] Mutated indices tracked across shifts.")
+
+def test_incremental_revalidation():
+    print("[*] Validating incremental revalidation...")
+    ports = build_ports()
+    value = ports.track()
+    ports.revalidate()
+
+    value[500] = 0
+    try:
+        ports.revalidate()
+    except ValueError as Error:
+        assert "index: 500" in str(Error)
+    else:
+        raise AssertionError("An invalid element was accepted.")
+    assert 500 in value.dirty # Stays dirty until fixed
+    value[500] = 8080
+    assert ports.revalidate()
+
+    value.extend([1, 2, 3])
+    try:
+        ports.revalidate()
+    except ValueError as Error:
+        assert "Maximum length" in str(Error)
+    else:
+        raise AssertionError("The maximum length was not enforced.")
+
+    settings = build_settings()
+    items = settings.track()
+    settings.revalidate()
+    items["KEY_7"] = -1
+    try:
+        settings.revalidate()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("An invalid value was accepted.")
+    items.update(KEY_7=7, NEW=1)
+    del items["KEY_1"]
+    assert items.dirty == {"KEY_7", "NEW"}
+    assert settings.revalidate()
+    print("[OK] Only mutated elements revalidated.")
+
+def test_equivalence():
+    print("[*] Comparing revalidate() and validate() on random edits...")
+    randomizer = random.Random(11)
+    ports = build_ports()
+    value = ports.track()
+    for _ in range(300):
+        operation = randomizer.choice(["set", "insert", "delete", "append", "slice", "sort"])
+        number = randomizer.choice([0, 80, 443, 70000, 22])
+        if operation == "set" and value:
+            value[randomizer.randrange(len(value))] = number
+        elif operation == "insert":
+            value.insert(randomizer.randrange(-5, len(value) + 5), number)
+        elif operation == "delete" and value:
+            del value[randomizer.randrange(len(value))]
+        elif operation == "append":
+            value.append(number)
+        elif operation == "slice":
+            start = randomizer.randrange(len(value) + 1)
+            value[start:start + randomizer.randrange(3)] = [number] * randomizer.randrange(3)
+        elif operation == "sort":
+            value.sort()
+
+        expected = ports.is_valid()
+        try:
+            result = ports.revalidate()
+        except ValueError:
+            result = False
+        assert result == expected, f"Mismatch after {operation}"
+    print("[OK] revalidate() matches validate().")
+
+def test_pickle_tracked_values():
+    print("[*] Validating pickling of tracked values...")
+    for schema in (build_ports(), build_settings()):
+        value = schema.track()
+        schema.revalidate()
+        if isinstance(value, list):
+            value[3] = 0
+        else:
+            value["KEY_3"] = -1
+
+        # Schemas with tracked values are transferred to worker processes (validate_parallel)
+        for restored in (pickle.loads(pickle.dumps(schema)), copy.deepcopy(schema)):
+            assert type(restored.value) is type(value) and restored.value == value
+            assert restored.value.dirty == value.dirty and not restored.value.all_dirty
+            assert not restored.is_valid() and not restored.value.all_dirty
+            try:
+                restored.revalidate()
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Restored dirty element not revalidated.")
+    print("[OK] Tracked values pickled.")
+
+if __name__ == "__main__":
+    test_dirty_tracking()
+    test_incremental_revalidation()
+    test_equivalence()
+    test_pickle_tracked_values()
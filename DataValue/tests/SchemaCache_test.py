@@ -0,0 +1,74 @@
+# Library import
+import json
+from datavalue import ComplexData, PrimitiveData, SchemaCache
+
+# Schemas definition
+Port = PrimitiveData(data_type=int, value=None, name="Port", minimum_size=1, maximum_size=65535, data_class=True)
+Endpoint = ComplexData(data_type=dict, value=None, name="Endpoint", possible_values={"HOST": [str], "PORT": [Port]}, data_class=True)
+
+# Tests definition
+def test_cache_hits():
+    print("[*] Validating schema cache hits...")
+    cache = SchemaCache(maximum_size=4)
+    text = Endpoint.to_json()
+    first = ComplexData.from_json(text, cache=cache)
+    second = ComplexData.from_json(text, cache=cache)
+    assert first is second
+    assert first.frozen and first.possible_values["PORT"][0].frozen
+    assert first.validate({"HOST": "localhost", "PORT": 8080})
+
+    # Dictionaries are keyed by their canonical content (a new dict object)
+    assert ComplexData.from_dict(Endpoint.to_dict(), cache=cache) is ComplexData.from_dict(Endpoint.to_dict(), cache=cache)
+    assert PrimitiveData.from_json(Port.to_json(), cache=cache) is not PrimitiveData.from_json(Port.to_json())
+    assert cache.stats() == {"hits": 2, "misses": 3, "evictions": 0, "size": 3, "maximum_size": 4}
+
+    try:
+        first.maximum_length = 1
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("A cached schema was modified.")
+    print("[OK] Cached schemas shared and frozen.")
+
+def test_cache_keys():
+    print("[*] Validating schema cache keys...")
+    cache = SchemaCache()
+    data = {"DATA_TYPE": "list", "VALUE": None, "POSSIBLE_VALUES": [1, 2], "DATA_CLASS": True}
+    ints = ComplexData.from_dict(data, cache=cache)
+    floats = ComplexData.from_dict({**data, "POSSIBLE_VALUES": [1.0, True]}, cache=cache)
+    assert ints is not floats
+
+    # Non JSON content (coerced by json.dumps) is never cached
+    mapping = {"DATA_TYPE": "dict", "VALUE": None, "POSSIBLE_VALUES": {1: ["A"]}, "DATA_CLASS": True}
+    assert ComplexData.from_dict(mapping, cache=cache) is not ComplexData.from_dict(mapping, cache=cache)
+    assert ComplexData.from_dict(mapping, cache=cache).validate({1: "A"})
+    assert len(cache) == 2
+
+    # Hits skip the coercion check (json.loads only runs on misses)
+    calls, loads = [], json.loads
+    json.loads = lambda *arguments, **keywords: calls.append(arguments) or loads(*arguments, **keywords)
+    try:
+        assert ComplexData.from_dict(data, cache=cache) is ints and not calls
+    finally:
+        json.loads = loads
+    print("[OK] Distinct contents never share a cache entry.")
+
+def test_cache_eviction():
+    print("[*] Validating LRU eviction...")
+    cache = SchemaCache(maximum_size=2)
+    texts = [PrimitiveData(data_type=int, value=None, maximum_size=size, data_class=True).to_json() for size in range(3)]
+    schemas = [PrimitiveData.from_json(text, cache=cache) for text in texts[:2]]
+    assert PrimitiveData.from_json(texts[0], cache=cache) is schemas[0] # texts[0] becomes the most recent
+    PrimitiveData.from_json(texts[2], cache=cache)
+    assert PrimitiveData.from_json(texts[0], cache=cache) is schemas[0]
+    assert PrimitiveData.from_json(texts[1], cache=cache) is not schemas[1]
+    assert cache.stats()["evictions"] == 2
+
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()["hits"] == 0
+    print("[OK] Least recently used schemas evicted.")
+
+if __name__ == "__main__":
+    test_cache_hits()
+    test_cache_keys()
+    test_cache_eviction()
@@ -0,0 +1,88 @@
+# Library import
+import gc
+import json
+from datavalue import ComplexData, PrimitiveData, SchemaRegistry
+
+# Schemas definition
+Phone = PrimitiveData(data_type=str, value=None, name="Phone", regular_expression=r"^\+?[0-9]{7,15}$", data_class=True)
+Label = PrimitiveData(data_type=str, value=None, name="Label", possible_values=["HOME", "WORK", Phone], data_class=True)
+Contacts = ComplexData(data_type=dict, value=None, name="Contacts", possible_values={
+    **{f"PHONE_{number}": [Phone, Label] for number in range(50)},
+    ComplexData(data_type=tuple, value=None, possible_values=[Phone], data_class=True): [Phone]
+}, data_class=True)
+
+# Tests definition
+def test_references():
+    print("[*] Validating $ref serialization...")
+    data = Contacts.to_dict(references=True)
+    assert set(data["DEFINITIONS"]) == {"Phone", "Label"}
+    assert data["POSSIBLE_VALUES"]["PHONE_0"] == [{"$ref": "Phone"}, {"$ref": "Label"}]
+    assert data["DEFINITIONS"]["Label"]["POSSIBLE_VALUES"][2] == {"$ref": "Phone"}
+    assert len(json.dumps(data)) < len(json.dumps(Contacts.to_dict())) / 5
+
+    # Every reference resolves to the same instance
+    restored = ComplexData.from_json(Contacts.to_json(references=True))
+    phones = {id(restored.possible_values[f"PHONE_{number}"][0]) for number in range(50)}
+    assert len(phones) == 1
+    assert restored.to_dict() == Contacts.to_dict()
+    assert restored.validate({"PHONE_3": "+5215512345678", "PHONE_4": "WORK"})
+    assert not restored.frozen
+    print("[OK] References emitted once and shared.")
+
+def test_registry_interning():
+    print("[*] Validating structural interning...")
+    registry = SchemaRegistry()
+    inline = ComplexData.from_json(Contacts.to_json(), registry=registry)
+    referenced = ComplexData.from_json(Contacts.to_json(references=True), registry=registry)
+    assert inline is referenced
+    assert len(registry) == 4 # Phone, Label, tuple key, Contacts
+
+    phones = {id(inline.possible_values[f"PHONE_{number}"][0]) for number in range(50)}
+    assert len(phones) == 1
+    assert inline.possible_values["PHONE_0"][1].possible_values[2] is inline.possible_values["PHONE_0"][0]
+    assert registry.intern(Phone) is inline.possible_values["PHONE_0"][0]
+
+    # Different constraints are never shared
+    other = PrimitiveData.from_dict({**Phone.to_dict(), "MAXIMUM_LENGTH": 10}, registry=registry)
+    assert other is not registry.intern(Phone)
+
+    try:
+        inline.possible_values["PHONE_0"][0].regular_expression = ".*"
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("A shared schema was modified.")
+    print("[OK] Identical sub-schemas share one frozen instance.")
+
+def test_released_schemas():
+    print("[*] Validating that released schemas leave the registry...")
+    registry = SchemaRegistry()
+    kept = ComplexData.from_json(Contacts.to_json(), registry=registry)
+    entries = (len(registry), len(registry._keys))
+    for number in range(200):
+        schema = PrimitiveData.from_dict({**Phone.to_dict(), "NAME": f"Phone_{number}", "POSSIBLE_VALUES": ["HOME", [number]]}, registry=registry)
+        assert schema in registry
+    del schema
+    gc.collect()
+    assert (len(registry), len(registry._keys)) == entries
+    assert registry.intern(Phone) is kept.possible_values["PHONE_0"][0]
+    print("[OK] Released schemas and their keys discarded.")
+
+def test_invalid_references():
+    print("[*] Validating unresolved references...")
+    for definitions in ({}, {"Loop": {"__type__": "PrimitiveData", "DATA_TYPE": "str", "VALUE": None, "POSSIBLE_VALUES": [{"$ref": "Loop"}], "DATA_CLASS": True}}):
+        data = {"DATA_TYPE": "list", "VALUE": None, "POSSIBLE_VALUES": [{"$ref": "Loop"}], "DATA_CLASS": True, "DEFINITIONS": definitions}
+        for registry in (None, SchemaRegistry()):
+            try:
+                ComplexData.from_dict(data, registry=registry)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("An unresolved reference was accepted.")
+    print("[OK] Unknown and circular references rejected.")
+
+if __name__ == "__main__":
+    test_references()
+    test_registry_interning()
+    test_released_schemas()
+    test_invalid_references()
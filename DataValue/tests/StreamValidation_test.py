@@ -0,0 +1,67 @@
+# Library import
+import io
+import json
+from datavalue import ComplexData, PrimitiveData
+
+# Schemas definition
+Reading = ComplexData(data_type=dict, value=None, name="Reading", possible_values={
+    "SENSOR": [PrimitiveData(data_type=str, value=None, regular_expression=r"^S[0-9]+$", data_class=True)],
+    "VALUE": [int, float],
+    "LABEL": [str]
+}, data_class=True)
+Readings = ComplexData(data_type=list, value=None, maximum_length=1000, possible_values=[Reading, None], data_class=True)
+
+# Helpers definition
+def build_readings(size: int) -> list:
+    return [{"SENSOR": f"S{number}", "VALUE": number * 1.5, "LABEL": "ñandú ✓" * (number % 3)} if number % 7 else None for number in range(size)]
+
+def stream_error(schema, content, **parameters) -> Exception:
+    try:
+        schema.validate_stream(content, **parameters)
+    except ValueError as Error:
+        return Error
+    raise AssertionError("An invalid stream was accepted.")
+
+# Tests definition
+def test_stream_equivalence():
+    print("[*] Validating streamed documents...")
+    readings = build_readings(500)
+    text = json.dumps(readings, ensure_ascii=False, indent=1)
+    for chunk_size in (1, 7, 65536):
+        assert Readings.validate_stream(io.BytesIO(text.encode("UTF-8")), chunk_size=chunk_size)
+        assert Readings.validate_stream(io.StringIO(text), chunk_size=chunk_size)
+
+    lines = "\n".join(json.dumps(reading) for reading in readings) + "\n\n"
+    assert Readings.validate_stream(io.BytesIO(lines.encode("UTF-8")))
+    assert Readings.validate_stream(io.BytesIO(b"[]"))
+    numbers = ComplexData(data_type=list, value=None, possible_values=[12345678901234567890, 1.5e300], data_class=True)
+    assert numbers.validate_stream(io.BytesIO(b"[12345678901234567890, 1.5e300]"), chunk_size=3)
+    print("[OK] Streamed validation matches validate(json.load()).")
+
+def test_stream_failures():
+    print("[*] Validating failure byte offsets...")
+    readings = build_readings(50)
+    readings[30] = {"SENSOR": "X30", "VALUE": 1}
+    data = json.dumps(readings, ensure_ascii=False).encode("UTF-8")
+    Error = stream_error(Readings, io.BytesIO(data), chunk_size=16)
+    assert Error.element_index == 30
+    assert data[Error.byte_offset:].startswith(b'{"SENSOR": "X30"')
+
+    lines = b"\n".join(json.dumps(reading).encode() for reading in readings)
+    Error = stream_error(Readings, io.BytesIO(lines), format="jsonl")
+    assert Error.element_index == 30 and lines[Error.byte_offset:].startswith(b'{"SENSOR": "X30"')
+
+    # Length is enforced while reading
+    limited = ComplexData(data_type=list, value=None, maximum_length=3, minimum_length=2, data_class=True)
+    Error = stream_error(limited, io.BytesIO(b"[1, 2, 3, 4, 5"))
+    assert Error.element_index == 3 and Error.byte_offset == 10
+    assert stream_error(limited, io.BytesIO(b"[1]")).byte_offset == 3
+
+    # Malformed JSON
+    for invalid in (b"[1, 2", b"[1, 2,]", b"[1 2]", b"[1] 2", b'[{"A": "x}]', b"{}"):
+        assert isinstance(stream_error(ComplexData(data_type=list, value=None, data_class=True), io.BytesIO(invalid), format="array").byte_offset, int)
+    print("[OK] First failure reported with its byte offset.")
+
+if __name__ == "__main__":
+    test_stream_equivalence()
+    test_stream_failures()
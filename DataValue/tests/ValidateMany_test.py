@@ -0,0 +1,62 @@
+# Library import
+import array
+from datavalue import PrimitiveData
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Helpers definition
+def expected_mask(schema, values) -> list:
+    return [schema.is_valid(value) for value in values]
+
+# Tests definition
+def test_validate_many_python():
+    print("[*] Validating batches of Python values...")
+    Phone = PrimitiveData(data_type=str, value=None, minimum_length=7, maximum_length=15, regular_expression=r"^\+[1-9]\d{6,14}$", data_class=True)
+    values = ["+34600111222", "600111222", "+1", 34600111222, "+79273463798"]
+
+    mask, invalid = Phone.validate_many(values)
+    assert mask == [True, False, False, False, True]
+    assert invalid == [1, 2, 3]
+    print("[OK] Python batch validated.")
+
+def test_validate_many_array():
+    print("[*] Validating array.array batches...")
+    Port = PrimitiveData(data_type=int, value=None, minimum_size=1, maximum_size=65535, data_class=True)
+    values = array.array("q", [0, 80, 443, 65536, -1])
+    mask, invalid = Port.validate_many(values)
+    assert list(mask) == [False, True, True, False, False]
+    assert list(invalid) == [0, 3, 4]
+    print("[OK] array.array batch validated.")
+
+def test_validate_many_vectorized():
+    if numpy is None:
+        print("[!] numpy is not installed: vectorized validation skipped.")
+        return
+
+    print("[*] Comparing vectorized and element-wise validation...")
+    integers = numpy.array([0, 7, 42, 99, 100, 65535, -42, 2 ** 62, -2 ** 63], dtype=numpy.int64)
+    floats = numpy.array([0.5, 1.25, 10.0, 123.456, -3.5, float("nan")])
+    booleans = numpy.array([True, False])
+    Amount = PrimitiveData(data_type=int, value=None, minimum_length=2, maximum_length=5, minimum_size=-100, maximum_size=70000, data_class=True)
+    Choice = PrimitiveData(data_type=int, value=None, possible_values=(7, 42.0, True, "7", Amount), data_class=True)
+    Ratio = PrimitiveData(data_type=float, value=None, maximum_length=3, minimum_size=0.0, data_class=True)
+    Flag = PrimitiveData(data_type=int, value=None, possible_values=(int,), data_class=True)
+
+    cases = [
+        (Amount, integers), (Choice, integers), (Ratio, floats), (Ratio, integers),
+        (Flag, booleans), (Amount, integers.astype(numpy.uint16)), (Choice, booleans),
+    ]
+    for schema, values in cases:
+        mask, invalid = schema.validate_many(values)
+        assert isinstance(mask, numpy.ndarray)
+        assert mask.tolist() == expected_mask(schema, values.tolist()), f"Mismatch on {values.dtype}"
+        assert invalid.tolist() == [position for position, valid in enumerate(mask) if not valid]
+    print("[OK] Vectorized validation is equivalent.")
+
+if __name__ == "__main__":
+    test_validate_many_python()
+    test_validate_many_array()
+    test_validate_many_vectorized()
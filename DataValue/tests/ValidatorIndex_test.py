@@ -0,0 +1,93 @@
+# Library import
+import pickle
+from datavalue import ComplexData, PrimitiveData
+
+# Tests definition
+def test_wide_enumeration():
+    print("[*] Validating wide enumerations through the literal index...")
+    codes = [f"CODE_{number}" for number in range(5000)]
+    enumeration = ComplexData(data_type=list, value=None, possible_values=codes + [int], data_class=True)
+
+    assert enumeration.validate(["CODE_0", "CODE_4999", 7, True])
+    try:
+        enumeration.validate(["CODE_0", "CODE_5000"])
+    except ValueError as Error:
+        print(f"[OK] Rejected: {Error}")
+    else:
+        raise AssertionError("Unknown literal accepted.")
+
+    status = PrimitiveData(data_type=str, value="CODE_10", possible_values=codes)
+    assert status.validate("CODE_4321")
+    print("[OK] Wide enumerations validated.")
+
+def test_unhashable_literals():
+    print("[*] Validating unhashable literals...")
+    pairs = ComplexData(data_type=list, value=[[1, 2], "A"], possible_values=[[1, 2], "A"])
+    assert pairs.validate([[1, 2], [1, 2], "A"])
+    assert not pairs.compile().is_valid([[2, 1]])
+    print("[OK] Unhashable literals validated.")
+
+def test_mapping_rule_priority():
+    print("[*] Validating schema mapping key dispatch...")
+    Port = PrimitiveData(data_type=int, value=None, minimum_size=1, maximum_size=65535, data_class=True)
+    configuration = ComplexData(data_type=dict, value=None, possible_values={
+        **{f"KEY_{number}": [str] for number in range(100)},
+        "PORT": [Port],
+    }, data_class=True)
+
+    assert configuration.validate({f"KEY_{number}": "value" for number in range(100)})
+    assert configuration.validate({"PORT": 80, "KEY_3": "A"})
+    for invalid in ({"PORT": 0}, {"UNKNOWN": "A"}, {"KEY_1": 1}):
+        assert not configuration.compile().is_valid(invalid)
+        try:
+            configuration.validate(invalid)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Invalid mapping accepted: {invalid}")
+
+    # The first rule defined takes precedence over later exact keys
+    prioritized = ComplexData(data_type=dict, value=None, possible_values={
+        str: [int],
+        "NAME": [str],
+    }, data_class=True)
+    assert prioritized.validate({"NAME": 1})
+    assert not prioritized.compile().is_valid({"NAME": "Specter"})
+    print("[OK] Schema mapping dispatch validated.")
+
+def test_possible_values_reassignment():
+    print("[*] Validating index rebuild on possible_values assignment...")
+    transport = PrimitiveData(data_type=str, value=None, possible_values=("TCP", "UDP"), data_class=True)
+    transport.possible_values = ("SCTP",)
+    assert transport.validate("SCTP")
+    assert not transport.compile().is_valid("TCP")
+    print("[OK] Index rebuilt.")
+
+def test_possible_values_immutable():
+    print("[*] Validating in-place edits of possible_values...")
+    transport = PrimitiveData(data_type=str, value=None, possible_values=["TCP", "UDP"], data_class=True)
+    mapping = ComplexData(data_type=dict, value=None, possible_values={"PORT": [int]}, data_class=True)
+    pairs = ComplexData(data_type=dict, value=None, possible_values=([str], [int]), data_class=True)
+
+    # The indexes are built once: in-place edits are rejected instead of silently ignored
+    for edit in (lambda: transport.possible_values.append("SCTP"), lambda: mapping.possible_values.update({"HOST": [str]}),
+                 lambda: mapping.possible_values["PORT"].append(str), lambda: pairs.possible_values[1].append(str)):
+        try:
+            edit()
+        except (AttributeError, TypeError):
+            pass
+        else:
+            raise AssertionError("possible_values modified in place.")
+
+    mapping.possible_values = {**mapping.possible_values, "HOST": [str]}
+    assert mapping.validate({"PORT": 80, "HOST": "localhost"})
+    restored = pickle.loads(pickle.dumps(mapping))
+    assert restored.possible_values == mapping.possible_values and restored.is_valid({"HOST": "localhost"})
+    print("[OK] In-place edits rejected.")
+
+if __name__ == "__main__":
+    test_wide_enumeration()
+    test_unhashable_literals()
+    test_mapping_rule_priority()
+    test_possible_values_reassignment()
+    test_possible_values_immutable()